@@ -0,0 +1,127 @@
+"""
+Compares StripedCounter with an Atomic[int] counter, incremented by several threads at once.
+
+Run it from the project root - for example:
+
+    python -m benchmarks.counters --output counters.json
+
+For every thread count, it reports the elapsed time and the increments per second
+of both counters as a JSON document.
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from threading import Barrier, Thread
+from time import perf_counter
+from typing import Any, Optional, Sequence
+
+from info.gianlucacosta.eos.core.functional import Consumer
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+from info.gianlucacosta.eos.core.threading.striped import StripedCounter
+
+
+def measure_increments(
+    thread_count: int, increments_per_thread: int, increment: Consumer[int]
+) -> float:
+    start_barrier = Barrier(thread_count + 1)
+
+    def run() -> None:
+        start_barrier.wait()
+
+        for _ in range(increments_per_thread):
+            increment(1)
+
+    threads = [Thread(target=run) for _ in range(thread_count)]
+
+    for thread in threads:
+        thread.start()
+
+    start_barrier.wait()
+    start_time = perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return perf_counter() - start_time
+
+
+def run_scenario(
+    counter_kind: str, thread_count: int, increments_per_thread: int
+) -> dict[str, Any]:
+    expected_total = thread_count * increments_per_thread
+
+    if counter_kind == "atomic":
+        atomic = Atomic(0)
+        elapsed_seconds = measure_increments(
+            thread_count,
+            increments_per_thread,
+            lambda amount: atomic.map(lambda value: value + amount),
+        )
+        total = atomic.get()
+    elif counter_kind == "striped":
+        striped_counter = StripedCounter()
+        elapsed_seconds = measure_increments(
+            thread_count, increments_per_thread, striped_counter.increment
+        )
+        total = striped_counter.sum()
+    else:
+        raise ValueError(counter_kind)
+
+    if total != expected_total:
+        raise AssertionError(f"Expected total {expected_total}, found {total}")
+
+    return {
+        "counter_kind": counter_kind,
+        "thread_count": thread_count,
+        "increments_per_thread": increments_per_thread,
+        "elapsed_seconds": elapsed_seconds,
+        "increments_per_second": expected_total / elapsed_seconds,
+    }
+
+
+def _parse_int_list(text: str) -> list[int]:
+    return [int(item) for item in text.split(",")]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description="Benchmarks StripedCounter against Atomic")
+    parser.add_argument("--increments-per-thread", type=int, default=100_000)
+    parser.add_argument("--thread-counts", type=_parse_int_list, default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--output", help="Output file - by default, the standard output")
+    arguments = parser.parse_args(argv)
+
+    results = []
+
+    for thread_count in arguments.thread_counts:
+        for counter_kind in ["atomic", "striped"]:
+            result = run_scenario(counter_kind, thread_count, arguments.increments_per_thread)
+            results.append(result)
+            print(
+                f"{counter_kind} x {thread_count} threads -> "
+                f"{result['increments_per_second']:.0f} increments/s",
+                file=sys.stderr,
+            )
+
+    report = json.dumps(
+        {
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            output_file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Measures the per-task overhead of ProcessPoolFacade - over a raw Pool, as well as over
+an InThreadPool - by sweeping the task size, the number of pending requests
+and the size of the arguments.
+
+Run it from the project root - for example:
+
+    python -O -m benchmarks.pool_overhead --output pool_overhead.json
+
+The results - throughput and p50/p99 submit-to-result latency for every scenario -
+are written as a JSON document, so that different runs can be compared by tools.
+
+Running with -O removes the __debug__ logging from the facade, measuring the overhead
+of a release deployment; without it, the logging cost is included - and reported
+in the "debug" field of the environment.
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from multiprocessing import Pool, cpu_count
+from threading import Event, Lock
+from time import perf_counter
+from typing import Optional, Sequence
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    AnyProcessPool,
+    InThreadPool,
+    ProcessPoolFactory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.facade import ProcessPoolFacade
+
+TASK_ITERATIONS = {"empty": 0, "small": 1_000, "medium": 100_000}
+
+
+def spin(task_index: int, iterations: int, payload: bytes) -> int:
+    total = 0
+
+    for value in range(iterations):
+        total += value
+
+    return task_index
+
+
+@dataclass(frozen=True)
+class Scenario:
+    pool_kind: str
+    via_facade: bool
+    task_size: str
+    payload_bytes: int
+    max_pending_async_requests: Optional[int]
+    task_count: int
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    scenario: Scenario
+    elapsed_seconds: float
+    throughput_per_second: float
+    latency_p50_seconds: float
+    latency_p99_seconds: float
+
+
+class _LatencyRecorder:
+    def __init__(self, task_count: int) -> None:
+        self._start_times = [0.0] * task_count
+        self._latencies: list[float] = []
+        self._lock = Lock()
+        self._task_count = task_count
+        self._completed = Event()
+        self._error: Optional[BaseException] = None
+
+    def on_submitted(self, task_index: int) -> None:
+        self._start_times[task_index] = perf_counter()
+
+    def on_completed(self, task_index: int) -> None:
+        latency = perf_counter() - self._start_times[task_index]
+
+        with self._lock:
+            self._latencies.append(latency)
+
+            if len(self._latencies) == self._task_count:
+                self._completed.set()
+
+    def on_error(self, exception: BaseException) -> None:
+        self._error = exception
+        self._completed.set()
+
+    def wait(self) -> None:
+        self._completed.wait()
+
+        if self._error:
+            raise self._error
+
+    def get_percentile(self, percentile: float) -> float:
+        sorted_latencies = sorted(self._latencies)
+        rank = max(0, int(len(sorted_latencies) * percentile / 100 + 0.5) - 1)
+        return sorted_latencies[min(rank, len(sorted_latencies) - 1)]
+
+
+class _RecordingFacade(ProcessPoolFacade[int]):
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        recorder: _LatencyRecorder,
+        max_pending_async_requests: Optional[int],
+    ) -> None:
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=spin,
+            max_pending_async_requests=max_pending_async_requests,
+        )
+        self._recorder = recorder
+
+    def send(self, task_index: int, iterations: int, payload: bytes) -> None:
+        self._recorder.on_submitted(task_index)
+        self._send_to_worker(task_index, iterations, payload)
+
+    def _on_worker_result(self, worker_result: int) -> None:
+        self._recorder.on_completed(worker_result)
+
+    def _on_worker_error(self, exception: BaseException) -> None:
+        self._recorder.on_error(exception)
+
+
+def _create_pool_factory(pool_kind: str, worker_count: int) -> ProcessPoolFactory:
+    if pool_kind == "pool":
+        return lambda: Pool(worker_count)
+
+    if pool_kind == "in-thread":
+        return InThreadPool
+
+    raise ValueError(pool_kind)
+
+
+def _run_raw(
+    pool: AnyProcessPool, recorder: _LatencyRecorder, iterations: int, payload: bytes, count: int
+) -> None:
+    with pool:
+        for task_index in range(count):
+            recorder.on_submitted(task_index)
+            pool.apply_async(
+                spin,
+                args=(task_index, iterations, payload),
+                callback=recorder.on_completed,
+                error_callback=recorder.on_error,
+            )
+
+        recorder.wait()
+        pool.close()
+        pool.join()
+
+
+def run_scenario(scenario: Scenario, worker_count: int) -> ScenarioResult:
+    pool_factory = _create_pool_factory(scenario.pool_kind, worker_count)
+    iterations = TASK_ITERATIONS[scenario.task_size]
+    payload = bytes(scenario.payload_bytes)
+    recorder = _LatencyRecorder(scenario.task_count)
+
+    if scenario.via_facade:
+        facade = _RecordingFacade(pool_factory, recorder, scenario.max_pending_async_requests)
+
+        start_time = perf_counter()
+
+        with facade:
+            for task_index in range(scenario.task_count):
+                facade.send(task_index, iterations, payload)
+
+        recorder.wait()
+    else:
+        pool = pool_factory()
+
+        start_time = perf_counter()
+
+        _run_raw(pool, recorder, iterations, payload, scenario.task_count)
+
+    elapsed_seconds = perf_counter() - start_time
+
+    return ScenarioResult(
+        scenario=scenario,
+        elapsed_seconds=elapsed_seconds,
+        throughput_per_second=scenario.task_count / elapsed_seconds,
+        latency_p50_seconds=recorder.get_percentile(50),
+        latency_p99_seconds=recorder.get_percentile(99),
+    )
+
+
+def create_scenarios(
+    task_count: int,
+    task_sizes: Sequence[str],
+    payload_sizes: Sequence[int],
+    pending_limits: Sequence[int],
+) -> list[Scenario]:
+    scenarios: list[Scenario] = []
+
+    for task_size in task_sizes:
+        for payload_bytes in payload_sizes:
+            for pool_kind in ["pool", "in-thread"]:
+                scenarios.append(
+                    Scenario(pool_kind, False, task_size, payload_bytes, None, task_count)
+                )
+
+                scenarios.extend(
+                    Scenario(pool_kind, True, task_size, payload_bytes, limit, task_count)
+                    for limit in pending_limits
+                )
+
+    return scenarios
+
+
+def _parse_int_list(text: str) -> list[int]:
+    return [int(item) for item in text.split(",")]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description="Benchmarks the overhead of ProcessPoolFacade")
+    parser.add_argument("--task-count", type=int, default=2_000)
+    parser.add_argument("--workers", type=int, default=cpu_count())
+    parser.add_argument(
+        "--task-sizes", type=lambda text: text.split(","), default=list(TASK_ITERATIONS)
+    )
+    parser.add_argument("--payload-bytes", type=_parse_int_list, default=[16, 256 * 1024])
+    parser.add_argument(
+        "--pending-limits",
+        type=_parse_int_list,
+        default=sorted({1, cpu_count(), 4 * cpu_count()}),
+    )
+    parser.add_argument("--output", help="Output file - by default, the standard output")
+    arguments = parser.parse_args(argv)
+
+    for task_size in arguments.task_sizes:
+        if task_size not in TASK_ITERATIONS:
+            parser.error(f"Unknown task size: {task_size}")
+
+    scenarios = create_scenarios(
+        arguments.task_count,
+        arguments.task_sizes,
+        arguments.payload_bytes,
+        arguments.pending_limits,
+    )
+
+    results = []
+
+    for scenario in scenarios:
+        result = run_scenario(scenario, arguments.workers)
+        results.append(asdict(result))
+        print(
+            f"{scenario} -> {result.throughput_per_second:.0f} tasks/s",
+            file=sys.stderr,
+        )
+
+    report = json.dumps(
+        {
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": cpu_count(),
+                "workers": arguments.workers,
+                "debug": __debug__,
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            output_file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
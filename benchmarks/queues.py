@@ -0,0 +1,210 @@
+"""
+Compares RingBufferQueue - with per-item and bulk operations - with queue.Queue and
+queue.SimpleQueue, in single-producer/single-consumer and multi-producer/multi-consumer
+scenarios.
+
+Run it from the project root - for example:
+
+    python -m benchmarks.queues --output queues.json
+
+For every scenario, it reports the elapsed time and the items transferred per second
+as a JSON document.
+
+SimpleQueue is unbounded - so its producers never wait - and has no task_done().
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from queue import Queue, SimpleQueue
+from threading import Barrier, Thread
+from time import perf_counter
+from typing import Any, Callable, Optional, Sequence, Union
+
+from info.gianlucacosta.eos.core.threading.queues.ring_buffer import RingBufferQueue
+
+QUEUE_KINDS = ["queue", "simple_queue", "ring_buffer", "ring_buffer_bulk"]
+
+AnyQueue = Union[Queue[Optional[int]], SimpleQueue[Optional[int]]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    queue_kind: str
+    producer_count: int
+    consumer_count: int
+    items_per_producer: int
+    queue_max_size: int
+    bulk_size: int
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    scenario: Scenario
+    elapsed_seconds: float
+    items_per_second: float
+
+
+def _create_queue(scenario: Scenario) -> AnyQueue:
+    if scenario.queue_kind == "queue":
+        return Queue(scenario.queue_max_size)
+
+    if scenario.queue_kind == "simple_queue":
+        return SimpleQueue()
+
+    if scenario.queue_kind in ("ring_buffer", "ring_buffer_bulk"):
+        return RingBufferQueue(scenario.queue_max_size)
+
+    raise ValueError(scenario.queue_kind)
+
+
+def _create_producer(
+    scenario: Scenario, queue: AnyQueue, start_barrier: Barrier
+) -> Callable[[], None]:
+    def produce() -> None:
+        start_barrier.wait()
+
+        if isinstance(queue, RingBufferQueue) and scenario.queue_kind == "ring_buffer_bulk":
+            for start in range(0, scenario.items_per_producer, scenario.bulk_size):
+                queue.put_many(
+                    range(start, min(start + scenario.bulk_size, scenario.items_per_producer))
+                )
+        else:
+            for item in range(scenario.items_per_producer):
+                queue.put(item)
+
+    return produce
+
+
+def _create_consumer(scenario: Scenario, queue: AnyQueue) -> Callable[[], None]:
+    def consume() -> None:
+        if isinstance(queue, RingBufferQueue) and scenario.queue_kind == "ring_buffer_bulk":
+            while True:
+                items = queue.get_many(scenario.bulk_size)
+
+                for _ in items:
+                    queue.task_done()
+
+                sentinel_count = items.count(None)
+
+                if sentinel_count:
+                    for _ in range(sentinel_count - 1):
+                        queue.put(None)
+                    return
+        else:
+            while True:
+                item = queue.get()
+
+                if isinstance(queue, Queue):
+                    queue.task_done()
+
+                if item is None:
+                    return
+
+    return consume
+
+
+def run_scenario(scenario: Scenario) -> ScenarioResult:
+    queue = _create_queue(scenario)
+    start_barrier = Barrier(scenario.producer_count + 1)
+
+    producers = [
+        Thread(target=_create_producer(scenario, queue, start_barrier))
+        for _ in range(scenario.producer_count)
+    ]
+    consumers = [
+        Thread(target=_create_consumer(scenario, queue)) for _ in range(scenario.consumer_count)
+    ]
+
+    for thread in producers + consumers:
+        thread.start()
+
+    start_barrier.wait()
+    start_time = perf_counter()
+
+    for producer in producers:
+        producer.join()
+
+    for _ in consumers:
+        queue.put(None)
+
+    for consumer in consumers:
+        consumer.join()
+
+    elapsed_seconds = perf_counter() - start_time
+    item_count = scenario.producer_count * scenario.items_per_producer
+
+    return ScenarioResult(
+        scenario=scenario,
+        elapsed_seconds=elapsed_seconds,
+        items_per_second=item_count / elapsed_seconds,
+    )
+
+
+def create_scenarios(
+    items_per_producer: int, queue_max_size: int, bulk_size: int, thread_count: int
+) -> list[Scenario]:
+    return [
+        Scenario(
+            queue_kind=queue_kind,
+            producer_count=agent_count,
+            consumer_count=agent_count,
+            items_per_producer=items_per_producer // agent_count,
+            queue_max_size=queue_max_size,
+            bulk_size=bulk_size,
+        )
+        for agent_count in sorted({1, thread_count})
+        for queue_kind in QUEUE_KINDS
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description="Benchmarks RingBufferQueue against the stdlib queues")
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--queue-max-size", type=int, default=1024)
+    parser.add_argument("--bulk-size", type=int, default=64)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=4,
+        help="Producers - and consumers - in the multi-producer/multi-consumer scenarios",
+    )
+    parser.add_argument("--output", help="Output file - by default, the standard output")
+    arguments = parser.parse_args(argv)
+
+    results: list[dict[str, Any]] = []
+
+    for scenario in create_scenarios(
+        arguments.items, arguments.queue_max_size, arguments.bulk_size, arguments.threads
+    ):
+        result = run_scenario(scenario)
+        results.append(asdict(result))
+        print(
+            f"{scenario.queue_kind} - {scenario.producer_count} producer(s), "
+            f"{scenario.consumer_count} consumer(s) -> {result.items_per_second:.0f} items/s",
+            file=sys.stderr,
+        )
+
+    report = json.dumps(
+        {
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            output_file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
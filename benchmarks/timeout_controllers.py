@@ -0,0 +1,231 @@
+"""
+Compares the timeout controllers of the adaptive queue reader and writer on synthetic
+producer/consumer traces.
+
+Run it from the project root - for example:
+
+    python -m benchmarks.timeout_controllers --output timeout_controllers.json
+
+For every trace and controller, it reports as a JSON document:
+
+* the p50/p99 latency of the items - from production to consumption
+
+* the wake-ups - that is, the expired timeouts - of the reader and of the writer
+
+* the stop latency - from the stop request to the end of the reader
+
+* the CPU time of the whole process
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from queue import Queue
+from threading import Event, Thread
+from time import perf_counter, process_time, sleep
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.threading.queues import QueueWriter
+from info.gianlucacosta.eos.core.threading.queues.adaptive import (
+    create_adaptive_queue_reader,
+    create_adaptive_queue_writer,
+)
+from info.gianlucacosta.eos.core.threading.queues.telemetry import QueueTelemetryRegistry
+from info.gianlucacosta.eos.core.threading.queues.timeouts import (
+    BackoffTimeoutController,
+    EwmaTimeoutController,
+    MultiplicativeTimeoutController,
+    PidTimeoutController,
+    TimeoutController,
+)
+
+TimeoutControllerFactory = Callable[[InclusiveRange], TimeoutController]
+
+
+CONTROLLER_FACTORIES: dict[str, TimeoutControllerFactory] = {
+    "multiplicative": lambda timeout_seconds_range: MultiplicativeTimeoutController(
+        timeout_seconds_range, timeout_factor=2
+    ),
+    "ewma": EwmaTimeoutController,
+    "backoff": BackoffTimeoutController,
+    "pid": PidTimeoutController,
+}
+
+
+@dataclass(frozen=True)
+class Trace:
+    """
+    Synthetic load: bursts of burst_size items - separated by item_interval_seconds - with
+    burst_interval_seconds between bursts; each item takes consumer_seconds to be consumed.
+    """
+
+    name: str
+    burst_count: int
+    burst_size: int
+    item_interval_seconds: float
+    burst_interval_seconds: float
+    consumer_seconds: float
+    queue_max_size: int
+
+
+TRACES = [
+    Trace("steady", 1, 500, 0.001, 0, 0, 16),
+    Trace("bursty", 10, 50, 0, 0.1, 0, 16),
+    Trace("sparse", 1, 50, 0.02, 0, 0, 16),
+    Trace("backpressure", 1, 300, 0, 0, 0.001, 4),
+]
+
+
+@dataclass(frozen=True)
+class TraceResult:
+    trace: str
+    controller: str
+    item_count: int
+    p50_latency_seconds: float
+    p99_latency_seconds: float
+    reader_wake_ups: int
+    writer_wake_ups: int
+    stop_latency_seconds: float
+    cpu_seconds: float
+
+
+def _produce_items(trace: Trace) -> Iterator[float]:
+    for burst_index in range(trace.burst_count):
+        if burst_index:
+            sleep(trace.burst_interval_seconds)
+
+        for _ in range(trace.burst_size):
+            if trace.item_interval_seconds:
+                sleep(trace.item_interval_seconds)
+
+            yield perf_counter()
+
+
+def _get_percentile(sorted_values: list[float], percentile: float) -> float:
+    index = min(int(len(sorted_values) * percentile), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_trace(
+    trace: Trace,
+    controller_name: str,
+    timeout_seconds_range: InclusiveRange,
+) -> TraceResult:
+    controller_factory = CONTROLLER_FACTORIES[controller_name]
+    telemetry_registry = QueueTelemetryRegistry()
+
+    queue = Queue[float](maxsize=trace.queue_max_size)
+    latencies: list[float] = []
+    stop_event = Event()
+
+    def consume(production_time: float) -> None:
+        if trace.consumer_seconds:
+            sleep(trace.consumer_seconds)
+
+        latencies.append(perf_counter() - production_time)
+
+    write_items_to_queue: QueueWriter[float] = create_adaptive_queue_writer(
+        timeout_controller_factory=lambda: controller_factory(timeout_seconds_range),
+        telemetry_registry=telemetry_registry,
+    )
+    read_items_from_queue = create_adaptive_queue_reader(
+        item_consumer=consume,
+        timeout_controller_factory=lambda: controller_factory(timeout_seconds_range),
+        telemetry_registry=telemetry_registry,
+    )
+
+    writing_thread = Thread(
+        target=lambda: write_items_to_queue(queue, lambda: True, _produce_items(trace))
+    )
+    reading_thread = Thread(
+        target=lambda: read_items_from_queue(queue, lambda: not stop_event.is_set())
+    )
+
+    start_cpu_seconds = process_time()
+
+    reading_thread.start()
+    writing_thread.start()
+
+    writing_thread.join()
+    queue.join()
+
+    stop_time = perf_counter()
+    stop_event.set()
+    reading_thread.join()
+    stop_latency_seconds = perf_counter() - stop_time
+
+    cpu_seconds = process_time() - start_cpu_seconds
+
+    latencies.sort()
+
+    telemetry_by_agent = {
+        telemetry.agent_name: telemetry for telemetry in telemetry_registry.get_telemetry()
+    }
+
+    return TraceResult(
+        trace=trace.name,
+        controller=controller_name,
+        item_count=len(latencies),
+        p50_latency_seconds=_get_percentile(latencies, 0.5),
+        p99_latency_seconds=_get_percentile(latencies, 0.99),
+        reader_wake_ups=telemetry_by_agent["reader"].empty_count,
+        writer_wake_ups=telemetry_by_agent["writer"].full_count,
+        stop_latency_seconds=stop_latency_seconds,
+        cpu_seconds=cpu_seconds,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = ArgumentParser(description="Benchmarks the timeout controllers of the queue agents")
+    parser.add_argument("--min-timeout-seconds", type=float, default=0.001)
+    parser.add_argument("--max-timeout-seconds", type=float, default=0.5)
+    parser.add_argument(
+        "--controllers",
+        type=lambda text: text.split(","),
+        default=list(CONTROLLER_FACTORIES),
+    )
+    parser.add_argument("--output", help="Output file - by default, the standard output")
+    arguments = parser.parse_args(argv)
+
+    timeout_seconds_range = InclusiveRange(
+        arguments.min_timeout_seconds, arguments.max_timeout_seconds
+    )
+
+    results: list[dict[str, Any]] = []
+
+    for trace in TRACES:
+        for controller_name in arguments.controllers:
+            result = run_trace(trace, controller_name, timeout_seconds_range)
+            results.append(asdict(result))
+            print(
+                f"{trace.name} / {controller_name} -> "
+                f"p99 {result.p99_latency_seconds * 1000:.2f} ms, "
+                f"{result.reader_wake_ups + result.writer_wake_ups} wake-ups, "
+                f"stop in {result.stop_latency_seconds * 1000:.2f} ms",
+                file=sys.stderr,
+            )
+
+    report = json.dumps(
+        {
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        },
+        indent=2,
+    )
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            output_file.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
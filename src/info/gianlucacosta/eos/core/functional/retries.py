@@ -1,8 +1,10 @@
+from dataclasses import dataclass
 from logging import getLogger
+from random import uniform
 from time import sleep
-from typing import TypeVar
+from typing import Optional, TypeVar
 
-from . import Producer
+from . import Predicate, Producer
 
 logger = getLogger(__name__)
 
@@ -42,3 +44,69 @@ def call_with_retries(producer: Producer[T], max_attempts: int, timeout_seconds:
                 logger.warning(ex)
 
             sleep(timeout_seconds)
+
+
+def _is_exception(error: BaseException) -> bool:
+    return isinstance(error, Exception)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Describes how a failed operation should be retried - without performing the retries,
+    so that it can be applied by non-blocking schedulers.
+
+    * "max_attempts" is the total number of attempts - including the first one - and must be >= 1
+
+    * the delay before the n-th retry is initial_delay_seconds * backoff_factor ** (n - 1),
+      capped by max_delay_seconds - if not None
+
+    * jitter_ratio - from 0 to 1 - is the fraction of each delay that is randomized, to prevent
+      failed operations from being retried all at the same time: with 0, the delay is exact;
+      with 1 - the so-called "full jitter" - it is uniformly distributed from 0 to the delay
+
+    * only errors satisfying is_retryable are retried - by default, any Exception
+    """
+
+    max_attempts: int
+    initial_delay_seconds: float
+    backoff_factor: float = 2
+    max_delay_seconds: Optional[float] = None
+    jitter_ratio: float = 0.5
+    is_retryable: Predicate[BaseException] = _is_exception
+
+    def __post_init__(self) -> None:
+        if self.max_attempts <= 0:
+            raise ValueError(self.max_attempts)
+
+        if self.initial_delay_seconds < 0:
+            raise ValueError(self.initial_delay_seconds)
+
+        if self.backoff_factor < 1:
+            raise ValueError(self.backoff_factor)
+
+        if self.max_delay_seconds is not None and self.max_delay_seconds < 0:
+            raise ValueError(self.max_delay_seconds)
+
+        if not 0 <= self.jitter_ratio <= 1:
+            raise ValueError(self.jitter_ratio)
+
+    def should_retry(self, error: BaseException, attempts_done: int) -> bool:
+        """
+        Tells whether another attempt should follow the given failed attempts.
+        """
+        return attempts_done < self.max_attempts and self.is_retryable(error)
+
+    def get_delay_seconds(self, attempts_done: int) -> float:
+        """
+        Returns the - randomized - delay before the attempt following the given failed attempts.
+        """
+        if attempts_done < 1:
+            raise ValueError(attempts_done)
+
+        delay_seconds = self.initial_delay_seconds * self.backoff_factor ** (attempts_done - 1)
+
+        if self.max_delay_seconds is not None:
+            delay_seconds = min(delay_seconds, self.max_delay_seconds)
+
+        return delay_seconds - uniform(0, delay_seconds * self.jitter_ratio)
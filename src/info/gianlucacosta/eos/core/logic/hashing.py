@@ -0,0 +1,83 @@
+from bisect import bisect, insort
+from hashlib import blake2b
+from typing import Generic, Hashable, Iterable, TypeVar
+
+TNode = TypeVar("TNode", bound=Hashable)
+
+
+def get_stable_hash(value: object) -> int:
+    """
+    Returns a 64-bit hash of the string representation of the given value.
+
+    Unlike hash(), the result does not change across processes and interpreter runs.
+    """
+    return int.from_bytes(blake2b(str(value).encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing(Generic[TNode]):
+    """
+    Maps keys to nodes via consistent hashing: each node is placed on a ring at
+    virtual_node_count points, and a key belongs to the node owning the first point
+    following the key's hash.
+
+    Consequently, adding or removing a node only remaps the keys of that node - about
+    1 / node_count of the keys - while the virtual nodes keep the load evenly distributed.
+
+    Keys and nodes are hashed via get_stable_hash(), so the mapping only depends on their
+    string representation.
+    """
+
+    def __init__(self, nodes: Iterable[TNode] = (), virtual_node_count: int = 64) -> None:
+        if virtual_node_count < 1:
+            raise ValueError(virtual_node_count)
+
+        self._virtual_node_count = virtual_node_count
+        self._nodes: set[TNode] = set()
+        self._ring_hashes: list[int] = []
+        self._ring_nodes: dict[int, TNode] = {}
+
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> frozenset[TNode]:
+        return frozenset(self._nodes)
+
+    def add_node(self, node: TNode) -> None:
+        if node in self._nodes:
+            raise ValueError(node)
+
+        self._nodes.add(node)
+
+        for point_hash in self._get_point_hashes(node):
+            if point_hash not in self._ring_nodes:
+                insort(self._ring_hashes, point_hash)
+                self._ring_nodes[point_hash] = node
+
+    def remove_node(self, node: TNode) -> None:
+        if node not in self._nodes:
+            raise ValueError(node)
+
+        self._nodes.remove(node)
+
+        for point_hash in self._get_point_hashes(node):
+            if self._ring_nodes.get(point_hash) == node:
+                del self._ring_nodes[point_hash]
+                self._ring_hashes.remove(point_hash)
+
+    def get_node(self, key: object) -> TNode:
+        """
+        Returns the node owning the given key - raising ValueError if the ring is empty.
+        """
+        if not self._ring_hashes:
+            raise ValueError("The ring has no nodes")
+
+        ring_index = bisect(self._ring_hashes, get_stable_hash(key)) % len(self._ring_hashes)
+
+        return self._ring_nodes[self._ring_hashes[ring_index]]
+
+    def _get_point_hashes(self, node: TNode) -> list[int]:
+        return [
+            get_stable_hash(f"{node}#{point_index}")
+            for point_index in range(self._virtual_node_count)
+        ]
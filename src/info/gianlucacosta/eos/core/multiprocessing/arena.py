@@ -0,0 +1,228 @@
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+from logging import getLogger
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Any, Union, cast
+
+SharedBufferSource = Union[bytes, bytearray, memoryview, "array[Any]"]
+
+logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SharedBufferHandle:
+    """
+    Picklable reference to a buffer stored in a shared memory segment.
+
+    Only the handle - not the buffer itself - travels between processes: the receiver can
+    access the buffer, without copying it, via attach_shared_buffer().
+    """
+
+    segment_name: str
+    byte_count: int
+    format: str = "B"
+
+
+def is_shared_buffer_source(value: Any) -> bool:
+    """
+    Tells whether the given value can be copied into a shared memory segment.
+    """
+    return isinstance(value, (bytes, bytearray, memoryview, array))
+
+
+def get_byte_count(source: SharedBufferSource) -> int:
+    """
+    Returns the size, in bytes, of the given buffer.
+    """
+    return memoryview(source).nbytes
+
+
+def get_segment_buffer(segment: SharedMemory) -> memoryview:
+    """
+    Returns a view of the whole buffer of the given segment.
+    """
+    return cast(memoryview, segment.buf)
+
+
+def write_to_segment(segment: SharedMemory, source: SharedBufferSource) -> SharedBufferHandle:
+    """
+    Copies the given buffer at the beginning of the segment, returning a handle to it.
+    """
+    source_view = memoryview(source)
+    byte_count = source_view.nbytes
+
+    if byte_count > segment.size:
+        raise ValueError(byte_count, segment.size)
+
+    get_segment_buffer(segment)[:byte_count] = source_view.cast("B")
+
+    return SharedBufferHandle(
+        segment_name=segment.name,
+        byte_count=byte_count,
+        format=source_view.format,
+    )
+
+
+def share_resource_tracker() -> None:
+    """
+    Starts the resource tracker of the current process - if not running yet - so that every
+    process created from now on shares it, instead of starting a tracker of its own.
+
+    Segments created in a process and unlinked in another are thus registered just once - by
+    the tracker of the process that unlinks them: otherwise, at shutdown, the tracker of the
+    other process would warn about "leaked" segments - and try to unlink them again.
+    """
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+def create_segment(byte_count: int, track: bool = True) -> SharedMemory:
+    """
+    Creates a new segment having the given size.
+
+    Set track to False when the segment will be unlinked by another process - its owner:
+    on Python 3.13+, the segment is then not registered by the resource tracker of the
+    current process; on previous versions, such registration is harmless as long as the
+    resource tracker is shared - via share_resource_tracker().
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(create=True, size=byte_count, track=track)
+
+    return SharedMemory(create=True, size=byte_count)
+
+
+def attach_shared_buffer(
+    handle: SharedBufferHandle, track: bool = False
+) -> tuple[SharedMemory, memoryview]:
+    """
+    Attaches to the segment referenced by the handle, returning both the segment and a view
+    of the buffer - cast to its original format.
+
+    track must be True only for the owner of the segment - that is, the side that will
+    unlink it - as described in create_segment().
+
+    The view must be released before closing the segment.
+    """
+    if sys.version_info >= (3, 13):
+        segment = SharedMemory(name=handle.segment_name, track=track)
+    else:
+        segment = SharedMemory(name=handle.segment_name)
+
+    view = get_segment_buffer(segment)[: handle.byte_count]
+
+    return segment, (getattr(view, "cast")(handle.format) if handle.format != "B" else view)
+
+
+def close_segment_quietly(segment: SharedMemory) -> None:
+    """
+    Closes the segment, without raising if some view of its buffer is still referenced -
+    in which case the mapping will be released upon garbage collection.
+    """
+    try:
+        segment.close()
+    except BufferError as ex:
+        if __debug__:
+            logger.debug("Could not close segment %s: %r", segment.name, ex)
+
+
+def unlink_segment(segment: SharedMemory) -> None:
+    """
+    Closes and unlinks the given segment - ignoring segments already unlinked.
+    """
+    close_segment_quietly(segment)
+
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedMemoryArena:
+    """
+    Thread-safe pool of reusable shared memory segments.
+
+    acquire() returns a segment at least as large as requested - whose size is rounded up
+    to a power of 2, so that segments can be reused for requests of similar size; release()
+    gives the segment back to the arena, which keeps up to max_idle_segments of them for
+    reuse, unlinking the others.
+
+    Finally, close() unlinks every idle segment; segments still acquired at that moment are
+    unlinked as soon as they are released.
+    """
+
+    def __init__(self, max_idle_segments: int = 16) -> None:
+        if max_idle_segments < 0:
+            raise ValueError(max_idle_segments)
+
+        self._max_idle_segments = max_idle_segments
+        self._idle_segments_by_size: dict[int, list[SharedMemory]] = {}
+        self._idle_count = 0
+        self._closed = False
+        self._lock = Lock()
+
+    def __enter__(self) -> "SharedMemoryArena":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def idle_count(self) -> int:
+        """
+        How many segments are currently available for reuse.
+        """
+        with self._lock:
+            return self._idle_count
+
+    def acquire(self, byte_count: int) -> SharedMemory:
+        """
+        Returns a segment having at least the given size.
+        """
+        if byte_count < 1:
+            raise ValueError(byte_count)
+
+        segment_size = 1 << (byte_count - 1).bit_length()
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("The arena is closed")
+
+            idle_segments = self._idle_segments_by_size.get(segment_size)
+            if idle_segments:
+                self._idle_count -= 1
+                return idle_segments.pop()
+
+        return create_segment(segment_size)
+
+    def release(self, segment: SharedMemory) -> None:
+        """
+        Gives the segment back to the arena.
+        """
+        with self._lock:
+            if not self._closed and self._idle_count < self._max_idle_segments:
+                self._idle_segments_by_size.setdefault(segment.size, []).append(segment)
+                self._idle_count += 1
+                return
+
+        unlink_segment(segment)
+
+    def close(self) -> None:
+        """
+        Unlinks all the idle segments; no more segments can be acquired.
+        """
+        with self._lock:
+            self._closed = True
+            idle_segments = [
+                segment
+                for size_segments in self._idle_segments_by_size.values()
+                for segment in size_segments
+            ]
+            self._idle_segments_by_size = {}
+            self._idle_count = 0
+
+        for segment in idle_segments:
+            unlink_segment(segment)
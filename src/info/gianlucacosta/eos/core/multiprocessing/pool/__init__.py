@@ -1,10 +1,18 @@
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from logging import getLogger
 from multiprocessing.pool import Pool
+from threading import Condition, Thread, current_thread
 from typing import Any, Iterable, Optional, TypeVar, Union
 
 from ...functional import AnyCallable, Consumer, Producer
 
 T = TypeVar("T")
 
+logger = getLogger(__name__)
+
+_ResultDelivery = tuple["Future[Any]", Optional[Consumer[Any]], Optional[Consumer[BaseException]]]
+
 
 class InThreadPool:
     """
@@ -15,7 +23,8 @@ class InThreadPool:
     test cases in the Windows OS, or when debugging within an IDE.
 
     Therefore, a typical pattern consists in injecting a ProcessPoolFactory into classes and
-    functions, actually letting the client decide what kind of pool they need.
+    functions, actually letting the client decide what kind of pool they need - a Pool,
+    an InThreadPool or an ExecutorPool, backed by threads or processes.
     """
 
     def __enter__(self) -> "InThreadPool":
@@ -63,5 +72,168 @@ class InThreadPool:
         pass
 
 
-AnyProcessPool = Union[Pool, InThreadPool]
+class ExecutorPool:
+    """
+    Adapter exposing a concurrent.futures Executor via the same interface as Python's Pool.
+
+    Just like Pool, the callbacks passed to apply_async() are run, one at a time, by a dedicated
+    result thread - which receives the finished futures via a queue: therefore, callbacks can
+    safely call apply_async() - and never run on the thread submitting the task, nor while
+    holding a lock that the submitting thread might need. An exception raised by a callback
+    is logged, without stopping the result thread.
+
+    Once closed, the pool rejects new tasks; join() waits for the submitted tasks to end -
+    and for their callbacks - while terminate() also cancels the tasks not started yet.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+        self._closed = False
+
+        self._result_condition = Condition()
+        self._finished_deliveries: deque[_ResultDelivery] = deque()
+        self._undelivered_count = 0
+        self._result_thread: Optional[Thread] = None
+
+    def __enter__(self) -> "ExecutorPool":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.terminate()
+
+    def apply(
+        self,
+        func: AnyCallable,
+        args: Optional[Iterable[Any]] = None,
+        kwds: Optional[dict[Any, Any]] = None,
+    ) -> Any:
+        return self._submit(func, args, kwds).result()
+
+    def apply_async(
+        self,
+        func: AnyCallable,
+        args: Optional[Iterable[Any]] = None,
+        kwds: Optional[dict[Any, Any]] = None,
+        callback: Optional[Consumer[Any]] = None,
+        error_callback: Optional[Consumer[BaseException]] = None,
+    ) -> "Future[Any]":
+        with self._result_condition:
+            future = self._submit(func, args, kwds)
+            self._undelivered_count += 1
+
+            if self._result_thread is None:
+                self._result_thread = Thread(
+                    target=self._deliver_results, name="ExecutorPool-results", daemon=True
+                )
+                self._result_thread.start()
+
+        def on_done(done_future: "Future[Any]") -> None:
+            with self._result_condition:
+                self._finished_deliveries.append((done_future, callback, error_callback))
+                self._result_condition.notify_all()
+
+        future.add_done_callback(on_done)
+        return future
+
+    def close(self) -> None:
+        with self._result_condition:
+            self._closed = True
+            self._result_condition.notify_all()
+
+    def terminate(self) -> None:
+        self.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def join(self) -> None:
+        if not self._closed:
+            raise ValueError("Pool is still running")
+
+        self._executor.shutdown(wait=True)
+
+        result_thread = self._result_thread
+        if result_thread is not None and result_thread is not current_thread():
+            result_thread.join()
+
+    def _deliver_results(self) -> None:
+        while True:
+            with self._result_condition:
+                self._result_condition.wait_for(
+                    lambda: self._finished_deliveries
+                    or (self._closed and not self._undelivered_count)
+                )
+
+                if not self._finished_deliveries:
+                    return
+
+                future, callback, error_callback = self._finished_deliveries.popleft()
+
+            try:
+                if not future.cancelled():
+                    exception = future.exception()
+
+                    if exception is None:
+                        if callback:
+                            callback(future.result())
+                    elif error_callback:
+                        error_callback(exception)
+            except BaseException as ex:
+                logger.error("Exception raised by a pool callback: %r", ex)
+            finally:
+                with self._result_condition:
+                    self._undelivered_count -= 1
+                    self._result_condition.notify_all()
+
+    def _submit(
+        self,
+        func: AnyCallable,
+        args: Optional[Iterable[Any]],
+        kwds: Optional[dict[Any, Any]],
+    ) -> "Future[Any]":
+        if self._closed:
+            raise ValueError("Pool not running")
+
+        return self._executor.submit(
+            func, *(args if args is not None else []), **(kwds if kwds is not None else {})
+        )
+
+
+AnyProcessPool = Union[Pool, InThreadPool, ExecutorPool]
 ProcessPoolFactory = Producer[AnyProcessPool]
+
+
+def create_process_pool_factory(
+    processes: Optional[int] = None, max_tasks_per_child: Optional[int] = None
+) -> ProcessPoolFactory:
+    """
+    Returns a factory of Python's process pools - whose worker processes, if max_tasks_per_child
+    is not None, are replaced once they have run the given number of tasks.
+    """
+    return lambda: Pool(processes, maxtasksperchild=max_tasks_per_child)
+
+
+def create_thread_pool_factory(max_workers: Optional[int] = None) -> ProcessPoolFactory:
+    """
+    Returns a factory of thread-backed pools - ideal for I/O-bound worker functions.
+    """
+    return lambda: ExecutorPool(ThreadPoolExecutor(max_workers=max_workers))
+
+
+def create_process_executor_pool_factory(
+    max_workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None
+) -> ProcessPoolFactory:
+    """
+    Returns a factory of pools backed by a ProcessPoolExecutor.
+
+    max_tasks_per_child - requiring Python 3.11 or later - replaces each worker process once
+    it has run the given number of tasks.
+    """
+
+    def create_pool() -> AnyProcessPool:
+        executor_options: dict[str, Any] = {"max_workers": max_workers}
+
+        if max_tasks_per_child is not None:
+            executor_options["max_tasks_per_child"] = max_tasks_per_child
+
+        return ExecutorPool(ProcessPoolExecutor(**executor_options))
+
+    return create_pool
@@ -0,0 +1,170 @@
+from asyncio import FIRST_COMPLETED, Future, Semaphore, get_running_loop, wait
+from logging import getLogger
+from multiprocessing import cpu_count
+from typing import Any, AsyncIterator, Callable, Generic, Iterable, Optional, TypeVar, cast
+
+from . import ProcessPoolFactory
+from .context import WorkerInitializer, bind_worker_context, discard_worker_context
+
+T = TypeVar("T")
+
+
+class AsyncProcessPoolFacade(Generic[T]):
+    """
+    Facade to use a process pool from asyncio code - without ever blocking the event loop.
+
+    * submit() is a coroutine that waits - via an asyncio.Semaphore - until the number of
+      pending requests falls below max_pending_async_requests, then returns an asyncio.Future
+      of the result
+
+    * stream() is an async generator, submitting a sequence of requests with the same
+      backpressure and yielding results as soon as they arrive
+
+    * results and errors, produced on the pool's result thread, are delivered to the event loop
+      via call_soon_threadsafe() - so that asyncio objects are only touched by the loop thread
+
+    * the facade is an async context manager: at the end of an "async with" block, the pool
+      is closed and joined - within an executor thread, so that the loop keeps running and can
+      receive the latest results
+
+    The facade must always be used from the same event loop.
+    """
+
+    TSelf = TypeVar("TSelf")
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+    ) -> None:
+        """
+        Creates the facade - as well as the underlying pool, via the given pool_factory.
+
+        The parameters have the same meaning as in ProcessPoolFacade.
+        """
+        if max_pending_async_requests and max_pending_async_requests < 0:
+            raise ValueError(max_pending_async_requests)
+
+        self._pool = pool_factory()
+        self._worker_context_key, self._worker_function = bind_worker_context(
+            worker_initializer, worker_function
+        )
+        self._request_semaphore = Semaphore(max_pending_async_requests or cpu_count())
+        self._logger = getLogger(type(self).__name__)
+
+    async def __aenter__(self: TSelf) -> TSelf:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+    async def submit(self, *args: Any, **kwargs: Any) -> "Future[T]":
+        """
+        Waits until the request can be sent to the pool, then sends it - returning a future
+        of its result.
+        """
+        loop = get_running_loop()
+
+        await self._request_semaphore.acquire()
+
+        result_future: Future[T] = loop.create_future()
+
+        def callback(result: T) -> None:
+            loop.call_soon_threadsafe(self._complete, result_future, result, None)
+
+        def error_callback(exception: BaseException) -> None:
+            loop.call_soon_threadsafe(self._complete, result_future, None, exception)
+
+        try:
+            self._pool.apply_async(
+                self._worker_function,
+                args=args,
+                kwds=kwargs,
+                callback=callback,
+                error_callback=error_callback,
+            )
+        except BaseException:
+            self._request_semaphore.release()
+            raise
+
+        return result_future
+
+    async def stream(self, argument_tuples: Iterable[tuple[Any, ...]]) -> AsyncIterator[T]:
+        """
+        Submits each tuple of positional arguments, yielding the results in order of
+        completion; the first exception raised by the worker function is re-raised.
+
+        The input is consumed lazily, as requests get accepted by the pool.
+
+        When the stream ends early - because of an exception or because the consumer stops
+        iterating - the requests still pending are canceled, and the outcome of the completed
+        ones is discarded.
+        """
+        pending_futures: set[Future[T]] = set()
+        done_futures: set[Future[T]] = set()
+
+        try:
+            for args in argument_tuples:
+                pending_futures.add(await self.submit(*args))
+
+                newly_done_futures = {future for future in pending_futures if future.done()}
+                pending_futures -= newly_done_futures
+                done_futures |= newly_done_futures
+
+                while done_futures:
+                    yield done_futures.pop().result()
+
+            while pending_futures:
+                newly_done_futures, pending_futures = await wait(
+                    pending_futures, return_when=FIRST_COMPLETED
+                )
+                done_futures |= newly_done_futures
+
+                while done_futures:
+                    yield done_futures.pop().result()
+        finally:
+            for future in pending_futures:
+                future.cancel()
+
+            for future in done_futures:
+                if not future.cancelled():
+                    future.exception()
+
+    async def aclose(self) -> None:
+        """
+        Closes the pool and joins it - without blocking the event loop
+        """
+        if __debug__:
+            self._logger.info("Shutting down the process pool...")
+
+        self._pool.close()
+
+        if __debug__:
+            self._logger.info("Process pool closed!")
+
+        await get_running_loop().run_in_executor(None, self._pool.join)
+
+        if self._worker_context_key:
+            discard_worker_context(self._worker_context_key)
+
+        if __debug__:
+            self._logger.info("Process pool stopped!")
+
+    def _complete(
+        self,
+        result_future: "Future[T]",
+        result: Optional[T],
+        exception: Optional[BaseException],
+    ) -> None:
+        self._request_semaphore.release()
+
+        if result_future.cancelled():
+            return
+
+        if exception is not None:
+            self._logger.error("Unhandled exception from a worker process: %r", exception)
+            result_future.set_exception(exception)
+        else:
+            result_future.set_result(cast(T, result))
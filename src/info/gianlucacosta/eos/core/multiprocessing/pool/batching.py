@@ -0,0 +1,242 @@
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock, Timer
+from time import perf_counter
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+
+from ...logic.ranges import InclusiveRange, RangedCounter
+from ...threading.limiters import ConcurrencyLimiter
+from . import ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import ProcessPoolFacade, ShutdownReport
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+BatchRequest = tuple[tuple[Any, ...], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class BatchItemError:
+    """
+    Placeholder returned by a worker process in lieu of the result of a single request
+    within a batch, when the worker function raised an exception for it.
+    """
+
+    exception: BaseException
+
+
+@dataclass(frozen=True)
+class BatchOutcome(Generic[T]):
+    """
+    What a worker process returns after processing a whole batch - in the same order
+    as the requests.
+    """
+
+    results: list[Union[T, BatchItemError]]
+    elapsed_seconds: float
+
+
+def apply_to_batch(
+    worker_function: Callable[..., T], batch: list[BatchRequest]
+) -> BatchOutcome[T]:
+    """
+    Runs the worker function over every request of the batch, within the worker process.
+
+    An exception raised for a request does not prevent the other requests from being processed:
+    it is returned, wrapped into a BatchItemError, at the related position.
+    """
+    start_time = perf_counter()
+    results: list[Union[T, BatchItemError]] = []
+
+    for args, kwargs in batch:
+        try:
+            results.append(worker_function(*args, **kwargs))
+        except Exception as ex:
+            results.append(BatchItemError(ex))
+
+    return BatchOutcome(results=results, elapsed_seconds=perf_counter() - start_time)
+
+
+class BatchingProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade grouping requests into batches, to reduce the pickling and IPC overhead
+    when each task is small.
+
+    The requests passed to _send_to_worker() are buffered, then sent to the pool as a single
+    payload when:
+
+    * the buffer reaches the current batch size
+
+    * max_batch_delay_seconds - if set - have elapsed since the first buffered request
+
+    * the facade is closed
+
+    Should _try_send_to_worker() fill the buffer while no slot is available within its timeout,
+    only the request just passed is rejected, while the other ones stay buffered; requests
+    that do not fill the buffer are always accepted.
+
+    Each batch takes just one slot of the max_pending_async_requests quota; within the worker
+    process, the worker function is applied to every request of the batch; finally, back in the
+    main process, _on_worker_result() and _on_worker_error() are called once per request.
+
+    If target_batch_seconds is set, the batch size is tuned automatically - between 1 and
+    max_batch_size - so that each batch takes approximately that time within the worker.
+    """
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        max_batch_size: int,
+        max_batch_delay_seconds: Optional[float] = None,
+        target_batch_seconds: Optional[float] = None,
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(max_batch_size)
+
+        if max_batch_delay_seconds is not None and max_batch_delay_seconds < 0:
+            raise ValueError(max_batch_delay_seconds)
+
+        if target_batch_seconds is not None and target_batch_seconds <= 0:
+            raise ValueError(target_batch_seconds)
+
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            concurrency_limiter=concurrency_limiter,
+            metrics_sink=metrics_sink,
+        )
+
+        self._max_batch_delay_seconds = max_batch_delay_seconds
+        self._target_batch_seconds = target_batch_seconds
+        self._batch_size = RangedCounter(InclusiveRange(1, max_batch_size), max_batch_size)
+
+        self._buffer: list[BatchRequest] = []
+        self._buffer_lock = Lock()
+        self._flush_timer: Optional[Timer] = None
+
+    @property
+    def batch_size(self) -> int:
+        """
+        The current batch size - which only varies if target_batch_seconds was set.
+        """
+        return int(self._batch_size.value)
+
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
+        """
+        Sends the pending batch - if any - then closes and joins the pool; the tasks
+        in the returned report are the batches
+        """
+        self.flush()
+        return super().close_and_join(timeout_seconds)
+
+    def flush(self) -> None:
+        """
+        Immediately sends the buffered requests - if any - as a batch.
+        """
+        with self._buffer_lock:
+            batch = self._take_batch()
+
+        if batch:
+            self._send_batch(batch)
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        with self._buffer_lock:
+            self._buffer.append((args, kwargs or {}))
+
+            if len(self._buffer) >= self.batch_size:
+                batch = self._take_batch()
+            else:
+                batch = None
+                self._schedule_flush()
+
+        if not batch or self._send_batch(batch, timeout_seconds):
+            return True
+
+        with self._buffer_lock:
+            self._buffer[:0] = batch[:-1]
+            self._schedule_flush()
+
+        return False
+
+    def _schedule_flush(self) -> None:
+        if (
+            self._buffer
+            and self._flush_timer is None
+            and self._max_batch_delay_seconds is not None
+        ):
+            self._flush_timer = Timer(self._max_batch_delay_seconds, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _take_batch(self) -> list[BatchRequest]:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        batch = self._buffer
+        self._buffer = []
+        return batch
+
+    def _send_batch(
+        self, batch: list[BatchRequest], timeout_seconds: Optional[float] = None
+    ) -> bool:
+        if not self._acquire_slot(timeout_seconds):
+            return False
+
+        if __debug__:
+            self._logger.debug("Sending a batch of %d requests...", len(batch))
+
+        self._apply_async_within_slot(
+            partial(apply_to_batch, self._worker_function),
+            args=(batch,),
+            kwargs={},
+            result_handler=self._process_batch_outcome,
+            error_handler=partial(self._process_batch_error, len(batch)),
+        )
+
+        return True
+
+    def _process_batch_error(self, request_count: int, exception: BaseException) -> None:
+        """
+        Called when the whole batch failed - for example, because it could not be pickled:
+        the error is processed once per request, just like the per-request results.
+        """
+        for _ in range(request_count):
+            self._process_worker_error(exception)
+
+    def _process_batch_outcome(self, outcome: BatchOutcome[T]) -> None:
+        if __debug__:
+            self._logger.debug("Got a batch of %d results!", len(outcome.results))
+
+        self._tune_batch_size(outcome)
+
+        for result in outcome.results:
+            if isinstance(result, BatchItemError):
+                self._process_worker_error(result.exception)
+            else:
+                self._process_worker_result(result)
+
+    def _tune_batch_size(self, outcome: BatchOutcome[T]) -> None:
+        if self._target_batch_seconds is None or not outcome.results:
+            return
+
+        seconds_per_request = outcome.elapsed_seconds / len(outcome.results)
+        if seconds_per_request <= 0:
+            self._batch_size.value = self._batch_size.value * 2
+            return
+
+        self._batch_size.value = round(self._target_batch_seconds / seconds_per_request)
@@ -0,0 +1,239 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from hashlib import blake2b
+from pickle import dumps
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from ...threading.limiters import ConcurrencyLimiter
+from . import ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import ProcessPoolFacade
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+
+def get_request_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> bytes:
+    """
+    Returns a digest of the given arguments - which must be picklable, just like any
+    argument sent to a pool - regardless of the order of the keyword arguments.
+    """
+    return blake2b(dumps((args, sorted(kwargs.items())))).digest()
+
+
+@dataclass(frozen=True)
+class RequestCacheStats:
+    """
+    Point-in-time view of the requests handled by a CachingProcessPoolFacade.
+    """
+
+    request_count: int
+    cache_hit_count: int
+    coalesced_count: int
+    cached_result_count: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        The fraction of requests - from 0 to 1 - that did not need a worker call.
+        """
+        if not self.request_count:
+            return 0
+
+        return (self.cache_hit_count + self.coalesced_count) / self.request_count
+
+
+@dataclass(frozen=True)
+class _CachedResult(Generic[T]):
+    expires_at: Optional[float]
+    result: T
+
+
+class CachingProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade avoiding redundant worker calls for identical requests - that is,
+    requests whose arguments have the same get_request_key().
+
+    * single-flight coalescing: while a request is being processed, identical requests
+      do not reach the pool - they just wait for the very same result
+
+    * result cache: successful results are kept in a LRU cache, having at most
+      max_cached_results entries - each expiring after result_ttl_seconds, if not None;
+      a max_cached_results equal to 0 disables the cache, but not the coalescing
+
+    Every request - whether actually sent, coalesced or cached - gets its own call to
+    _on_worker_result() or _on_worker_error(), so subclasses need not know about this layer;
+    however, the very same result object is passed to all the callers sharing it.
+    Errors are never cached.
+
+    Cached results are delivered on the thread calling _send_to_worker(), while the other
+    results arrive via the pool as usual; cache_stats reports the hit ratio.
+
+    _try_send_to_worker() always accepts cached and coalesced requests; a request that would
+    reach the pool is rejected only if no identical request has been coalesced with it
+    in the meantime - otherwise, it waits for a slot.
+    """
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        max_cached_results: int = 1024,
+        result_ttl_seconds: Optional[float] = None,
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+    ):
+        if max_cached_results < 0:
+            raise ValueError(max_cached_results)
+
+        if result_ttl_seconds is not None and result_ttl_seconds <= 0:
+            raise ValueError(result_ttl_seconds)
+
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            concurrency_limiter=concurrency_limiter,
+            metrics_sink=metrics_sink,
+        )
+
+        self._max_cached_results = max_cached_results
+        self._result_ttl_seconds = result_ttl_seconds
+
+        self._cached_results: OrderedDict[bytes, _CachedResult[T]] = OrderedDict()
+        self._waiter_counts: dict[bytes, int] = {}
+        self._cache_lock = Lock()
+
+        self._request_count = 0
+        self._cache_hit_count = 0
+        self._coalesced_count = 0
+
+    @property
+    def cache_stats(self) -> RequestCacheStats:
+        with self._cache_lock:
+            return RequestCacheStats(
+                request_count=self._request_count,
+                cache_hit_count=self._cache_hit_count,
+                coalesced_count=self._coalesced_count,
+                cached_result_count=len(self._cached_results),
+            )
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cached_results.clear()
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        kwargs = kwargs or {}
+        request_key = get_request_key(args, kwargs)
+
+        with self._cache_lock:
+            self._request_count += 1
+
+            cached_result = self._get_cached_result(request_key)
+
+            if cached_result is not None:
+                self._cache_hit_count += 1
+            elif request_key in self._waiter_counts:
+                self._waiter_counts[request_key] += 1
+                self._coalesced_count += 1
+
+                if __debug__:
+                    self._logger.debug("Request coalesced with an identical one in flight")
+                return True
+            else:
+                self._waiter_counts[request_key] = 1
+
+        if cached_result is not None:
+            if __debug__:
+                self._logger.debug("Result found in cache!")
+
+            self._process_worker_result(cached_result.result)
+            return True
+
+        try:
+            weight = self._get_request_weight(args, kwargs, weight)
+
+            if not self._acquire_slot(timeout_seconds, weight):
+                with self._cache_lock:
+                    rejected = self._waiter_counts[request_key] == 1
+
+                    if rejected:
+                        del self._waiter_counts[request_key]
+                        self._request_count -= 1
+
+                if rejected:
+                    return False
+
+                self._acquire_slot(weight=weight)
+
+            self._apply_async_within_slot(
+                self._worker_function,
+                args=args,
+                kwargs=kwargs,
+                result_handler=partial(self._process_shared_result, request_key),
+                error_handler=partial(self._process_shared_error, request_key),
+                weight=weight,
+            )
+        except BaseException as ex:
+            with self._cache_lock:
+                waiter_count = self._waiter_counts.pop(request_key)
+
+            for _ in range(waiter_count - 1):
+                self._process_worker_error(ex)
+
+            raise
+
+        return True
+
+    def _get_cached_result(self, request_key: bytes) -> Optional[_CachedResult[T]]:
+        cached_result = self._cached_results.get(request_key)
+
+        if cached_result is None:
+            return None
+
+        if cached_result.expires_at is not None and cached_result.expires_at <= monotonic():
+            del self._cached_results[request_key]
+            return None
+
+        self._cached_results.move_to_end(request_key)
+        return cached_result
+
+    def _process_shared_result(self, request_key: bytes, worker_result: T) -> None:
+        with self._cache_lock:
+            waiter_count = self._waiter_counts.pop(request_key)
+
+            if self._max_cached_results:
+                self._cached_results[request_key] = _CachedResult(
+                    (
+                        monotonic() + self._result_ttl_seconds
+                        if self._result_ttl_seconds is not None
+                        else None
+                    ),
+                    worker_result,
+                )
+                self._cached_results.move_to_end(request_key)
+
+                while len(self._cached_results) > self._max_cached_results:
+                    self._cached_results.popitem(last=False)
+
+        for _ in range(waiter_count):
+            self._process_worker_result(worker_result)
+
+    def _process_shared_error(self, request_key: bytes, exception: BaseException) -> None:
+        with self._cache_lock:
+            waiter_count = self._waiter_counts.pop(request_key)
+
+        for _ in range(waiter_count):
+            self._process_worker_error(exception)
@@ -0,0 +1,89 @@
+from functools import partial
+from threading import local
+from types import SimpleNamespace
+from typing import Any, Callable, Optional, TypeVar
+from uuid import uuid4
+
+from ...functional import Consumer
+
+T = TypeVar("T")
+
+
+class WorkerContext(SimpleNamespace):
+    """
+    Per-worker state - for example, a db connection or compiled regexes.
+
+    Each worker - a process in a Pool, but also the calling thread for an InThreadPool - owns
+    a distinct context, created and passed to the worker initializer just before running its
+    first task; then, the very same context is passed to every later task of that worker.
+
+    It is a SimpleNamespace, so you can set and read arbitrary attributes on it.
+    """
+
+
+WorkerInitializer = Consumer[WorkerContext]
+
+_worker_state = local()
+
+
+def _get_contexts() -> dict[str, WorkerContext]:
+    contexts: dict[str, WorkerContext] = getattr(_worker_state, "contexts", None) or {}
+    _worker_state.contexts = contexts
+    return contexts
+
+
+def call_with_worker_context(
+    context_key: str,
+    worker_initializer: WorkerInitializer,
+    worker_function: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Runs within the worker, calling the worker function with the worker's context as its
+    first argument - followed by the given arguments.
+
+    The context is created and initialized the first time the worker needs it; should the
+    initializer fail, the exception bubbles up - failing the task - and the initialization is
+    attempted again upon the next task.
+
+    The context key - usually one per facade - ensures that different facades sharing
+    the same workers do not share their contexts.
+    """
+    contexts = _get_contexts()
+    context = contexts.get(context_key)
+
+    if context is None:
+        context = WorkerContext()
+        worker_initializer(context)
+        contexts[context_key] = context
+
+    return worker_function(context, *args, **kwargs)
+
+
+def discard_worker_context(context_key: str) -> None:
+    """
+    Removes the context having the given key - if any - from the calling thread.
+
+    It only affects the current thread, so it is mostly useful with an InThreadPool.
+    """
+    _get_contexts().pop(context_key, None)
+
+
+def bind_worker_context(
+    worker_initializer: Optional[WorkerInitializer], worker_function: Callable[..., T]
+) -> tuple[Optional[str], Callable[..., T]]:
+    """
+    Prepares the worker function of a facade: if a worker initializer is passed, returns
+    a brand-new context key - to be passed to discard_worker_context() when closing the
+    facade - together with the worker function wrapped via call_with_worker_context();
+    otherwise, returns None and the worker function itself.
+    """
+    if not worker_initializer:
+        return None, worker_function
+
+    context_key = uuid4().hex
+
+    return context_key, partial(
+        call_with_worker_context, context_key, worker_initializer, worker_function
+    )
@@ -1,14 +1,58 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from logging import getLogger
 from multiprocessing import cpu_count
-from threading import Semaphore
-from typing import Any, Callable, Generic, Optional, TypeVar
+from threading import Condition
+from time import monotonic, perf_counter
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar
 
+from ...functional import AnyCallable, Consumer
+from ...threading.limiters import ConcurrencyLimiter, FixedConcurrencyLimiter, WeightBudget
 from . import ProcessPoolFactory
+from .context import WorkerInitializer, bind_worker_context, discard_worker_context
+from .metrics import PoolMetricsSink
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class ShutdownReport:
+    """
+    Outcome of close_and_join(): how many tasks - sent to the pool during the whole life
+    of the facade - completed successfully, failed, or were abandoned because the shutdown
+    deadline expired before they could end.
+    """
+
+    completed_count: int
+    failed_count: int
+    abandoned_count: int
+
+    @property
+    def drained(self) -> bool:
+        """
+        True if no task was abandoned.
+        """
+        return not self.abandoned_count
+
+
+def get_deadline(timeout_seconds: Optional[float]) -> Optional[float]:
+    """
+    Converts an optional timeout into an optional monotonic() deadline.
+    """
+    if timeout_seconds is not None and timeout_seconds < 0:
+        raise ValueError(timeout_seconds)
+
+    return monotonic() + timeout_seconds if timeout_seconds is not None else None
+
+
+def get_remaining_seconds(deadline: Optional[float]) -> Optional[float]:
+    """
+    Returns the seconds - never negative - left before the given deadline; None if the
+    deadline is None.
+    """
+    return max(deadline - monotonic(), 0) if deadline is not None else None
+
+
 class ProcessPoolFacade(Generic[T], ABC):
     """
     Facade to simplify and regulate the usage of a process pool.
@@ -19,6 +63,12 @@ class ProcessPoolFacade(Generic[T], ABC):
       would block the calling thread until a process in the pool has ended its current task
 
     * a _send_to_worker() method, to be called by subclasses to actually send requests to the pool
+      - as well as a _try_send_to_worker() method, giving up if the request cannot be accepted
+      within a timeout; the former actually calls the latter, which is therefore the only
+      method to override in order to customize how requests are sent
+
+    * optional weighted admission - bounding the total weight, such as the payload bytes,
+      of the pending requests
 
     * an _on_worker_result() abstract method, that must be implemented by subclasses
       to handle the async result of a worker process
@@ -29,7 +79,11 @@ class ProcessPoolFacade(Generic[T], ABC):
     * automatic logging upon error - and, in __debug__, at different points -
       via a _logger field
 
-    * a close_and_join() method, to simplify and log the termination steps
+    * optional worker initialization - creating per-worker state just once, instead of upon
+      every task
+
+    * a close_and_join() method, to simplify and log the termination steps - optionally
+      within a deadline, reporting the outcome of the tasks
 
     * __enter__ and __exit__ methods - ensuring that close_and_join() is called at the end
       of a "with" block - instead of the default terminate() call provided by Python's pools
@@ -42,6 +96,11 @@ class ProcessPoolFacade(Generic[T], ABC):
         pool_factory: ProcessPoolFactory,
         worker_function: Callable[..., T],
         max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+        max_pending_weight: Optional[float] = None,
+        request_weigher: Optional[Callable[..., float]] = None,
     ):
         """
         Creates the facade - as well as the underlying pool, via the given pool_factory.
@@ -49,26 +108,66 @@ class ProcessPoolFacade(Generic[T], ABC):
         The worker function can be any callable compatible with Pool's apply_async() method.
 
         The max_pending_async_requests tells how many async requests can be pending at any time -
-        defaulting to the number of CPUs in the system.
+        defaulting to the number of CPUs in the system; alternatively, you can pass a
+        concurrency_limiter - such as an AdaptiveConcurrencyLimiter, tuning the number of
+        pending requests according to the observed latency - which takes precedence.
+
+        Finally, a metrics_sink - for example, an InMemoryPoolMetrics - can receive admission
+        wait times, task latencies, error counts and the number of tasks in flight; without it,
+        no measurement is performed.
+
+        If a worker_initializer is passed, each worker creates a WorkerContext - passed to the
+        initializer before the first task of the worker - and the worker function receives
+        such context as its first argument, before the arguments passed to _send_to_worker();
+        the initializer must be picklable, just like the worker function.
+
+        If max_pending_weight is not None, each request also has a weight - 1 by default -
+        and requests wait until the total weight of the pending requests, including their own,
+        does not exceed max_pending_weight; the weight can be passed to _try_send_to_worker()
+        or computed by the request_weigher, called with the very arguments of the request -
+        for example, to return the payload size in bytes.
         """
         if max_pending_async_requests and max_pending_async_requests < 0:
             raise ValueError(max_pending_async_requests)
 
         self._pool = pool_factory()
-        self._worker_function = worker_function
-        self._request_semaphore = Semaphore(max_pending_async_requests or cpu_count())
+        self._worker_context_key, self._worker_function = bind_worker_context(
+            worker_initializer, worker_function
+        )
+        self._concurrency_limiter = concurrency_limiter or FixedConcurrencyLimiter(
+            max_pending_async_requests or cpu_count()
+        )
+        self._metrics_sink = metrics_sink
+        self._weight_budget = (
+            WeightBudget(max_pending_weight) if max_pending_weight is not None else None
+        )
+        self._request_weigher = request_weigher
         self._logger = getLogger(type(self).__name__)
 
+        self._task_condition = Condition()
+        self._in_flight_task_count = 0
+        self._completed_task_count = 0
+        self._failed_task_count = 0
+
     def __enter__(self: TSelf) -> TSelf:
         return self
 
     def __exit__(self, *_: Any) -> None:
         self.close_and_join()
 
-    def close_and_join(self) -> None:
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
         """
-        Closes the pool and joins it - logging every step
+        Closes the pool and joins it - logging every step.
+
+        If timeout_seconds is not None, the tasks can keep running only until such deadline:
+        then, the pool is terminated - abandoning whatever has not ended yet; in particular,
+        a Pool also kills the running tasks, while an ExecutorPool cancels the tasks not
+        started yet and waits for the running ones.
+
+        Returns a ShutdownReport describing the outcome of all the tasks sent to the pool.
         """
+        deadline = get_deadline(timeout_seconds)
+
         if __debug__:
             self._logger.info("Shutting down the process pool...")
 
@@ -77,34 +176,240 @@ class ProcessPoolFacade(Generic[T], ABC):
         if __debug__:
             self._logger.info("Process pool closed!")
 
+        if deadline is not None:
+            with self._task_condition:
+                drained = self._task_condition.wait_for(
+                    lambda: not self._in_flight_task_count,
+                    timeout=get_remaining_seconds(deadline),
+                )
+
+            if not drained:
+                self._logger.warning(
+                    "Shutdown deadline expired with %d tasks in flight - terminating the pool",
+                    self._in_flight_task_count,
+                )
+                self._pool.terminate()
+
         self._pool.join()
 
+        if self._worker_context_key:
+            discard_worker_context(self._worker_context_key)
+
         if __debug__:
             self._logger.info("Process pool stopped!")
 
+        with self._task_condition:
+            return ShutdownReport(
+                completed_count=self._completed_task_count,
+                failed_count=self._failed_task_count,
+                abandoned_count=self._in_flight_task_count,
+            )
+
     def _send_to_worker(self, *args: Any, **kwargs: Any) -> None:
+        self._try_send_to_worker(args, kwargs, timeout_seconds=None)
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        """
+        Sends a request to the pool, provided that it can be accepted within timeout_seconds:
+        by default, it never blocks, while None means waiting as long as needed.
+
+        The weight - relevant only when max_pending_weight was set - defaults to the value
+        returned by the request_weigher, if any, or to 1.
+
+        Returns True if the request was sent, False if it was rejected - so that the caller
+        can shed load, for example.
+
+        It is also called by _send_to_worker(), so subclasses customizing how requests are
+        sent should override this method.
+        """
+        kwargs = kwargs or {}
+        weight = self._get_request_weight(args, kwargs, weight)
+
+        if not self._acquire_slot(timeout_seconds, weight):
+            return False
+
+        self._apply_async_within_slot(
+            self._worker_function,
+            args=args,
+            kwargs=kwargs,
+            result_handler=self._process_worker_result,
+            error_handler=self._process_worker_error,
+            weight=weight,
+        )
+
+        return True
+
+    def _get_request_weight(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any], weight: Optional[float]
+    ) -> float:
+        """
+        Returns the given weight - if not None - or the one computed by the request_weigher,
+        defaulting to 1.
+        """
+        if weight is not None:
+            return weight
+
+        return self._request_weigher(*args, **kwargs) if self._request_weigher else 1
+
+    def _apply_async(
+        self,
+        function: AnyCallable,
+        args: Iterable[Any],
+        kwargs: dict[str, Any],
+        result_handler: Consumer[Any],
+        error_handler: Consumer[BaseException],
+    ) -> None:
+        """
+        Sends an arbitrary function call to the pool, within the max_pending_async_requests quota.
+
+        Blocks until a slot is available; the slot is released as soon as the task ends, just
+        before calling the result handler - or just after calling the error handler.
+
+        It is the building block of _send_to_worker(), but subclasses can use it whenever they
+        need dedicated handlers - for example, to track each request.
+        """
+        self._acquire_slot()
+
+        self._apply_async_within_slot(
+            function,
+            args=args,
+            kwargs=kwargs,
+            result_handler=result_handler,
+            error_handler=error_handler,
+        )
+
+    def _acquire_slot(self, timeout_seconds: Optional[float] = None, weight: float = 1) -> bool:
+        """
+        Waits for a slot in the concurrency limiter - and for the given weight to fit into
+        the max_pending_weight, if set - for at most timeout_seconds, if not None.
+
+        Returns whether the slot was acquired; in that case, the caller must pass it to
+        _apply_async_within_slot().
+        """
         if __debug__:
             self._logger.debug("Trying to get access to a worker process...")
 
-        self._request_semaphore.acquire()
+        metrics_sink = self._metrics_sink
+
+        if metrics_sink:
+            wait_start_time = perf_counter()
+
+        deadline = get_deadline(timeout_seconds)
+
+        if self._weight_budget and not self._weight_budget.acquire(weight, timeout_seconds):
+            if __debug__:
+                self._logger.debug("The request weight exceeds the available budget!")
+            return False
+
+        if not self._concurrency_limiter.acquire(get_remaining_seconds(deadline)):
+            if self._weight_budget:
+                self._weight_budget.release(weight)
+
+            if __debug__:
+                self._logger.debug("No worker process available!")
+            return False
 
         if __debug__:
             self._logger.debug("Worker process available!")
 
+        if metrics_sink:
+            metrics_sink.on_admission_wait(perf_counter() - wait_start_time)
+            metrics_sink.on_in_flight_changed(self._concurrency_limiter.in_flight)
+
+        return True
+
+    def _apply_async_within_slot(
+        self,
+        function: AnyCallable,
+        args: Iterable[Any],
+        kwargs: dict[str, Any],
+        result_handler: Consumer[Any],
+        error_handler: Consumer[BaseException],
+        weight: float = 1,
+    ) -> None:
+        """
+        Just like _apply_async(), but using a slot already obtained via _acquire_slot() -
+        with the same weight.
+        """
+        start_time = perf_counter()
+
+        with self._task_condition:
+            self._in_flight_task_count += 1
+
+        def callback(result: Any) -> None:
+            self._release_slot(perf_counter() - start_time, succeeded=True, weight=weight)
+            result_handler(result)
+
+        def error_callback(exception: BaseException) -> None:
+            try:
+                error_handler(exception)
+            finally:
+                self._release_slot(perf_counter() - start_time, succeeded=False, weight=weight)
+
+        try:
+            self._submit_to_pool(function, args, kwargs, callback, error_callback)
+        except BaseException:
+            self._release_slot(perf_counter() - start_time, succeeded=False, weight=weight)
+            raise
+
+        if __debug__:
+            self._logger.debug("Request sent to the worker process!")
+
+    def _submit_to_pool(
+        self,
+        function: AnyCallable,
+        args: Iterable[Any],
+        kwargs: dict[str, Any],
+        callback: Consumer[Any],
+        error_callback: Consumer[BaseException],
+    ) -> None:
+        """
+        Passes the task to the apply_async() method of the pool; subclasses can override it
+        to choose the pool - or to wrap the callbacks.
+        """
         self._pool.apply_async(
-            self._worker_function,
+            function,
             args=args,
             kwds=kwargs,
-            callback=self._process_worker_result,
-            error_callback=self._process_worker_error,
+            callback=callback,
+            error_callback=error_callback,
         )
 
-        if __debug__:
-            self._logger.debug("Request sent to the worker process!")
+    def _release_slot(self, latency_seconds: float, succeeded: bool, weight: float = 1) -> None:
+        with self._task_condition:
+            self._in_flight_task_count -= 1
 
-    def _process_worker_result(self, worker_result: T) -> None:
-        self._request_semaphore.release()
+            if succeeded:
+                self._completed_task_count += 1
+            else:
+                self._failed_task_count += 1
+
+            self._task_condition.notify_all()
+
+        self._concurrency_limiter.release(latency_seconds, succeeded=succeeded)
+
+        if self._weight_budget:
+            self._weight_budget.release(weight)
+
+        if self._metrics_sink:
+            self._metrics_sink.on_task_ended(latency_seconds, succeeded)
+            self._metrics_sink.on_in_flight_changed(self._concurrency_limiter.in_flight)
+
+        self._on_slot_released()
 
+    def _on_slot_released(self) -> None:
+        """
+        Called whenever a task ends and its slot becomes available - before calling the
+        result handler, or after calling the error handler; by default, it does nothing.
+        """
+
+    def _process_worker_result(self, worker_result: T) -> None:
         if __debug__:
             self._logger.debug("Got a result from a worker process!")
 
@@ -115,12 +420,12 @@ class ProcessPoolFacade(Generic[T], ABC):
         pass
 
     def _process_worker_error(self, exception: BaseException) -> None:
-        try:
-            self._logger.error("Unhandled exception from a worker process: %r", exception)
+        self._logger.error("Unhandled exception from a worker process: %r", exception)
+
+        if self._metrics_sink:
+            self._metrics_sink.on_worker_error()
 
-            self._on_worker_error(exception)
-        finally:
-            self._request_semaphore.release()
+        self._on_worker_error(exception)
 
     def _on_worker_error(self, exception: BaseException) -> None:
         pass
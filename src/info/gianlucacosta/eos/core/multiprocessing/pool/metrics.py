@@ -0,0 +1,212 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional
+
+
+class PoolMetricsSink:
+    """
+    Receives the measurements performed by a ProcessPoolFacade.
+
+    Every method is a no-op by default, so you only need to override the ones you are
+    interested in; the methods are called from different threads - the producers as well as
+    the pool's result thread - so they must be thread-safe and fast.
+
+    When no sink is passed to the facade, no measurement is performed at all.
+    """
+
+    def on_admission_wait(self, wait_seconds: float) -> None:
+        """
+        Called after a producer has waited for a free slot in the concurrency limiter.
+        """
+
+    def on_in_flight_changed(self, in_flight: int) -> None:
+        """
+        Called whenever a task is sent to the pool or ends.
+        """
+
+    def on_task_ended(self, latency_seconds: float, succeeded: bool) -> None:
+        """
+        Called when a task sent to the pool ends - with its submit-to-result latency.
+        """
+
+    def on_worker_error(self) -> None:
+        """
+        Called whenever an error is about to be passed to _on_worker_error() - which might
+        happen more than once per task, for example when batching.
+        """
+
+    def on_pool_recycled(self, reason: str) -> None:
+        """
+        Called whenever a facade replaces its pool with a brand-new one.
+        """
+
+
+class LatencyHistogram:
+    """
+    Thread-safe histogram of durations, with exponentially-growing bucket bounds - starting
+    from min_bound_seconds and multiplied by growth_factor, for the given number of buckets;
+    an additional bucket collects the values exceeding the last bound.
+
+    Percentiles are estimated via the upper bound of the bucket containing them.
+    """
+
+    def __init__(
+        self,
+        min_bound_seconds: float = 0.0001,
+        growth_factor: float = 2,
+        bucket_count: int = 24,
+    ) -> None:
+        if min_bound_seconds <= 0:
+            raise ValueError(min_bound_seconds)
+
+        if growth_factor <= 1:
+            raise ValueError(growth_factor)
+
+        if bucket_count < 1:
+            raise ValueError(bucket_count)
+
+        self._bounds = [min_bound_seconds * growth_factor**index for index in range(bucket_count)]
+        self._counts = [0] * (bucket_count + 1)
+        self._total_count = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        return self._total_count
+
+    @property
+    def mean_seconds(self) -> Optional[float]:
+        with self._lock:
+            return self._total_seconds / self._total_count if self._total_count else None
+
+    @property
+    def max_seconds(self) -> Optional[float]:
+        return self._max_seconds if self._total_count else None
+
+    def record(self, seconds: float) -> None:
+        bucket_index = bisect_left(self._bounds, seconds)
+
+        with self._lock:
+            self._counts[bucket_index] += 1
+            self._total_count += 1
+            self._total_seconds += seconds
+            self._max_seconds = max(self._max_seconds, seconds)
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Returns the estimated value below which the given percentage - from 0 to 100 -
+        of the recorded values falls; None if no value was recorded.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(percentile)
+
+        with self._lock:
+            if not self._total_count:
+                return None
+
+            threshold = percentile / 100 * self._total_count
+            cumulative_count = 0
+
+            for bucket_index, bucket_count in enumerate(self._counts):
+                cumulative_count += bucket_count
+
+                if bucket_count and cumulative_count >= threshold:
+                    if bucket_index < len(self._bounds):
+                        return min(self._bounds[bucket_index], self._max_seconds)
+                    break
+
+            return self._max_seconds
+
+
+@dataclass(frozen=True)
+class PoolMetricsSnapshot:
+    """
+    Point-in-time view of the metrics collected by an InMemoryPoolMetrics.
+    """
+
+    task_count: int
+    failed_task_count: int
+    worker_error_count: int
+    recycle_count: int
+    in_flight: int
+    max_in_flight: int
+    admission_wait_p50_seconds: Optional[float]
+    admission_wait_p99_seconds: Optional[float]
+    latency_p50_seconds: Optional[float]
+    latency_p99_seconds: Optional[float]
+
+
+class InMemoryPoolMetrics(PoolMetricsSink):
+    """
+    Sink keeping counters and latency histograms in memory - for inspection via the
+    histogram properties or via snapshot().
+    """
+
+    def __init__(self) -> None:
+        self._admission_wait_histogram = LatencyHistogram()
+        self._latency_histogram = LatencyHistogram()
+        self._task_count = 0
+        self._failed_task_count = 0
+        self._worker_error_count = 0
+        self._recycle_count = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._lock = Lock()
+
+    @property
+    def admission_wait_histogram(self) -> LatencyHistogram:
+        return self._admission_wait_histogram
+
+    @property
+    def latency_histogram(self) -> LatencyHistogram:
+        return self._latency_histogram
+
+    def on_admission_wait(self, wait_seconds: float) -> None:
+        self._admission_wait_histogram.record(wait_seconds)
+
+    def on_in_flight_changed(self, in_flight: int) -> None:
+        with self._lock:
+            self._in_flight = in_flight
+            self._max_in_flight = max(self._max_in_flight, in_flight)
+
+    def on_task_ended(self, latency_seconds: float, succeeded: bool) -> None:
+        self._latency_histogram.record(latency_seconds)
+
+        with self._lock:
+            self._task_count += 1
+
+            if not succeeded:
+                self._failed_task_count += 1
+
+    def on_worker_error(self) -> None:
+        with self._lock:
+            self._worker_error_count += 1
+
+    def on_pool_recycled(self, reason: str) -> None:
+        with self._lock:
+            self._recycle_count += 1
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        with self._lock:
+            task_count = self._task_count
+            failed_task_count = self._failed_task_count
+            worker_error_count = self._worker_error_count
+            recycle_count = self._recycle_count
+            in_flight = self._in_flight
+            max_in_flight = self._max_in_flight
+
+        return PoolMetricsSnapshot(
+            task_count=task_count,
+            failed_task_count=failed_task_count,
+            worker_error_count=worker_error_count,
+            recycle_count=recycle_count,
+            in_flight=in_flight,
+            max_in_flight=max_in_flight,
+            admission_wait_p50_seconds=self._admission_wait_histogram.get_percentile(50),
+            admission_wait_p99_seconds=self._admission_wait_histogram.get_percentile(99),
+            latency_p50_seconds=self._latency_histogram.get_percentile(50),
+            latency_p99_seconds=self._latency_histogram.get_percentile(99),
+        )
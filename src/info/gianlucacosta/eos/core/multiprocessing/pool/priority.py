@@ -0,0 +1,232 @@
+from collections import deque
+from dataclasses import dataclass, replace
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Optional, TypeVar
+
+from ...threading.limiters import ConcurrencyLimiter
+from . import ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import (
+    ProcessPoolFacade,
+    ShutdownReport,
+    get_deadline,
+    get_remaining_seconds,
+)
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _PendingRequest:
+    enqueued_at: float
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    weight: float
+
+
+class PriorityProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade where requests wait in a priority-aware queue, instead of competing
+    for the pool in first-come first-served order.
+
+    Requests are sent via _send_to_worker_with_priority() - with priority 0 being the most
+    urgent and priority_class_count - 1 the least urgent - or via _send_to_worker(), which
+    uses the default_priority; both have a _try_ variant, only waiting for room in the queue
+    up to a timeout.
+
+    Whenever a slot becomes available, it goes to the oldest request of the most urgent
+    non-empty class; however, to prevent starvation, a request that has been waiting for
+    more than max_wait_seconds - if set - is served first, regardless of its class.
+
+    If max_queued_requests is set, producers block while the queue is full; closing the facade
+    waits until the queue has been emptied.
+
+    Queued requests are dispatched by the producers as well as by the pool's callbacks - as
+    soon as a slot is released: a request that cannot be sent to the pool - for example,
+    because the pool is closed - is logged and discarded, without stopping the dispatch of
+    the other requests nor reaching the pool's result handler.
+    """
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        priority_class_count: int = 3,
+        default_priority: int = 0,
+        max_wait_seconds: Optional[float] = None,
+        max_queued_requests: Optional[int] = None,
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+    ):
+        if priority_class_count < 1:
+            raise ValueError(priority_class_count)
+
+        if not 0 <= default_priority < priority_class_count:
+            raise ValueError(default_priority)
+
+        if max_wait_seconds is not None and max_wait_seconds < 0:
+            raise ValueError(max_wait_seconds)
+
+        if max_queued_requests is not None and max_queued_requests < 1:
+            raise ValueError(max_queued_requests)
+
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            concurrency_limiter=concurrency_limiter,
+            metrics_sink=metrics_sink,
+        )
+
+        self._default_priority = default_priority
+        self._max_wait_seconds = max_wait_seconds
+        self._max_queued_requests = max_queued_requests
+
+        self._queues: list[deque[_PendingRequest]] = [deque() for _ in range(priority_class_count)]
+        self._queued_count = 0
+        self._dispatching = False
+        self._queue_condition = Condition()
+
+    @property
+    def queued_count(self) -> int:
+        """
+        How many requests are waiting for a slot.
+        """
+        return self._queued_count
+
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
+        """
+        Waits until every queued request has been sent to the pool, then closes and joins it;
+        if the deadline expires first, the requests still queued are discarded - and reported
+        as abandoned
+        """
+        deadline = get_deadline(timeout_seconds)
+
+        with self._queue_condition:
+            self._queue_condition.wait_for(
+                lambda: not self._queued_count, timeout=get_remaining_seconds(deadline)
+            )
+
+            abandoned_count = self._queued_count
+
+            for queue in self._queues:
+                queue.clear()
+
+            self._queued_count = 0
+            self._queue_condition.notify_all()
+
+        if abandoned_count:
+            self._logger.warning("Discarded %d queued requests", abandoned_count)
+
+        report = super().close_and_join(get_remaining_seconds(deadline))
+
+        return replace(report, abandoned_count=report.abandoned_count + abandoned_count)
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        return self._try_send_to_worker_with_priority(
+            self._default_priority, args, kwargs, timeout_seconds, weight
+        )
+
+    def _send_to_worker_with_priority(self, priority: int, *args: Any, **kwargs: Any) -> None:
+        self._try_send_to_worker_with_priority(priority, args, kwargs, timeout_seconds=None)
+
+    def _try_send_to_worker_with_priority(
+        self,
+        priority: int,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        """
+        Enqueues the request with the given priority, provided that the queue has room for it
+        within timeout_seconds - None meaning waiting as long as needed.
+
+        Returns whether the request was enqueued.
+        """
+        if not 0 <= priority < len(self._queues):
+            raise ValueError(priority)
+
+        kwargs = kwargs or {}
+        weight = self._get_request_weight(args, kwargs, weight)
+
+        with self._queue_condition:
+            if not self._queue_condition.wait_for(
+                lambda: not self._max_queued_requests
+                or self._queued_count < self._max_queued_requests,
+                timeout=timeout_seconds,
+            ):
+                return False
+
+            self._queues[priority].append(_PendingRequest(monotonic(), args, kwargs, weight))
+            self._queued_count += 1
+
+        self._dispatch_queued_requests()
+
+        return True
+
+    def _on_slot_released(self) -> None:
+        self._dispatch_queued_requests()
+
+    def _dispatch_queued_requests(self) -> None:
+        with self._queue_condition:
+            if self._dispatching:
+                return
+
+            self._dispatching = True
+
+        while True:
+            with self._queue_condition:
+                queue = self._get_most_urgent_queue() if self._queued_count else None
+
+                if queue is None or not self._acquire_slot(
+                    timeout_seconds=0, weight=queue[0].weight
+                ):
+                    self._dispatching = False
+                    return
+
+                request = queue.popleft()
+                self._queued_count -= 1
+                self._queue_condition.notify_all()
+
+            try:
+                self._apply_async_within_slot(
+                    self._worker_function,
+                    args=request.args,
+                    kwargs=request.kwargs,
+                    result_handler=self._process_worker_result,
+                    error_handler=self._process_worker_error,
+                    weight=request.weight,
+                )
+            except Exception as ex:
+                self._logger.error("Cannot dispatch a queued request - discarding it: %r", ex)
+
+    def _get_most_urgent_queue(self) -> deque[_PendingRequest]:
+        if self._max_wait_seconds is not None:
+            starving_deadline = monotonic() - self._max_wait_seconds
+
+            starving_queues = [
+                queue
+                for queue in self._queues
+                if queue and queue[0].enqueued_at <= starving_deadline
+            ]
+
+            if starving_queues:
+                return min(starving_queues, key=lambda queue: queue[0].enqueued_at)
+
+        for queue in self._queues:
+            if queue:
+                return queue
+
+        raise ValueError("No queued requests")
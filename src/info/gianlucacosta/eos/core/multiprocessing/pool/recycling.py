@@ -0,0 +1,256 @@
+from functools import partial
+from os import sysconf
+from threading import RLock, Thread
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from ...functional import AnyCallable, Consumer
+from ...threading.limiters import ConcurrencyLimiter
+from . import AnyProcessPool, ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import ProcessPoolFacade, ShutdownReport, get_deadline, get_remaining_seconds
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+
+def get_resident_set_bytes() -> Optional[int]:
+    """
+    Returns the resident set size - in bytes - of the current process, read from /proc;
+    None if it is not available - for example, outside Linux.
+    """
+    try:
+        with open("/proc/self/statm") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return resident_pages * sysconf("SC_PAGE_SIZE")
+
+
+def call_with_rss_measurement(
+    worker_function: Callable[..., T], *args: Any, **kwargs: Any
+) -> tuple[T, Optional[int]]:
+    """
+    Runs within the worker, returning the result of the worker function together with
+    the resident set size of the worker right after the call.
+    """
+    return worker_function(*args, **kwargs), get_resident_set_bytes()
+
+
+class RecyclingProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade replacing its whole pool with a brand-new one - created by the same
+    pool_factory - to keep long-running facades healthy:
+
+    * after max_tasks_per_pool tasks - if not None - have ended within the current pool
+
+    * as soon as a worker reports - right after a task - a resident set size greater than
+      max_worker_rss_bytes, if not None; the size is read from /proc, so this check is only
+      available on Linux
+
+    No request is dropped: new requests go to the new pool, while the retired pool is closed -
+    so that its in-flight tasks can end normally - and joined in a background thread;
+    close_and_join() waits for the retired pools as well, within the same deadline.
+
+    Each recycle is logged and counted - via recycle_count and the metrics sink, if any.
+
+    To recycle single worker processes instead of the whole pool, you can also pass a
+    create_process_pool_factory() with max_tasks_per_child.
+    """
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        max_tasks_per_pool: Optional[int] = None,
+        max_worker_rss_bytes: Optional[int] = None,
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+    ):
+        if max_tasks_per_pool is not None and max_tasks_per_pool < 1:
+            raise ValueError(max_tasks_per_pool)
+
+        if max_worker_rss_bytes is not None and max_worker_rss_bytes < 1:
+            raise ValueError(max_worker_rss_bytes)
+
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            concurrency_limiter=concurrency_limiter,
+            metrics_sink=metrics_sink,
+        )
+
+        self._pool_factory = pool_factory
+        self._max_tasks_per_pool = max_tasks_per_pool
+        self._max_worker_rss_bytes = max_worker_rss_bytes
+
+        self._measured_worker_function = partial(call_with_rss_measurement, self._worker_function)
+
+        self._pool_lock = RLock()
+        self._generation = 0
+        self._ended_tasks_in_generation = 0
+        self._recycle_count = 0
+        self._recycling_stopped = False
+        self._retired_pools: list[tuple[AnyProcessPool, Thread]] = []
+
+    @property
+    def recycle_count(self) -> int:
+        """
+        How many times the pool has been replaced.
+        """
+        return self._recycle_count
+
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
+        """
+        Closes and joins the current pool, as well as the retired ones still running - all
+        within the same deadline, after which every pool still running is terminated.
+
+        The tasks still running in retired pools at that moment are reported as abandoned;
+        furthermore, no pool is recycled once this method has been called.
+        """
+        deadline = get_deadline(timeout_seconds)
+
+        with self._pool_lock:
+            self._recycling_stopped = True
+            retired_pools = list(self._retired_pools)
+            self._retired_pools.clear()
+
+        for _, joining_thread in retired_pools:
+            joining_thread.join(get_remaining_seconds(deadline))
+
+        super().close_and_join(get_remaining_seconds(deadline))
+
+        for retired_pool, joining_thread in retired_pools:
+            if joining_thread.is_alive():
+                self._logger.warning(
+                    "Shutdown deadline expired while a retired pool was running - terminating it"
+                )
+                retired_pool.terminate()
+                joining_thread.join()
+
+        with self._task_condition:
+            return ShutdownReport(
+                completed_count=self._completed_task_count,
+                failed_count=self._failed_task_count,
+                abandoned_count=self._in_flight_task_count,
+            )
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        kwargs = kwargs or {}
+        weight = self._get_request_weight(args, kwargs, weight)
+
+        if not self._acquire_slot(timeout_seconds, weight):
+            return False
+
+        self._apply_async_within_slot(
+            self._measured_worker_function,
+            args=args,
+            kwargs=kwargs,
+            result_handler=self._process_measured_result,
+            error_handler=self._process_worker_error,
+            weight=weight,
+        )
+
+        return True
+
+    def _submit_to_pool(
+        self,
+        function: AnyCallable,
+        args: Iterable[Any],
+        kwargs: dict[str, Any],
+        callback: Consumer[Any],
+        error_callback: Consumer[BaseException],
+    ) -> None:
+        while True:
+            with self._pool_lock:
+                pool = self._pool
+                generation = self._generation
+
+            try:
+                pool.apply_async(
+                    function,
+                    args=args,
+                    kwds=kwargs,
+                    callback=partial(self._on_measured_task_succeeded, generation, callback),
+                    error_callback=partial(
+                        self._on_measured_task_failed, generation, error_callback
+                    ),
+                )
+                return
+            except ValueError:
+                with self._pool_lock:
+                    if pool is self._pool:
+                        raise
+
+            if __debug__:
+                self._logger.debug("The pool was retired while sending - retrying on the new one")
+
+    def _on_measured_task_succeeded(
+        self,
+        generation: int,
+        callback: Consumer[tuple[T, Optional[int]]],
+        measured_result: tuple[T, Optional[int]],
+    ) -> None:
+        self._on_task_ended_in_generation(generation, measured_result[1])
+        callback(measured_result)
+
+    def _on_measured_task_failed(
+        self, generation: int, error_callback: Consumer[BaseException], exception: BaseException
+    ) -> None:
+        self._on_task_ended_in_generation(generation, None)
+        error_callback(exception)
+
+    def _process_measured_result(self, measured_result: tuple[T, Optional[int]]) -> None:
+        self._process_worker_result(measured_result[0])
+
+    def _on_task_ended_in_generation(self, generation: int, rss_bytes: Optional[int]) -> None:
+        with self._pool_lock:
+            if generation != self._generation or self._recycling_stopped:
+                return
+
+            self._ended_tasks_in_generation += 1
+
+            if (
+                self._max_worker_rss_bytes is not None
+                and rss_bytes is not None
+                and rss_bytes > self._max_worker_rss_bytes
+            ):
+                reason = f"worker RSS of {rss_bytes} bytes"
+            elif (
+                self._max_tasks_per_pool is not None
+                and self._ended_tasks_in_generation >= self._max_tasks_per_pool
+            ):
+                reason = f"{self._ended_tasks_in_generation} tasks ended"
+            else:
+                return
+
+            self._recycle_pool(reason)
+
+    def _recycle_pool(self, reason: str) -> None:
+        retired_pool = self._pool
+
+        self._pool = self._pool_factory()
+        self._generation += 1
+        self._ended_tasks_in_generation = 0
+        self._recycle_count += 1
+
+        self._logger.warning("Process pool recycled - reason: %s", reason)
+
+        if self._metrics_sink:
+            self._metrics_sink.on_pool_recycled(reason)
+
+        retired_pool.close()
+
+        joining_thread = Thread(target=retired_pool.join, daemon=True)
+        joining_thread.start()
+        self._retired_pools.append((retired_pool, joining_thread))
@@ -0,0 +1,241 @@
+from dataclasses import dataclass, replace
+from functools import partial
+from threading import Condition, Timer
+from typing import Any, Callable, Optional, TypeVar
+
+from ...functional.retries import RetryPolicy
+from ...threading.limiters import ConcurrencyLimiter
+from . import ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import (
+    ProcessPoolFacade,
+    ShutdownReport,
+    get_deadline,
+    get_remaining_seconds,
+)
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _RetryableRequest:
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    attempts_done: int
+    weight: float = 1
+
+
+class RetryingProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade resubmitting failed requests according to a RetryPolicy.
+
+    Unlike call_with_retries(), no thread ever sleeps: a failed request is rescheduled
+    by a timer - after an exponential backoff with jitter - so neither the producers
+    nor the pool's result thread are blocked; the timer thread then waits for a free slot,
+    just like any producer.
+
+    Retries are limited both per request - by the policy's max_attempts - and across
+    the whole facade - by max_pending_retries, if not None: when that many requests are
+    already being retried, further failing requests are not retried, preventing retry storms
+    when the failure is not transient.
+
+    Only the final outcome of each request reaches _on_worker_result() or _on_worker_error();
+    closing the facade waits until every request has reached its final outcome.
+    """
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        retry_policy: RetryPolicy,
+        max_pending_retries: Optional[int] = None,
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+    ):
+        if max_pending_retries is not None and max_pending_retries < 0:
+            raise ValueError(max_pending_retries)
+
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            concurrency_limiter=concurrency_limiter,
+            metrics_sink=metrics_sink,
+        )
+
+        self._retry_policy = retry_policy
+        self._max_pending_retries = max_pending_retries
+
+        self._unsettled_count = 0
+        self._pending_retry_count = 0
+        self._retry_count = 0
+        self._waiting_retry_count = 0
+        self._retries_canceled = False
+        self._retry_condition = Condition()
+
+    @property
+    def retry_count(self) -> int:
+        """
+        How many retries have been scheduled so far.
+        """
+        return self._retry_count
+
+    @property
+    def pending_retry_count(self) -> int:
+        """
+        How many requests are currently being retried.
+        """
+        return self._pending_retry_count
+
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
+        """
+        Waits until every request has succeeded or definitively failed, then closes and joins
+        the pool; if the deadline expires first, the retries still waiting for their timer
+        are canceled - and reported as abandoned
+        """
+        deadline = get_deadline(timeout_seconds)
+
+        with self._retry_condition:
+            self._retry_condition.wait_for(
+                lambda: not self._unsettled_count, timeout=get_remaining_seconds(deadline)
+            )
+
+            self._retries_canceled = True
+            abandoned_count = self._waiting_retry_count
+
+        if abandoned_count:
+            self._logger.warning("Canceled %d scheduled retries", abandoned_count)
+
+        report = super().close_and_join(get_remaining_seconds(deadline))
+
+        return replace(report, abandoned_count=report.abandoned_count + abandoned_count)
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        kwargs = kwargs or {}
+        request = _RetryableRequest(
+            args, kwargs, attempts_done=0, weight=self._get_request_weight(args, kwargs, weight)
+        )
+
+        with self._retry_condition:
+            self._unsettled_count += 1
+
+        try:
+            sent = self._send_attempt(request, timeout_seconds)
+        except BaseException:
+            self._settle(is_retry=False)
+            raise
+
+        if not sent:
+            self._settle(is_retry=False)
+
+        return sent
+
+    def _send_attempt(
+        self, request: _RetryableRequest, timeout_seconds: Optional[float] = None
+    ) -> bool:
+        if not self._acquire_slot(timeout_seconds, request.weight):
+            return False
+
+        is_retry = request.attempts_done > 0
+
+        self._apply_async_within_slot(
+            self._worker_function,
+            args=request.args,
+            kwargs=request.kwargs,
+            result_handler=partial(self._process_attempt_result, is_retry),
+            error_handler=partial(self._process_attempt_error, request),
+            weight=request.weight,
+        )
+
+        return True
+
+    def _process_attempt_result(self, is_retry: bool, worker_result: T) -> None:
+        try:
+            self._process_worker_result(worker_result)
+        finally:
+            self._settle(is_retry)
+
+    def _process_attempt_error(self, request: _RetryableRequest, exception: BaseException) -> None:
+        attempts_done = request.attempts_done + 1
+        is_retry = request.attempts_done > 0
+
+        if self._retry_policy.should_retry(exception, attempts_done) and self._reserve_retry(
+            is_retry
+        ):
+            delay_seconds = self._retry_policy.get_delay_seconds(attempts_done)
+
+            self._logger.warning(
+                "Attempt %d failed with %r - retrying in %.3f seconds",
+                attempts_done,
+                exception,
+                delay_seconds,
+            )
+
+            retry_timer = Timer(
+                delay_seconds,
+                self._resend,
+                args=(replace(request, attempts_done=attempts_done),),
+            )
+            retry_timer.daemon = True
+            retry_timer.start()
+            return
+
+        try:
+            self._process_worker_error(exception)
+        finally:
+            self._settle(is_retry)
+
+    def _reserve_retry(self, is_retry: bool) -> bool:
+        with self._retry_condition:
+            if self._retries_canceled:
+                return False
+
+            if (
+                not is_retry
+                and self._max_pending_retries is not None
+                and self._pending_retry_count >= self._max_pending_retries
+            ):
+                return False
+
+            if not is_retry:
+                self._pending_retry_count += 1
+
+            self._retry_count += 1
+            self._waiting_retry_count += 1
+            return True
+
+    def _resend(self, request: _RetryableRequest) -> None:
+        with self._retry_condition:
+            self._waiting_retry_count -= 1
+            retries_canceled = self._retries_canceled
+
+        if retries_canceled:
+            self._settle(is_retry=True)
+            return
+
+        try:
+            self._send_attempt(request)
+        except BaseException as ex:
+            try:
+                self._process_worker_error(ex)
+            finally:
+                self._settle(is_retry=True)
+
+    def _settle(self, is_retry: bool) -> None:
+        with self._retry_condition:
+            self._unsettled_count -= 1
+
+            if is_retry:
+                self._pending_retry_count -= 1
+
+            self._retry_condition.notify_all()
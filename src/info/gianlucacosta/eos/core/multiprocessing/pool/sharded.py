@@ -0,0 +1,223 @@
+from abc import ABC, abstractmethod
+from logging import getLogger
+from multiprocessing import cpu_count
+from threading import Lock
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+from ...logic.hashing import ConsistentHashRing
+from . import ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import (
+    ProcessPoolFacade,
+    ShutdownReport,
+    get_deadline,
+    get_remaining_seconds,
+)
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+
+class _InFlightAggregator:
+    def __init__(self, metrics_sink: PoolMetricsSink, shard_count: int) -> None:
+        self.metrics_sink = metrics_sink
+        self._in_flight_by_shard = [0] * shard_count
+        self._lock = Lock()
+
+    def on_in_flight_changed(self, shard_index: int, in_flight: int) -> None:
+        with self._lock:
+            self._in_flight_by_shard[shard_index] = in_flight
+            self.metrics_sink.on_in_flight_changed(sum(self._in_flight_by_shard))
+
+
+class _ShardMetricsSink(PoolMetricsSink):
+    """
+    Forwards the measurements of a shard to the sink of the whole facade - replacing
+    the in-flight count of the shard with the total across all the shards.
+    """
+
+    def __init__(self, aggregator: _InFlightAggregator, shard_index: int) -> None:
+        self._metrics_sink = aggregator.metrics_sink
+        self._aggregator = aggregator
+        self._shard_index = shard_index
+
+    def on_admission_wait(self, wait_seconds: float) -> None:
+        self._metrics_sink.on_admission_wait(wait_seconds)
+
+    def on_in_flight_changed(self, in_flight: int) -> None:
+        self._aggregator.on_in_flight_changed(self._shard_index, in_flight)
+
+    def on_task_ended(self, latency_seconds: float, succeeded: bool) -> None:
+        self._metrics_sink.on_task_ended(latency_seconds, succeeded)
+
+    def on_worker_error(self) -> None:
+        self._metrics_sink.on_worker_error()
+
+    def on_pool_recycled(self, reason: str) -> None:
+        self._metrics_sink.on_pool_recycled(reason)
+
+
+class _ShardFacade(ProcessPoolFacade[T]):
+    def __init__(
+        self,
+        owner: "ShardedProcessPoolFacade[T]",
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        max_pending_async_requests: int,
+        worker_initializer: Optional[WorkerInitializer],
+        metrics_sink: Optional[PoolMetricsSink],
+    ) -> None:
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            metrics_sink=metrics_sink,
+        )
+        self._owner = owner
+
+    @property
+    def in_flight(self) -> int:
+        return self._concurrency_limiter.in_flight
+
+    def send(self, *args: Any, **kwargs: Any) -> None:
+        self._send_to_worker(*args, **kwargs)
+
+    def _on_worker_result(self, worker_result: T) -> None:
+        self._owner._on_worker_result(worker_result)
+
+    def _on_worker_error(self, exception: BaseException) -> None:
+        self._owner._on_worker_error(exception)
+
+
+class ShardedProcessPoolFacade(Generic[T], ABC):
+    """
+    Facade routing each request to a dedicated shard, according to a routing key - so that
+    all the requests having the same key reach the same worker, whose per-key caches
+    can actually be reused.
+
+    There are shard_count shards - by default, the number of CPUs - each with its own pool,
+    created by pool_factory: to have exactly one worker process per shard, with its own
+    inbound queue, the factory should create single-process pools - for example,
+    lambda: Pool(1).
+
+    Keys are mapped to shards via consistent hashing - see ConsistentHashRing - and each shard
+    has its own bound of pending requests: a producer only blocks when the shard of its key
+    is saturated, no matter how busy the other shards are.
+
+    Apart from requests being sent via _send_to_shard(), the facade is used just like
+    ProcessPoolFacade: subclasses implement _on_worker_result() and can override
+    _on_worker_error(); the worker_initializer - if any - creates one context per shard worker.
+
+    The metrics_sink - if any - receives the measurements of all the shards, with the number
+    of requests in flight being the total across the shards.
+    """
+
+    TSelf = TypeVar("TSelf")
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        shard_count: Optional[int] = None,
+        max_pending_async_requests_per_shard: int = 2,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+        virtual_node_count: int = 64,
+    ) -> None:
+        if shard_count is not None and shard_count < 1:
+            raise ValueError(shard_count)
+
+        if max_pending_async_requests_per_shard < 1:
+            raise ValueError(max_pending_async_requests_per_shard)
+
+        resolved_shard_count = shard_count or cpu_count()
+
+        self._shard_ring = ConsistentHashRing(
+            range(resolved_shard_count), virtual_node_count=virtual_node_count
+        )
+
+        in_flight_aggregator = (
+            _InFlightAggregator(metrics_sink, resolved_shard_count) if metrics_sink else None
+        )
+
+        self._shards = [
+            _ShardFacade(
+                owner=self,
+                pool_factory=pool_factory,
+                worker_function=worker_function,
+                max_pending_async_requests=max_pending_async_requests_per_shard,
+                worker_initializer=worker_initializer,
+                metrics_sink=(
+                    _ShardMetricsSink(in_flight_aggregator, shard_index)
+                    if in_flight_aggregator
+                    else None
+                ),
+            )
+            for shard_index in range(resolved_shard_count)
+        ]
+
+        self._logger = getLogger(type(self).__name__)
+
+    def __enter__(self: TSelf) -> TSelf:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close_and_join()
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    @property
+    def in_flight_by_shard(self) -> list[int]:
+        """
+        How many requests are pending within each shard.
+        """
+        return [shard.in_flight for shard in self._shards]
+
+    def get_shard_index(self, routing_key: Hashable) -> int:
+        """
+        Returns the index of the shard receiving the requests with the given routing key.
+        """
+        return self._shard_ring.get_node(routing_key)
+
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
+        """
+        Closes and joins the pools of all the shards - within a single deadline, if
+        timeout_seconds is not None - returning the overall report
+        """
+        deadline = get_deadline(timeout_seconds)
+
+        if __debug__:
+            self._logger.info("Shutting down %d shards...", len(self._shards))
+
+        reports = [shard.close_and_join(get_remaining_seconds(deadline)) for shard in self._shards]
+
+        if __debug__:
+            self._logger.info("All the shards are stopped!")
+
+        return ShutdownReport(
+            completed_count=sum(report.completed_count for report in reports),
+            failed_count=sum(report.failed_count for report in reports),
+            abandoned_count=sum(report.abandoned_count for report in reports),
+        )
+
+    def _send_to_shard(self, routing_key: Hashable, *args: Any, **kwargs: Any) -> None:
+        """
+        Sends the request to the shard owning the routing key - blocking while such shard
+        has too many pending requests.
+        """
+        shard_index = self.get_shard_index(routing_key)
+
+        if __debug__:
+            self._logger.debug("Routing key %r to shard %d", routing_key, shard_index)
+
+        self._shards[shard_index].send(*args, **kwargs)
+
+    @abstractmethod
+    def _on_worker_result(self, worker_result: T) -> None:
+        pass
+
+    def _on_worker_error(self, exception: BaseException) -> None:
+        pass
@@ -0,0 +1,316 @@
+from array import array
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+
+from ...threading.limiters import ConcurrencyLimiter
+from ..arena import (
+    SharedBufferHandle,
+    SharedMemoryArena,
+    attach_shared_buffer,
+    close_segment_quietly,
+    create_segment,
+    get_byte_count,
+    get_segment_buffer,
+    is_shared_buffer_source,
+    share_resource_tracker,
+    unlink_segment,
+    write_to_segment,
+)
+from . import ProcessPoolFactory
+from .context import WorkerInitializer
+from .facade import ProcessPoolFacade, ShutdownReport
+from .metrics import PoolMetricsSink
+
+T = TypeVar("T")
+
+
+class SharedBuffer:
+    """
+    Buffer allocated from the shared memory arena of a SharedMemoryProcessPoolFacade.
+
+    Write your data into its view, then pass the buffer itself as an argument to
+    _send_to_worker() - or _try_send_to_worker(): the worker function will receive a memoryview
+    of the very same memory, without any copy.
+
+    Once sent, the buffer belongs to the facade - which recycles it as soon as the task ends -
+    so its view must not be used anymore.
+    """
+
+    def __init__(self, segment: SharedMemory, byte_count: int) -> None:
+        self._segment = segment
+        self._byte_count = byte_count
+
+    @property
+    def view(self) -> memoryview:
+        return get_segment_buffer(self._segment)[: self._byte_count]
+
+    @property
+    def handle(self) -> SharedBufferHandle:
+        return SharedBufferHandle(segment_name=self._segment.name, byte_count=self._byte_count)
+
+
+def call_with_shared_buffers(
+    worker_function: Callable[..., Any],
+    min_shared_result_bytes: Optional[int],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Runs within the worker process, replacing each SharedBufferHandle argument with a
+    memoryview of the related shared buffer before calling the worker function.
+
+    The views are only valid during the call; if min_shared_result_bytes is set, a
+    buffer-like result having at least that size is returned via a new shared memory segment,
+    whose handle is returned in lieu of the buffer - and which is owned by the caller process,
+    in charge of unlinking it.
+    """
+    segments: list[SharedMemory] = []
+    views: list[memoryview] = []
+
+    def resolve(value: Any) -> Any:
+        if not isinstance(value, SharedBufferHandle):
+            return value
+
+        segment, view = attach_shared_buffer(value)
+        segments.append(segment)
+        views.append(view)
+        return view
+
+    try:
+        result = worker_function(
+            *(resolve(arg) for arg in args),
+            **{key: resolve(value) for key, value in kwargs.items()},
+        )
+
+        return _prepare_result(result, min_shared_result_bytes)
+    finally:
+        for view in views:
+            try:
+                view.release()
+            except BufferError:
+                pass
+
+        for segment in segments:
+            close_segment_quietly(segment)
+
+
+def _prepare_result(result: Any, min_shared_result_bytes: Optional[int]) -> Any:
+    if not is_shared_buffer_source(result):
+        return result
+
+    byte_count = get_byte_count(result)
+
+    if min_shared_result_bytes is None or byte_count < min_shared_result_bytes:
+        return bytes(result) if isinstance(result, memoryview) else result
+
+    segment = create_segment(byte_count, track=False)
+    try:
+        return write_to_segment(segment, result)
+    except BaseException:
+        unlink_segment(segment)
+        raise
+    finally:
+        close_segment_quietly(segment)
+
+
+def read_shared_result(handle: SharedBufferHandle) -> Any:
+    """
+    Copies the result referenced by the handle out of its segment - which is then unlinked,
+    as the caller owns it.
+
+    Arrays are returned as arrays having the original type code; any other buffer as bytes.
+    """
+    segment, view = attach_shared_buffer(handle, track=True)
+
+    try:
+        return array(handle.format, view) if handle.format != "B" else bytes(view)
+    finally:
+        view.release()
+        unlink_segment(segment)
+
+
+class SharedMemoryProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade passing large buffers to the worker processes via shared memory,
+    instead of pickling them through a pipe.
+
+    When calling _send_to_worker():
+
+    * any bytes, bytearray, memoryview or array argument having at least min_shared_bytes
+      is copied into a shared memory segment - taken from an internal arena, to reuse
+      segments across tasks - and only a handle is sent to the worker process
+
+    * any SharedBuffer argument - obtained via allocate_shared_buffer() - is sent as a handle
+      without any copy
+
+    In both cases, the worker function receives a memoryview of the shared buffer - valid only
+    during the call - and the segment goes back to the arena as soon as the task ends,
+    no matter whether it succeeds or fails.
+
+    Should _try_send_to_worker() reject a request, its SharedBuffer arguments still belong to
+    the caller, while the segments copied for the other arguments are recycled.
+
+    If share_results is True, buffer-like results having at least min_shared_bytes come back
+    via shared memory as well - and reach _on_worker_result() as bytes, or as arrays.
+
+    Closing the facade unlinks all the segments of the arena - including the segments of
+    the tasks abandoned when the shutdown deadline expires.
+
+    Segments are always unlinked by the process creating the facade - which starts its
+    resource tracker before creating the pool, so that the worker processes share it.
+    """
+
+    def __init__(
+        self,
+        pool_factory: ProcessPoolFactory,
+        worker_function: Callable[..., T],
+        min_shared_bytes: int = 1024 * 1024,
+        share_results: bool = True,
+        max_idle_segments: int = 16,
+        max_pending_async_requests: Optional[int] = None,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        metrics_sink: Optional[PoolMetricsSink] = None,
+    ):
+        if min_shared_bytes < 1:
+            raise ValueError(min_shared_bytes)
+
+        share_resource_tracker()
+
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
+            concurrency_limiter=concurrency_limiter,
+            metrics_sink=metrics_sink,
+        )
+
+        self._min_shared_bytes = min_shared_bytes
+        self._share_results = share_results
+        self._arena = SharedMemoryArena(max_idle_segments=max_idle_segments)
+        self._outstanding_segments: dict[int, list[SharedMemory]] = {}
+        self._outstanding_segments_lock = Lock()
+
+    def close_and_join(self, timeout_seconds: Optional[float] = None) -> ShutdownReport:
+        """
+        Closes and joins the pool, then releases all the shared memory segments - including
+        the ones still acquired by abandoned tasks.
+        """
+        try:
+            return super().close_and_join(timeout_seconds)
+        finally:
+            with self._outstanding_segments_lock:
+                abandoned_segment_lists = list(self._outstanding_segments.values())
+
+            for segments in abandoned_segment_lists:
+                self._release_segments(segments)
+
+            self._arena.close()
+
+    def allocate_shared_buffer(self, byte_count: int) -> SharedBuffer:
+        """
+        Returns a shared buffer that can be filled, then passed to _send_to_worker()
+        without any copy.
+        """
+        return SharedBuffer(self._arena.acquire(byte_count), byte_count)
+
+    def _try_send_to_worker(
+        self,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        timeout_seconds: Optional[float] = 0,
+        weight: Optional[float] = None,
+    ) -> bool:
+        kwargs = kwargs or {}
+        weight = self._get_request_weight(args, kwargs, weight)
+
+        segments: list[SharedMemory] = []
+
+        with self._outstanding_segments_lock:
+            self._outstanding_segments[id(segments)] = segments
+
+        try:
+            shared_args = tuple(self._share_argument(arg, segments) for arg in args)
+            shared_kwargs = {
+                key: self._share_argument(value, segments) for key, value in kwargs.items()
+            }
+        except BaseException:
+            self._release_segments(segments)
+            raise
+
+        try:
+            slot_acquired = self._acquire_slot(timeout_seconds, weight)
+        except BaseException:
+            self._release_segments(segments)
+            raise
+
+        if not slot_acquired:
+            caller_segment_ids = {
+                id(value._segment)
+                for value in (*args, *kwargs.values())
+                if isinstance(value, SharedBuffer)
+            }
+            segments[:] = [
+                segment for segment in segments if id(segment) not in caller_segment_ids
+            ]
+            self._release_segments(segments)
+            return False
+
+        def result_handler(worker_result: Any) -> None:
+            self._release_segments(segments)
+
+            if isinstance(worker_result, SharedBufferHandle):
+                worker_result = read_shared_result(worker_result)
+
+            self._process_worker_result(worker_result)
+
+        def error_handler(exception: BaseException) -> None:
+            self._release_segments(segments)
+            self._process_worker_error(exception)
+
+        try:
+            self._apply_async_within_slot(
+                partial(
+                    call_with_shared_buffers,
+                    self._worker_function,
+                    self._min_shared_bytes if self._share_results else None,
+                ),
+                args=shared_args,
+                kwargs=shared_kwargs,
+                result_handler=result_handler,
+                error_handler=error_handler,
+                weight=weight,
+            )
+        except BaseException:
+            self._release_segments(segments)
+            raise
+
+        return True
+
+    def _share_argument(self, value: Any, segments: list[SharedMemory]) -> Any:
+        if isinstance(value, SharedBuffer):
+            segments.append(value._segment)
+            return value.handle
+
+        if not is_shared_buffer_source(value):
+            return value
+
+        byte_count = get_byte_count(value)
+        if byte_count < self._min_shared_bytes:
+            return value
+
+        segment = self._arena.acquire(byte_count)
+        segments.append(segment)
+
+        return write_to_segment(segment, value)
+
+    def _release_segments(self, segments: list[SharedMemory]) -> None:
+        with self._outstanding_segments_lock:
+            if self._outstanding_segments.pop(id(segments), None) is None:
+                return
+
+        for segment in segments:
+            self._arena.release(segment)
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from queue import Queue
+from threading import Event, Semaphore, Thread
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
+
+from .facade import ProcessPoolFacade
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _StreamedResult:
+    index: int
+    value: Any
+
+
+@dataclass(frozen=True)
+class _StreamedError:
+    index: int
+    exception: BaseException
+
+
+@dataclass(frozen=True)
+class _InputEnd:
+    item_count: int
+
+
+@dataclass(frozen=True)
+class _InputError:
+    exception: BaseException
+
+
+_StreamEvent = Union[_StreamedResult, _StreamedError, _InputEnd, _InputError]
+
+
+class StreamingProcessPoolFacade(ProcessPoolFacade[T]):
+    """
+    ProcessPoolFacade whose results can be consumed as an iterator, via submit_many().
+
+    Results do not flow through _on_worker_result() - which is a no-op here - but are
+    yielded by the iterator returned by submit_many(); consequently, this class can be
+    used directly, without subclassing.
+    """
+
+    def submit_many(
+        self,
+        argument_tuples: Iterable[tuple[Any, ...]],
+        ordered: bool = True,
+        max_buffered_results: Optional[int] = None,
+    ) -> Iterator[T]:
+        """
+        Sends each tuple of positional arguments to the worker function, returning an iterator
+        over the results.
+
+        * the input is consumed lazily - by a dedicated thread, started at the first iteration -
+          so it can be a huge or even infinite generator
+
+        * in ordered mode, results are yielded in the same order as the inputs; otherwise,
+          they are yielded as soon as they arrive
+
+        * max_buffered_results - by default, twice the current limit of pending requests - is the
+          maximum number of results submitted but not yet yielded: in ordered mode, it bounds
+          the reorder buffer, so memory stays constant even if a task is much slower than
+          the following ones
+
+        * the first exception raised by the worker function - or by the input iterable - is
+          re-raised by the iterator, which ends; in ordered mode, a worker exception waits in
+          the reorder buffer - just like results - so it is only re-raised after yielding the
+          results of all the previous inputs
+
+        * exceptions raised by the worker function are also passed to the usual error path
+          of the facade - logging, metrics sink and _on_worker_error()
+
+        Closing the iterator before its end stops the submission of further inputs.
+        """
+        if max_buffered_results is not None and max_buffered_results < 1:
+            raise ValueError(max_buffered_results)
+
+        window = Semaphore(max_buffered_results or 2 * self._concurrency_limiter.limit)
+        events: Queue[_StreamEvent] = Queue()
+        stopped = Event()
+
+        def feed() -> None:
+            item_count = 0
+
+            try:
+                for args in argument_tuples:
+                    window.acquire()
+
+                    if stopped.is_set():
+                        return
+
+                    self._submit_indexed(events, item_count, args)
+                    item_count += 1
+            except Exception as ex:
+                events.put(_InputError(ex))
+            else:
+                events.put(_InputEnd(item_count))
+
+        return self._iterate_results(feed, window, events, stopped, ordered)
+
+    def _submit_indexed(
+        self, events: "Queue[_StreamEvent]", index: int, args: tuple[Any, ...]
+    ) -> None:
+        def handle_error(exception: BaseException) -> None:
+            try:
+                self._process_worker_error(exception)
+            finally:
+                events.put(_StreamedError(index, exception))
+
+        self._apply_async(
+            self._worker_function,
+            args=args,
+            kwargs={},
+            result_handler=lambda result: events.put(_StreamedResult(index, result)),
+            error_handler=handle_error,
+        )
+
+    def _iterate_results(
+        self,
+        feed: Callable[[], None],
+        window: Semaphore,
+        events: "Queue[_StreamEvent]",
+        stopped: Event,
+        ordered: bool,
+    ) -> Iterator[T]:
+        feeder = Thread(target=feed, name="StreamingFeeder", daemon=True)
+        feeder.start()
+
+        reorder_buffer: dict[int, Union[_StreamedResult, _StreamedError]] = {}
+        next_index = 0
+        yielded_count = 0
+        item_count: Optional[int] = None
+
+        try:
+            while item_count is None or yielded_count < item_count:
+                event = events.get()
+
+                match event:
+                    case _InputEnd():
+                        item_count = event.item_count
+
+                    case _InputError(exception=exception):
+                        raise exception
+
+                    case _StreamedError(exception=exception) if not ordered:
+                        raise exception
+
+                    case _StreamedResult() if not ordered:
+                        window.release()
+                        yielded_count += 1
+                        yield event.value
+
+                    case _StreamedResult() | _StreamedError():
+                        reorder_buffer[event.index] = event
+
+                        while next_index in reorder_buffer:
+                            buffered_event = reorder_buffer.pop(next_index)
+                            next_index += 1
+
+                            if isinstance(buffered_event, _StreamedError):
+                                raise buffered_event.exception
+
+                            window.release()
+                            yielded_count += 1
+                            yield buffered_event.value
+        finally:
+            stopped.set()
+            window.release()
+
+    def _on_worker_result(self, worker_result: T) -> None:
+        pass
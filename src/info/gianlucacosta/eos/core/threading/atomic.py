@@ -1,9 +1,12 @@
 from threading import Lock
-from typing import Generic, TypeVar
+from types import MappingProxyType
+from typing import Generic, Iterable, Iterator, Mapping, Optional, TypeVar, Union, overload
 
 from ..functional import Mapper
 
 T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
 
 
 class Atomic(Generic[T]):
@@ -63,3 +66,177 @@ class Atomic(Generic[T]):
         """
         with self._lock:
             self._value = mapper(self._value)
+
+
+class AtomicReference(Generic[T]):
+    """
+    Reference to a value that should be immutable - read without any lock.
+
+    Reading just returns the current reference, so readers never wait for each other
+    or for writers; writers publish a brand-new value - the current one must never be
+    mutated in place - and are serialized by a Lock.
+
+    In addition to set(), the reference can be changed via compare_and_set() or via update(),
+    which retries a mapper until no other writer interferes - so the mapper should be
+    pure and cheap.
+    """
+
+    def __init__(self, initial_value: T):
+        self._value = initial_value
+        self._write_lock = Lock()
+
+    def get(self) -> T:
+        """
+        Returns the current value - without locking.
+        """
+        return self._value
+
+    def set(self, new_value: T) -> None:
+        with self._write_lock:
+            self._value = new_value
+
+    def compare_and_set(self, expected_value: T, new_value: T) -> bool:
+        """
+        Atomically sets the new value only if the current value is - by identity -
+        the expected one; returns whether the value was set.
+        """
+        with self._write_lock:
+            if self._value is not expected_value:
+                return False
+
+            self._value = new_value
+            return True
+
+    def update(self, mapper: Mapper[T, T]) -> T:
+        """
+        Optimistically applies the mapper to the current value, retrying if another writer
+        changed the value in the meantime; returns the new value.
+        """
+        while True:
+            current_value = self._value
+            new_value = mapper(current_value)
+
+            if self.compare_and_set(current_value, new_value):
+                return new_value
+
+
+class AtomicDict(Generic[K, V]):
+    """
+    Copy-on-write dictionary, optimized for reads: every change publishes a new version
+    via an AtomicReference, so readers never lock.
+
+    snapshot() returns a read-only view of the current version - that never changes,
+    even while writers publish new versions - and iterating this dictionary actually iterates
+    over such a snapshot.
+
+    Each write copies the whole dictionary, so it is suitable for small, read-mostly data -
+    such as configurations and routing tables.
+    """
+
+    def __init__(self, initial_items: Optional[Mapping[K, V]] = None):
+        self._reference = AtomicReference[dict[K, V]](dict(initial_items or {}))
+
+    def snapshot(self) -> Mapping[K, V]:
+        return MappingProxyType(self._reference.get())
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        return self._reference.get().get(key, default)
+
+    def __getitem__(self, key: K) -> V:
+        return self._reference.get()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._reference.get()
+
+    def __len__(self) -> int:
+        return len(self._reference.get())
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._reference.get())
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._reference.update(lambda items: {**items, key: value})
+
+    def __delitem__(self, key: K) -> None:
+        def remove_key(items: dict[K, V]) -> dict[K, V]:
+            new_items = dict(items)
+            del new_items[key]
+            return new_items
+
+        self._reference.update(remove_key)
+
+    def update(self, new_items: Mapping[K, V]) -> None:
+        """
+        Adds or replaces all the given items - in a single version.
+        """
+        self._reference.update(lambda items: {**items, **new_items})
+
+    def clear(self) -> None:
+        self._reference.set({})
+
+
+class AtomicList(Generic[T]):
+    """
+    Copy-on-write list, optimized for reads: every change publishes a new version - a tuple -
+    via an AtomicReference, so readers never lock.
+
+    snapshot() returns the current version, that never changes; iterating this list actually
+    iterates over such a snapshot.
+
+    Each write copies the whole list, so it is suitable for small, read-mostly data - such as
+    listener lists.
+    """
+
+    def __init__(self, initial_items: Iterable[T] = ()):
+        self._reference = AtomicReference[tuple[T, ...]](tuple(initial_items))
+
+    def snapshot(self) -> tuple[T, ...]:
+        return self._reference.get()
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[T, ...]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, tuple[T, ...]]:
+        return self._reference.get()[index]
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._reference.get()
+
+    def __len__(self) -> int:
+        return len(self._reference.get())
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._reference.get())
+
+    def __setitem__(self, index: int, item: T) -> None:
+        def replace_item(items: tuple[T, ...]) -> tuple[T, ...]:
+            new_items = list(items)
+            new_items[index] = item
+            return tuple(new_items)
+
+        self._reference.update(replace_item)
+
+    def append(self, item: T) -> None:
+        self._reference.update(lambda items: items + (item,))
+
+    def extend(self, new_items: Iterable[T]) -> None:
+        added_items = tuple(new_items)
+        self._reference.update(lambda items: items + added_items)
+
+    def remove(self, item: T) -> None:
+        """
+        Removes the first occurrence of the item - raising ValueError if missing.
+        """
+
+        def remove_item(items: tuple[T, ...]) -> tuple[T, ...]:
+            new_items = list(items)
+            new_items.remove(item)
+            return tuple(new_items)
+
+        self._reference.update(remove_item)
+
+    def clear(self) -> None:
+        self._reference.set(())
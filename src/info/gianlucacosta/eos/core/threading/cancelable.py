@@ -1,6 +1,66 @@
 from abc import ABC, abstractmethod
-from threading import Thread
-from typing import Any, Optional
+from contextlib import contextmanager
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Iterator, Optional
+
+
+class CancelationToken:
+    """
+    Event-driven cancelation flag, that can be shared by any number of threads.
+
+    Calling the token returns True until cancel() is called - so it can be passed wherever a
+    ContinuationProvider is expected; but, unlike a plain ContinuationProvider, it can also
+    wake up the threads blocked on a Condition - for example, within the cancelable queue
+    operations - as soon as the cancelation is requested, without any polling.
+    """
+
+    def __init__(self) -> None:
+        self._canceled_event = Event()
+        self._watched_conditions: list[Condition] = []
+        self._lock = Lock()
+
+    def __call__(self) -> bool:
+        return not self._canceled_event.is_set()
+
+    @property
+    def canceled(self) -> bool:
+        return self._canceled_event.is_set()
+
+    def cancel(self) -> None:
+        """
+        Sets the token as canceled - waking up all the threads waiting on it.
+        """
+        with self._lock:
+            self._canceled_event.set()
+            watched_conditions = list(self._watched_conditions)
+
+        for condition in watched_conditions:
+            with condition:
+                condition.notify_all()
+
+    def wait(self, timeout_seconds: Optional[float] = None) -> bool:
+        """
+        Blocks until the token is canceled - or until the timeout, if not None, expires.
+
+        Returns whether the token is canceled.
+        """
+        return self._canceled_event.wait(timeout_seconds)
+
+    @contextmanager
+    def watching(self, condition: Condition) -> Iterator[None]:
+        """
+        Within this context, cancel() also calls notify_all() on the given condition - so that
+        its waiters can check the token; the condition's lock must not be held by the thread
+        calling cancel().
+        """
+        with self._lock:
+            self._watched_conditions.append(condition)
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._watched_conditions.remove(condition)
 
 
 class CancelableThread(Thread, ABC):
@@ -12,11 +72,16 @@ class CancelableThread(Thread, ABC):
 
     It is up to you to implement the run() method in a way that keeps track of
     that flag - which is also accessible via a read-only property.
+
+    The request is also propagated to a CancelationToken - accessible via the
+    cancelation_token property - that can be passed to blocking operations, such as
+    the adaptive queue readers and writers, to stop them immediately.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._never_canceled = True
+        self._cancelation_token = CancelationToken()
 
     def request_cancel(self) -> None:
         """
@@ -25,6 +90,14 @@ class CancelableThread(Thread, ABC):
         The actual effect only depends on the thread implementation.
         """
         self._never_canceled = False
+        self._cancelation_token.cancel()
+
+    @property
+    def cancelation_token(self) -> CancelationToken:
+        """
+        Token canceled as soon as request_cancel() is called.
+        """
+        return self._cancelation_token
 
     @property
     def never_canceled(self) -> bool:
@@ -0,0 +1,286 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import count
+from threading import Condition
+from time import monotonic
+from typing import Optional
+
+from ..logic.ranges import InclusiveRange, RangedCounter
+
+
+class ConcurrencyLimiter(ABC):
+    """
+    Bounds how many operations can be in flight at the same time.
+
+    Each operation must call acquire() before starting and release() once ended - passing
+    how long it took and whether it succeeded, so that adaptive implementations can tune
+    their limit.
+    """
+
+    @property
+    @abstractmethod
+    def limit(self) -> int:
+        """
+        The current maximum number of operations in flight.
+        """
+
+    @property
+    @abstractmethod
+    def in_flight(self) -> int:
+        """
+        The number of operations currently in flight.
+        """
+
+    @abstractmethod
+    def acquire(self, timeout_seconds: Optional[float] = None) -> bool:
+        """
+        Blocks until an operation can start - or until the timeout, if not None, expires.
+
+        Returns True if the caller can start the operation, False on timeout.
+        """
+
+    @abstractmethod
+    def release(self, latency_seconds: float, succeeded: bool = True) -> None:
+        """
+        Notifies the limiter that an operation has ended.
+        """
+
+
+class _ConditionConcurrencyLimiter(ConcurrencyLimiter):
+    """
+    Base limiter that counts the operations in flight under a Condition, letting subclasses
+    only define the limit and how it reacts to ended operations.
+    """
+
+    def __init__(self) -> None:
+        self._condition = Condition()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout_seconds: Optional[float] = None) -> bool:
+        deadline = monotonic() + timeout_seconds if timeout_seconds is not None else None
+
+        with self._condition:
+            while self._in_flight >= self.limit:
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+
+                remaining_seconds = deadline - monotonic()
+                if remaining_seconds <= 0:
+                    return False
+
+                self._condition.wait(remaining_seconds)
+
+            self._in_flight += 1
+            self._on_acquired()
+
+            return True
+
+    def release(self, latency_seconds: float, succeeded: bool = True) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._on_released(latency_seconds, succeeded)
+            self._condition.notify_all()
+
+    def _on_acquired(self) -> None:
+        pass
+
+    def _on_released(self, latency_seconds: float, succeeded: bool) -> None:
+        pass
+
+
+class FixedConcurrencyLimiter(_ConditionConcurrencyLimiter):
+    """
+    Limiter with a limit that never changes - just like a Semaphore.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(limit)
+
+        super().__init__()
+        self._limit = limit
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+
+class AdaptiveConcurrencyLimiter(_ConditionConcurrencyLimiter):
+    """
+    Limiter whose limit varies within the given range, according to the observed latency -
+    via an AIMD (additive increase, multiplicative decrease) policy.
+
+    The baseline latency is the minimum latency observed within the latest window of
+    operations - so that it can follow slow changes of the workload.
+
+    Whenever an operation ends:
+
+    * if it failed, or its latency exceeds the baseline multiplied by latency_tolerance,
+      the system is considered saturated and the limit is multiplied by decrease_factor -
+      at most once per "round", that is, once per limit operations
+
+    * otherwise, if the limit was actually reached - so that more concurrency could help -
+      the limit grows by 1 / limit, that is, approximately by 1 per round
+
+    The limit starts from initial_limit - by default, the lower bound of the range.
+    """
+
+    def __init__(
+        self,
+        limit_range: InclusiveRange,
+        initial_limit: Optional[float] = None,
+        latency_tolerance: float = 2,
+        decrease_factor: float = 0.9,
+        baseline_window_size: int = 100,
+    ) -> None:
+        if limit_range.lower < 1:
+            raise ValueError(limit_range.lower)
+
+        if latency_tolerance < 1:
+            raise ValueError(latency_tolerance)
+
+        if not 0 < decrease_factor < 1:
+            raise ValueError(decrease_factor)
+
+        if baseline_window_size < 1:
+            raise ValueError(baseline_window_size)
+
+        super().__init__()
+
+        self._limit = RangedCounter(
+            limit_range,
+            initial_limit if initial_limit is not None else limit_range.lower,
+        )
+        self._latency_tolerance = latency_tolerance
+        self._decrease_factor = decrease_factor
+        self._baseline_window_size = baseline_window_size
+
+        self._limit_reached = False
+
+        self._baseline_latency: Optional[float] = None
+        self._window_min_latency: Optional[float] = None
+        self._window_sample_count = 0
+        self._operations_since_decrease = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit.value)
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """
+        The latency currently considered normal - None until the first operation ends.
+        """
+        return self._baseline_latency
+
+    def _on_acquired(self) -> None:
+        if self._in_flight >= self.limit:
+            self._limit_reached = True
+
+    def _on_released(self, latency_seconds: float, succeeded: bool) -> None:
+        self._update_baseline(latency_seconds)
+        self._operations_since_decrease += 1
+
+        baseline_latency = self._baseline_latency or latency_seconds
+        saturated = not succeeded or (latency_seconds > baseline_latency * self._latency_tolerance)
+
+        if saturated:
+            if self._operations_since_decrease >= self.limit:
+                self._limit.value *= self._decrease_factor
+                self._operations_since_decrease = 0
+        elif self._limit_reached:
+            self._limit.value += 1 / self._limit.value
+            self._limit_reached = False
+
+    def _update_baseline(self, latency_seconds: float) -> None:
+        if self._window_min_latency is None or latency_seconds < self._window_min_latency:
+            self._window_min_latency = latency_seconds
+
+        if self._baseline_latency is None or latency_seconds < self._baseline_latency:
+            self._baseline_latency = latency_seconds
+
+        self._window_sample_count += 1
+
+        if self._window_sample_count >= self._baseline_window_size:
+            self._baseline_latency = self._window_min_latency
+            self._window_min_latency = None
+            self._window_sample_count = 0
+
+
+class WeightBudget:
+    """
+    Bounds the total weight - for example, the payload bytes - of the operations in flight.
+
+    Each operation acquires its weight before starting and releases it once ended;
+    an operation heavier than the whole capacity can still start, but only when no other
+    operation is in flight - so that it never waits forever.
+
+    Waiting operations are served in FIFO order: a light operation cannot overtake a heavier
+    one that is already waiting - which would otherwise starve whenever light operations
+    keep arriving.
+    """
+
+    def __init__(self, capacity: float) -> None:
+        if capacity <= 0:
+            raise ValueError(capacity)
+
+        self._capacity = capacity
+        self._in_use = 0.0
+        self._tickets = count()
+        self._waiting_tickets: deque[int] = deque()
+        self._condition = Condition()
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    @property
+    def in_use(self) -> float:
+        """
+        The total weight of the operations in flight.
+        """
+        return self._in_use
+
+    def acquire(self, weight: float, timeout_seconds: Optional[float] = None) -> bool:
+        """
+        Blocks until the given weight fits the budget - or until the timeout, if not None,
+        expires.
+
+        Returns True if the caller can start the operation, False on timeout.
+        """
+        if weight < 0:
+            raise ValueError(weight)
+
+        with self._condition:
+            if not self._waiting_tickets and self._fits(weight):
+                self._in_use += weight
+                return True
+
+            ticket = next(self._tickets)
+            self._waiting_tickets.append(ticket)
+
+            acquired = self._condition.wait_for(
+                lambda: self._waiting_tickets[0] == ticket and self._fits(weight),
+                timeout=timeout_seconds,
+            )
+
+            self._waiting_tickets.remove(ticket)
+            self._condition.notify_all()
+
+            if acquired:
+                self._in_use += weight
+
+            return acquired
+
+    def _fits(self, weight: float) -> bool:
+        return not self._in_use or self._in_use + weight <= self._capacity
+
+    def release(self, weight: float) -> None:
+        with self._condition:
+            self._in_use = max(self._in_use - weight, 0)
+            self._condition.notify_all()
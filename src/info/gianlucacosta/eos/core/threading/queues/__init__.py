@@ -1,9 +1,12 @@
+from multiprocessing.queues import Queue as ProcessQueue
 from queue import Queue
-from typing import Callable, Iterable, TypeVar
+from typing import Callable, Iterable, TypeVar, Union
 
 from ...functional import ContinuationProvider
 
 T = TypeVar("T")
 
-QueueWriter = Callable[[Queue[T], ContinuationProvider, Iterable[T]], None]
-QueueReader = Callable[[Queue[T], ContinuationProvider], None]
+AnyQueue = Union[Queue[T], "ProcessQueue[T]"]
+
+QueueWriter = Callable[[AnyQueue[T], ContinuationProvider, Iterable[T]], None]
+QueueReader = Callable[[AnyQueue[T], ContinuationProvider], None]
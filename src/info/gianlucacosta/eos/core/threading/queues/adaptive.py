@@ -1,10 +1,17 @@
+from functools import partial
 from logging import getLogger
+from multiprocessing.queues import JoinableQueue
 from queue import Empty, Full, Queue
-from typing import Iterable, TypeVar
+from time import monotonic
+from typing import Iterable, Optional, TypeVar
 
-from ...functional import Consumer, ContinuationProvider
-from ...logic.ranges import InclusiveRange, RangedCounter
-from . import QueueReader, QueueWriter
+from ...functional import Consumer, ContinuationProvider, Producer
+from ...logic.ranges import InclusiveRange
+from ..cancelable import CancelationToken
+from . import AnyQueue, QueueReader, QueueWriter
+from .cancelable import get_cancelable, put_cancelable
+from .telemetry import QueueLoopState, QueueTelemetryRegistry
+from .timeouts import MultiplicativeTimeoutController, TimeoutController
 
 T = TypeVar("T")
 
@@ -12,9 +19,75 @@ T = TypeVar("T")
 logger = getLogger(__name__)
 
 
+def _get_item(
+    queue: AnyQueue[T], continuation_provider: ContinuationProvider, timeout_seconds: float
+) -> T:
+    if isinstance(continuation_provider, CancelationToken) and isinstance(queue, Queue):
+        return get_cancelable(queue, continuation_provider)
+
+    return queue.get(timeout=timeout_seconds)
+
+
+def _put_item(
+    queue: AnyQueue[T],
+    continuation_provider: ContinuationProvider,
+    item: T,
+    timeout_seconds: float,
+) -> None:
+    if isinstance(continuation_provider, CancelationToken) and isinstance(queue, Queue):
+        put_cancelable(queue, item, continuation_provider)
+    else:
+        queue.put(item, timeout=timeout_seconds)
+
+
+def _mark_task_done(queue: AnyQueue[T]) -> None:
+    if isinstance(queue, (Queue, JoinableQueue)):
+        queue.task_done()
+
+
+def _get_timeout_controller_factory(
+    timeout_seconds_range: Optional[InclusiveRange],
+    timeout_factor: Optional[float],
+    timeout_controller_factory: Optional[Producer[TimeoutController]],
+) -> Producer[TimeoutController]:
+    if timeout_controller_factory is not None:
+        if timeout_seconds_range is not None or timeout_factor is not None:
+            raise ValueError(timeout_controller_factory)
+
+        return timeout_controller_factory
+
+    if timeout_seconds_range is None:
+        raise ValueError(timeout_seconds_range)
+
+    if timeout_factor is None:
+        raise ValueError(timeout_factor)
+
+    if timeout_factor < 1:
+        raise ValueError(timeout_factor)
+
+    return partial(MultiplicativeTimeoutController, timeout_seconds_range, timeout_factor)
+
+
+def _start_loop(
+    agent_name: str,
+    queue: AnyQueue[T],
+    timeout_controller_factory: Producer[TimeoutController],
+    telemetry_registry: Optional[QueueTelemetryRegistry],
+) -> QueueLoopState:
+    loop_state = QueueLoopState(agent_name, queue, timeout_controller_factory())
+
+    if telemetry_registry is not None:
+        telemetry_registry.register(loop_state)
+
+    return loop_state
+
+
 def create_adaptive_queue_writer(
-    timeout_seconds_range: InclusiveRange,
-    timeout_factor: float,
+    timeout_seconds_range: Optional[InclusiveRange] = None,
+    timeout_factor: Optional[float] = None,
+    timeout_controller_factory: Optional[Producer[TimeoutController]] = None,
+    telemetry_registry: Optional[QueueTelemetryRegistry] = None,
+    agent_name: str = "writer",
 ) -> QueueWriter[T]:
     """
     Higher-order function that, via the given parameters, creates a function for writing items
@@ -22,7 +95,7 @@ def create_adaptive_queue_writer(
 
     More precisely, the returned function has this signature:
 
-    (Queue[T], ContinuationProvider, Iterable[T]) -> None
+    (AnyQueue[T], ContinuationProvider, Iterable[T]) -> None
 
     that is, it takes:
 
@@ -45,50 +118,75 @@ def create_adaptive_queue_writer(
     of the requested range: when the enqueuing fails because the queue is Full, the timeout
     is multiplied by the given factor, otherwise it is divided by the factor - always remaining
     in the range passed to the higher-order function.
-    """
-    if timeout_factor < 1:
-        raise ValueError(timeout_factor)
 
-    timeout_seconds = RangedCounter(
-        inclusive_range=timeout_seconds_range,
-        initial_value=timeout_seconds_range.lower,
+    Alternatively, you can pass just a factory of TimeoutController - for example, one of the
+    controllers in the "timeouts" module - to apply a different timeout policy.
+
+    Each call of the returned function has its own adaptive state - including a brand-new
+    TimeoutController - so it can be shared by threads writing to different queues; if a
+    QueueTelemetryRegistry is passed, each call also registers its live telemetry into it,
+    labeled with agent_name.
+
+    If the ContinuationProvider is a CancelationToken, there is no polling at all: the writer
+    blocks until the queue has room for the item, and stops as soon as the token is canceled.
+
+    The target queue can also be a multiprocessing.Queue - or JoinableQueue - to feed another
+    process; in this case, a CancelationToken is just polled like any ContinuationProvider,
+    and you can put lists created by batch_items() - in the "batching" module - to reduce
+    the pickling and pipe overhead.
+    """
+    timeout_controller_factory = _get_timeout_controller_factory(
+        timeout_seconds_range, timeout_factor, timeout_controller_factory
     )
 
     def writer(
-        queue: Queue[T],
+        queue: AnyQueue[T],
         continuation_provider: ContinuationProvider,
         items: Iterable[T],
     ) -> None:
-        for item in items:
-            if not continuation_provider():
-                if __debug__:
-                    logger.info("Stopping the queue writer, as requested")
-                return
+        loop_state = _start_loop(agent_name, queue, timeout_controller_factory, telemetry_registry)
+        timeout_controller = loop_state.timeout_controller
 
-            while True:
-                try:
-                    queue.put(item, timeout=timeout_seconds.value)
-                except Full:
+        try:
+            for item in items:
+                if not continuation_provider():
                     if __debug__:
-                        logger.debug("The queue is full!")
+                        logger.info("Stopping the queue writer, as requested")
+                    return
 
-                    if not continuation_provider():
-                        if __debug__:
-                            logger.info("Stopping writing to the queue, as requested")
-                        return
+                while True:
+                    wait_start_time = monotonic()
 
-                    timeout_seconds.value *= timeout_factor
-                else:
-                    timeout_seconds.value /= timeout_factor
-                    break
+                    try:
+                        _put_item(
+                            queue, continuation_provider, item, timeout_controller.timeout_seconds
+                        )
+                    except Full:
+                        loop_state.on_full(monotonic() - wait_start_time)
+
+                        if __debug__:
+                            logger.debug("The queue is full!")
+
+                        if not continuation_provider():
+                            if __debug__:
+                                logger.info("Stopping writing to the queue, as requested")
+                            return
+                    else:
+                        loop_state.on_moved(monotonic() - wait_start_time)
+                        break
+        finally:
+            loop_state.running = False
 
     return writer
 
 
 def create_adaptive_queue_reader(
     item_consumer: Consumer[T],
-    timeout_seconds_range: InclusiveRange,
-    timeout_factor: float,
+    timeout_seconds_range: Optional[InclusiveRange] = None,
+    timeout_factor: Optional[float] = None,
+    timeout_controller_factory: Optional[Producer[TimeoutController]] = None,
+    telemetry_registry: Optional[QueueTelemetryRegistry] = None,
+    agent_name: str = "reader",
 ) -> QueueReader[T]:
     """
     Higher-order function that, via the given parameters, creates a function for reading items
@@ -96,7 +194,7 @@ def create_adaptive_queue_reader(
 
     More precisely, the returned function has this signature:
 
-    (Queue[T], ContinuationProvider) -> None
+    (AnyQueue[T], ContinuationProvider) -> None
 
     that is, it takes:
 
@@ -109,7 +207,8 @@ def create_adaptive_queue_reader(
 
     1. read an item from the queue
     2. process it via the consumer function passed to the higher-order function
-    3. notify the queue via its task_done() method
+    3. notify the queue via its task_done() method - if available: multiprocessing.Queue,
+       unlike JoinableQueue, does not have it
 
 
     The above loop only stops as soon as:
@@ -122,32 +221,151 @@ def create_adaptive_queue_reader(
     given by the lowest bound of the requested range: when the dequeuing fails because the
     queue is Empty, the timeout is multiplied by the given factor, otherwise it is divided
     by the factor - always remaining in the range passed to the higher-order function.
+
+    Alternatively, you can pass just a factory of TimeoutController - for example, one of the
+    controllers in the "timeouts" module - to apply a different timeout policy.
+
+    Just like the writer, each call of the returned function has its own adaptive state -
+    registering its live telemetry into the QueueTelemetryRegistry, if passed.
+
+    If the ContinuationProvider is a CancelationToken, there is no polling at all: the reader
+    blocks until an item arrives - with no CPU usage while idle - and stops as soon as the token
+    is canceled and the queue is empty.
+
+    The source queue can also be a multiprocessing.Queue - or JoinableQueue - written by
+    another process; in this case, a CancelationToken is just polled like any
+    ContinuationProvider, and lists of items - created by batch_items() - can be consumed
+    item by item via create_unbatching_consumer(), both in the "batching" module.
     """
-    if timeout_factor < 1:
-        raise ValueError(timeout_factor)
+    timeout_controller_factory = _get_timeout_controller_factory(
+        timeout_seconds_range, timeout_factor, timeout_controller_factory
+    )
 
-    timeout_seconds = RangedCounter(timeout_seconds_range, timeout_seconds_range.lower)
+    def reader(queue: AnyQueue[T], continuation_provider: ContinuationProvider) -> None:
+        loop_state = _start_loop(agent_name, queue, timeout_controller_factory, telemetry_registry)
+        timeout_controller = loop_state.timeout_controller
+
+        try:
+            while True:
+                wait_start_time = monotonic()
+
+                try:
+                    item = _get_item(
+                        queue, continuation_provider, timeout_controller.timeout_seconds
+                    )
+                except Empty:
+                    loop_state.on_empty(monotonic() - wait_start_time)
+
+                    if __debug__:
+                        logger.debug("The queue is empty!")
+
+                    if not continuation_provider():
+                        if __debug__:
+                            logger.info("Stopping reading from the queue, as requested")
+                        return
+                else:
+                    loop_state.on_moved(monotonic() - wait_start_time)
+
+                    try:
+                        item_consumer(item)
+                    finally:
+                        _mark_task_done(queue)
+        finally:
+            loop_state.running = False
+
+    return reader
+
+
+def create_adaptive_queue_batch_reader(
+    batch_consumer: Consumer[list[T]],
+    timeout_seconds_range: Optional[InclusiveRange] = None,
+    timeout_factor: Optional[float] = None,
+    *,
+    max_batch_size: int,
+    max_linger_seconds: float = 0,
+    timeout_controller_factory: Optional[Producer[TimeoutController]] = None,
+    telemetry_registry: Optional[QueueTelemetryRegistry] = None,
+    agent_name: str = "batch reader",
+) -> QueueReader[T]:
+    """
+    Batch variant of create_adaptive_queue_reader(), for consumers that process items
+    more efficiently in bulk - such as DB insertions.
+
+    The returned function has the same signature, the same stop conditions - including
+    the support for CancelationToken - and the same per-call state and telemetry; the first
+    item of each batch is dequeued with the very same adaptive timeout; then:
+
+    1. up to max_batch_size - 1 further items are drained from the queue - taking the ones
+       already available and, if max_linger_seconds is > 0, waiting for new ones until
+       such time has elapsed since the first item was dequeued
+
+    2. the batch - as a list - is processed via the batch consumer
+
+    3. task_done() - if available - is called once per item in the batch, even if the
+       consumer fails
+    """
+    timeout_controller_factory = _get_timeout_controller_factory(
+        timeout_seconds_range, timeout_factor, timeout_controller_factory
+    )
+
+    if max_batch_size < 1:
+        raise ValueError(max_batch_size)
+
+    if max_linger_seconds < 0:
+        raise ValueError(max_linger_seconds)
+
+    def drain_batch(queue: AnyQueue[T], first_item: T) -> list[T]:
+        batch = [first_item]
+        linger_deadline = monotonic() + max_linger_seconds
+
+        while len(batch) < max_batch_size:
+            remaining_linger_seconds = linger_deadline - monotonic()
 
-    def reader(queue: Queue[T], continuation_provider: ContinuationProvider) -> None:
-        while True:
             try:
-                item = queue.get(timeout=timeout_seconds.value)
+                if remaining_linger_seconds > 0:
+                    batch.append(queue.get(timeout=remaining_linger_seconds))
+                else:
+                    batch.append(queue.get_nowait())
             except Empty:
-                if __debug__:
-                    logger.debug("The queue is empty!")
+                break
 
-                if not continuation_provider():
-                    if __debug__:
-                        logger.info("Stopping reading from the queue, as requested")
-                    return
+        return batch
+
+    def reader(queue: AnyQueue[T], continuation_provider: ContinuationProvider) -> None:
+        loop_state = _start_loop(agent_name, queue, timeout_controller_factory, telemetry_registry)
+        timeout_controller = loop_state.timeout_controller
 
-                timeout_seconds.value *= timeout_factor
-            else:
-                timeout_seconds.value /= timeout_factor
+        try:
+            while True:
+                wait_start_time = monotonic()
 
                 try:
-                    item_consumer(item)
-                finally:
-                    queue.task_done()
+                    first_item = _get_item(
+                        queue, continuation_provider, timeout_controller.timeout_seconds
+                    )
+                except Empty:
+                    loop_state.on_empty(monotonic() - wait_start_time)
+
+                    if __debug__:
+                        logger.debug("The queue is empty!")
+
+                    if not continuation_provider():
+                        if __debug__:
+                            logger.info("Stopping reading from the queue, as requested")
+                        return
+                else:
+                    first_wait_seconds = monotonic() - wait_start_time
+
+                    batch = drain_batch(queue, first_item)
+
+                    loop_state.on_moved(first_wait_seconds, len(batch))
+
+                    try:
+                        batch_consumer(batch)
+                    finally:
+                        for _ in batch:
+                            _mark_task_done(queue)
+        finally:
+            loop_state.running = False
 
     return reader
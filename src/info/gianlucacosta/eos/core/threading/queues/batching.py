@@ -0,0 +1,45 @@
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+from ...functional import Consumer
+
+T = TypeVar("T")
+
+
+def batch_items(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """
+    Lazily groups the given items into lists of batch_size items - the last one possibly
+    being shorter.
+
+    Writing such lists - instead of the single items - to a multiprocessing queue amortizes
+    the pickling and the pipe writes over the whole batch; on the reading side, you can wrap
+    the item consumer via create_unbatching_consumer().
+
+    Please, note that task_done() and join() - for JoinableQueue - will then count batches,
+    not items.
+    """
+    if batch_size < 1:
+        raise ValueError(batch_size)
+
+    iterator = iter(items)
+
+    while True:
+        batch = list(islice(iterator, batch_size))
+
+        if not batch:
+            return
+
+        yield batch
+
+
+def create_unbatching_consumer(item_consumer: Consumer[T]) -> Consumer[list[T]]:
+    """
+    Creates a consumer of lists - such as the ones produced by batch_items() - passing each
+    item to the given item consumer, in order.
+    """
+
+    def consume_batch(batch: list[T]) -> None:
+        for item in batch:
+            item_consumer(item)
+
+    return consume_batch
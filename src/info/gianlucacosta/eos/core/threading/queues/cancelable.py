@@ -0,0 +1,68 @@
+from queue import Empty, Full, Queue
+from typing import Optional, TypeVar
+
+from ..cancelable import CancelationToken
+
+T = TypeVar("T")
+
+
+def get_cancelable(
+    queue: Queue[T],
+    cancelation_token: CancelationToken,
+    timeout_seconds: Optional[float] = None,
+) -> T:
+    """
+    Just like queue.get() - but also raising Empty as soon as the token is canceled,
+    even while waiting; a None timeout means waiting until an item or the cancelation arrives.
+
+    It works with Queue and its subclasses - relying on the same internal methods
+    used by Queue.get().
+    """
+    with cancelation_token.watching(queue.not_empty):
+        with queue.not_empty:
+            if not queue.not_empty.wait_for(
+                lambda: queue._qsize() or cancelation_token.canceled,
+                timeout=timeout_seconds,
+            ):
+                raise Empty
+
+            if not queue._qsize():
+                raise Empty
+
+            item = queue._get()
+            queue.not_full.notify()
+            return item
+
+
+def put_cancelable(
+    queue: Queue[T],
+    item: T,
+    cancelation_token: CancelationToken,
+    timeout_seconds: Optional[float] = None,
+) -> None:
+    """
+    Just like queue.put() - but also raising Full as soon as the token is canceled,
+    even while waiting; a None timeout means waiting until there is room or the cancelation
+    arrives.
+
+    It works with Queue and its subclasses - relying on the same internal methods
+    used by Queue.put().
+    """
+    with cancelation_token.watching(queue.not_full):
+        with queue.not_full:
+            if cancelation_token.canceled:
+                raise Full
+
+            if queue.maxsize > 0:
+                if not queue.not_full.wait_for(
+                    lambda: queue._qsize() < queue.maxsize or cancelation_token.canceled,
+                    timeout=timeout_seconds,
+                ):
+                    raise Full
+
+                if cancelation_token.canceled:
+                    raise Full
+
+            queue._put(item)
+            queue.unfinished_tasks += 1
+            queue.not_empty.notify()
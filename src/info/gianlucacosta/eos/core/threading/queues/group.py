@@ -0,0 +1,320 @@
+from collections import deque
+from logging import getLogger
+from math import ceil
+from queue import Queue
+from threading import Lock
+from time import monotonic
+from types import TracebackType
+from typing import Any, Generic, Optional, Type, TypeVar
+
+from ...functional import Consumer
+from ...logic.ranges import InclusiveRange
+from ..cancelable import CancelableThread, CancelationToken
+from ..safe import SafeThread
+from ..striped import StripedCounter
+from .adaptive import create_adaptive_queue_reader
+
+T = TypeVar("T")
+
+
+class _ConsumerThread(SafeThread, CancelableThread, Generic[T]):
+    def __init__(self, group: "AutoscalingConsumerGroup[T]", name: str) -> None:
+        super().__init__(name=name, daemon=True)
+        self._group = group
+        self.busy = False
+        self.last_active_time = monotonic()
+
+        self._reader = create_adaptive_queue_reader(
+            item_consumer=self._consume,
+            timeout_seconds_range=InclusiveRange(
+                group._check_interval_seconds, group._check_interval_seconds
+            ),
+            timeout_factor=1,
+        )
+
+    def _safe_run(self) -> None:
+        self._reader(self._group._queue, self.cancelation_token)
+
+    def _consume(self, item: T) -> None:
+        self.busy = True
+
+        try:
+            self._group._item_consumer(item)
+        except Exception as ex:
+            self._group._record_exception(ex)
+        finally:
+            self.busy = False
+            self.last_active_time = monotonic()
+            self._group._processed_counter.increment()
+
+
+class _SupervisorThread(SafeThread, CancelableThread):
+    def __init__(self, group: "AutoscalingConsumerGroup[Any]") -> None:
+        super().__init__(name="AutoscalingConsumerGroup-supervisor", daemon=True)
+        self._group = group
+
+    def _safe_run(self) -> None:
+        self._group._supervise(self.cancelation_token)
+
+
+class AutoscalingConsumerGroup(Generic[T]):
+    """
+    Group of threads reading items from the same queue - each running an adaptive queue reader
+    driven by its CancelationToken - whose size automatically follows the load.
+
+    The group always runs between min_threads and max_threads consumer threads; every
+    check_interval_seconds, a supervisor thread:
+
+    * adds threads when the queue holds more than max_queue_size_per_thread items per thread,
+      or when the estimated wait of the queued items - the queue size divided by the throughput
+      measured since the previous check - exceeds max_item_wait_seconds, if not None
+
+    * retires one consumer thread when the queue is empty and the thread has been idle for
+      at least idle_cooldown_seconds
+
+    * replaces the consumer threads that ended unexpectedly, to keep at least min_threads
+
+    Exceptions raised by the item consumer do not stop its thread: they are logged and
+    gathered - up to the latest max_kept_exceptions - in the exceptions property, while
+    exception_count counts all of them.
+
+    stop() asks all the threads to end as soon as the queue is empty - so no queued item is
+    lost - and joins them; the group can also be used as a context manager, starting on enter
+    and stopping on exit.
+    """
+
+    def __init__(
+        self,
+        queue: Queue[T],
+        item_consumer: Consumer[T],
+        min_threads: int = 1,
+        max_threads: int = 8,
+        max_queue_size_per_thread: int = 1,
+        max_item_wait_seconds: Optional[float] = None,
+        idle_cooldown_seconds: float = 5,
+        check_interval_seconds: float = 0.1,
+        max_kept_exceptions: int = 100,
+    ) -> None:
+        if min_threads < 1:
+            raise ValueError(min_threads)
+
+        if max_threads < min_threads:
+            raise ValueError(max_threads)
+
+        if max_queue_size_per_thread < 1:
+            raise ValueError(max_queue_size_per_thread)
+
+        if max_item_wait_seconds is not None and max_item_wait_seconds <= 0:
+            raise ValueError(max_item_wait_seconds)
+
+        if idle_cooldown_seconds < 0:
+            raise ValueError(idle_cooldown_seconds)
+
+        if check_interval_seconds <= 0:
+            raise ValueError(check_interval_seconds)
+
+        if max_kept_exceptions < 0:
+            raise ValueError(max_kept_exceptions)
+
+        self._queue = queue
+        self._item_consumer = item_consumer
+        self._min_threads = min_threads
+        self._max_threads = max_threads
+        self._max_queue_size_per_thread = max_queue_size_per_thread
+        self._max_item_wait_seconds = max_item_wait_seconds
+        self._idle_cooldown_seconds = idle_cooldown_seconds
+        self._check_interval_seconds = check_interval_seconds
+
+        self._threads_lock = Lock()
+        self._active_threads: list[_ConsumerThread[T]] = []
+        self._retired_threads: list[_ConsumerThread[T]] = []
+        self._created_thread_count = 0
+        self._supervisor: Optional[_SupervisorThread] = None
+
+        self._processed_counter = StripedCounter()
+
+        self._exceptions_lock = Lock()
+        self._exceptions: deque[Exception] = deque(maxlen=max_kept_exceptions)
+        self._exception_count = 0
+
+        self._logger = getLogger(type(self).__name__)
+
+    def __enter__(self) -> "AutoscalingConsumerGroup[T]":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    @property
+    def thread_count(self) -> int:
+        """
+        The number of consumer threads currently active.
+        """
+        with self._threads_lock:
+            return len(self._active_threads)
+
+    @property
+    def processed_count(self) -> int:
+        """
+        How many items have been consumed - successfully or not.
+        """
+        return self._processed_counter.sum()
+
+    @property
+    def exceptions(self) -> list[Exception]:
+        """
+        The latest exceptions raised by the item consumer or by the consumer threads.
+        """
+        with self._exceptions_lock:
+            return list(self._exceptions)
+
+    @property
+    def exception_count(self) -> int:
+        with self._exceptions_lock:
+            return self._exception_count
+
+    def start(self) -> None:
+        """
+        Starts min_threads consumer threads and the supervisor; can only be called once.
+        """
+        if self._supervisor is not None:
+            raise RuntimeError("The group has already been started")
+
+        with self._threads_lock:
+            for _ in range(self._min_threads):
+                self._start_thread()
+
+        self._supervisor = _SupervisorThread(self)
+        self._supervisor.start()
+
+    def stop(self, timeout_seconds: Optional[float] = None) -> None:
+        """
+        Stops the supervisor and asks every consumer thread to end once the queue is empty -
+        then joins them, waiting up to timeout_seconds for each thread, if not None.
+        """
+        if self._supervisor is None:
+            return
+
+        self._supervisor.request_cancel()
+        self._supervisor.join(timeout_seconds)
+
+        with self._threads_lock:
+            threads = self._active_threads + self._retired_threads
+            self._active_threads.clear()
+            self._retired_threads.clear()
+
+        for thread in threads:
+            thread.request_cancel()
+
+        for thread in threads:
+            thread.join(timeout_seconds)
+            self._collect_thread_exception(thread)
+
+    def _start_thread(self) -> None:
+        self._created_thread_count += 1
+
+        thread = _ConsumerThread(self, f"AutoscalingConsumerGroup-{self._created_thread_count}")
+        self._active_threads.append(thread)
+        thread.start()
+
+    def _record_exception(self, exception: Exception) -> None:
+        self._logger.error("Exception in the item consumer: %r", exception)
+
+        with self._exceptions_lock:
+            self._exceptions.append(exception)
+            self._exception_count += 1
+
+    def _collect_thread_exception(self, thread: _ConsumerThread[T]) -> None:
+        if not thread.is_alive() and thread.exception is not None:
+            with self._exceptions_lock:
+                self._exceptions.append(thread.exception)
+                self._exception_count += 1
+
+    def _supervise(self, cancelation_token: CancelationToken) -> None:
+        last_processed_count = self._processed_counter.sum()
+        last_check_time = monotonic()
+
+        while not cancelation_token.wait(self._check_interval_seconds):
+            processed_count = self._processed_counter.sum()
+            check_time = monotonic()
+
+            throughput = (processed_count - last_processed_count) / max(
+                check_time - last_check_time, 1e-9
+            )
+
+            last_processed_count = processed_count
+            last_check_time = check_time
+
+            with self._threads_lock:
+                self._prune_threads()
+                self._scale(throughput)
+
+    def _prune_threads(self) -> None:
+        for thread in [thread for thread in self._active_threads if not thread.is_alive()]:
+            self._active_threads.remove(thread)
+            self._collect_thread_exception(thread)
+            self._logger.warning("Consumer thread %s ended unexpectedly", thread.name)
+
+        for thread in [thread for thread in self._retired_threads if not thread.is_alive()]:
+            self._retired_threads.remove(thread)
+            self._collect_thread_exception(thread)
+
+        while len(self._active_threads) < self._min_threads:
+            self._start_thread()
+
+    def _scale(self, throughput: float) -> None:
+        queue_size = self._queue.qsize()
+        thread_count = len(self._active_threads)
+
+        target_thread_count = ceil(queue_size / self._max_queue_size_per_thread)
+
+        if self._max_item_wait_seconds is not None and queue_size > 0:
+            estimated_wait_seconds = queue_size / throughput if throughput > 0 else float("inf")
+
+            if estimated_wait_seconds > self._max_item_wait_seconds:
+                target_thread_count = max(target_thread_count, thread_count + 1)
+
+        target_thread_count = min(target_thread_count, self._max_threads)
+
+        if target_thread_count > thread_count:
+            if __debug__:
+                self._logger.debug(
+                    "Scaling up from %d to %d threads - queue size: %d",
+                    thread_count,
+                    target_thread_count,
+                    queue_size,
+                )
+
+            for _ in range(target_thread_count - thread_count):
+                self._start_thread()
+
+            return
+
+        if queue_size > 0 or thread_count <= self._min_threads:
+            return
+
+        now = monotonic()
+
+        idle_threads = [
+            thread
+            for thread in self._active_threads
+            if not thread.busy and now - thread.last_active_time >= self._idle_cooldown_seconds
+        ]
+
+        if not idle_threads:
+            return
+
+        retired_thread = min(idle_threads, key=lambda thread: thread.last_active_time)
+
+        if __debug__:
+            self._logger.debug("Retiring idle consumer thread %s", retired_thread.name)
+
+        self._active_threads.remove(retired_thread)
+        self._retired_threads.append(retired_thread)
+        retired_thread.request_cancel()
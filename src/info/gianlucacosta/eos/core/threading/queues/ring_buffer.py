@@ -0,0 +1,131 @@
+from queue import Empty, Full, Queue
+from typing import Any, Iterable, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class RingBufferQueue(Queue[T]):
+    """
+    Bounded Queue storing its items in a list preallocated upon construction - used as a ring
+    buffer - instead of a deque.
+
+    Being a Queue subclass, it supports the whole Queue interface - including task_done()
+    and join() - and can be passed to the adaptive queue readers and writers as well as to
+    the cancelable queue operations.
+
+    Furthermore, put_many() and get_many() transfer several items while acquiring the lock
+    just once - which is where most of the per-item cost of a Queue lies, in high-rate
+    pipelines.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(maxsize)
+
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._buffer: list[Any] = [None] * maxsize
+        self._head = 0
+        self._count = 0
+
+    def _qsize(self) -> int:
+        return self._count
+
+    def _put(self, item: T) -> None:
+        self._buffer[(self._head + self._count) % self.maxsize] = item
+        self._count += 1
+
+    def _get(self) -> T:
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None
+
+        self._head = (self._head + 1) % self.maxsize
+        self._count -= 1
+
+        return cast(T, item)
+
+    def put_many(
+        self, items: Iterable[T], block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Puts all the given items into the queue - in order - just like calling put() on each
+        of them with the same arguments, but waiting only when the queue is full.
+
+        Should Full be raised, the items preceding the one that could not be put are left
+        in the queue.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        pending_items = list(items)
+        next_index = 0
+
+        with self.not_full:
+            while next_index < len(pending_items):
+                if self._count == self.maxsize:
+                    if not block or not self.not_full.wait_for(
+                        lambda: self._count < self.maxsize, timeout
+                    ):
+                        raise Full
+
+                chunk_end = next_index + self.maxsize - self._count
+                chunk = pending_items[next_index:chunk_end]
+                self._write_chunk(chunk)
+                next_index += len(chunk)
+
+                self.unfinished_tasks += len(chunk)
+                self.not_empty.notify(len(chunk))
+
+    def get_many(
+        self, max_count: int, block: bool = True, timeout: Optional[float] = None
+    ) -> list[T]:
+        """
+        Removes and returns - in order - up to max_count items: the blocking and the timeout
+        only apply to the first item - just like in get() - then, all the items available at
+        that time are returned, up to max_count.
+
+        task_done() must be called once per returned item.
+        """
+        if max_count < 1:
+            raise ValueError(max_count)
+
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        with self.not_empty:
+            if not self._count:
+                if not block or not self.not_empty.wait_for(lambda: self._count > 0, timeout):
+                    raise Empty
+
+            items = self._read_chunk(min(max_count, self._count))
+            self.not_full.notify(len(items))
+
+            return items
+
+    def _write_chunk(self, chunk: list[T]) -> None:
+        start_index = (self._head + self._count) % self.maxsize
+        first_part_length = min(len(chunk), self.maxsize - start_index)
+        first_part_end = start_index + first_part_length
+
+        self._buffer[start_index:first_part_end] = chunk[:first_part_length]
+        self._buffer[: len(chunk) - first_part_length] = chunk[first_part_length:]
+
+        self._count += len(chunk)
+
+    def _read_chunk(self, length: int) -> list[T]:
+        first_part_length = min(length, self.maxsize - self._head)
+        second_part_length = length - first_part_length
+
+        head = self._head
+        first_part_end = head + first_part_length
+
+        items = self._buffer[head:first_part_end] + self._buffer[:second_part_length]
+
+        self._buffer[head:first_part_end] = [None] * first_part_length
+        self._buffer[:second_part_length] = [None] * second_part_length
+
+        self._head = (self._head + length) % self.maxsize
+        self._count -= length
+
+        return items
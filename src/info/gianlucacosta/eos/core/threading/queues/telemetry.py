@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock, current_thread
+from typing import Any
+
+from . import AnyQueue
+from .timeouts import TimeoutController
+
+_loop_ids = count(1)
+
+
+@dataclass(frozen=True)
+class QueueLoopTelemetry:
+    """
+    Snapshot of the state of a loop - that is, a single invocation of an adaptive queue
+    reader or writer:
+
+    * loop_id is unique within the process, while queue_id is the id() of the queue
+
+    * empty_count and full_count are the blocking operations that timed out because the queue
+      was empty (for readers) or full (for writers)
+
+    * blocked_seconds is the total time spent within blocking queue operations
+    """
+
+    loop_id: int
+    agent_name: str
+    thread_name: str
+    queue_id: int
+    running: bool
+    timeout_seconds: float
+    empty_count: int
+    full_count: int
+    items_moved: int
+    blocked_seconds: float
+
+
+class QueueLoopState:
+    """
+    Adaptive state - including its own TimeoutController - of a single invocation of an
+    adaptive queue reader or writer, which is the only thread updating it.
+
+    It can be read from other threads via get_telemetry(), whose fields are consistent
+    with each other only once the loop has ended.
+    """
+
+    def __init__(
+        self, agent_name: str, queue: AnyQueue[Any], timeout_controller: TimeoutController
+    ) -> None:
+        self.loop_id = next(_loop_ids)
+        self.agent_name = agent_name
+        self.thread_name = current_thread().name
+        self.queue_id = id(queue)
+        self.timeout_controller = timeout_controller
+
+        self.running = True
+        self.empty_count = 0
+        self.full_count = 0
+        self.items_moved = 0
+        self.blocked_seconds = 0.0
+
+    def on_moved(self, blocked_seconds: float, item_count: int = 1) -> None:
+        self.timeout_controller.on_completed(blocked_seconds)
+        self.items_moved += item_count
+        self.blocked_seconds += blocked_seconds
+
+    def on_empty(self, blocked_seconds: float) -> None:
+        self.timeout_controller.on_timed_out()
+        self.empty_count += 1
+        self.blocked_seconds += blocked_seconds
+
+    def on_full(self, blocked_seconds: float) -> None:
+        self.timeout_controller.on_timed_out()
+        self.full_count += 1
+        self.blocked_seconds += blocked_seconds
+
+    def get_telemetry(self) -> QueueLoopTelemetry:
+        return QueueLoopTelemetry(
+            loop_id=self.loop_id,
+            agent_name=self.agent_name,
+            thread_name=self.thread_name,
+            queue_id=self.queue_id,
+            running=self.running,
+            timeout_seconds=self.timeout_controller.timeout_seconds,
+            empty_count=self.empty_count,
+            full_count=self.full_count,
+            items_moved=self.items_moved,
+            blocked_seconds=self.blocked_seconds,
+        )
+
+
+class QueueTelemetryRegistry:
+    """
+    Thread-safe registry of the loops run by the adaptive queue readers and writers it is
+    passed to - for example, to find out which queue is the bottleneck.
+
+    Ended loops are kept - with running set to False - until remove_ended_loops() is called.
+    """
+
+    def __init__(self) -> None:
+        self._loop_states: dict[int, QueueLoopState] = {}
+        self._lock = Lock()
+
+    def register(self, loop_state: QueueLoopState) -> None:
+        with self._lock:
+            self._loop_states[loop_state.loop_id] = loop_state
+
+    def get_telemetry(self) -> list[QueueLoopTelemetry]:
+        """
+        Returns a snapshot of each registered loop - in registration order.
+        """
+        with self._lock:
+            loop_states = list(self._loop_states.values())
+
+        return [loop_state.get_telemetry() for loop_state in loop_states]
+
+    def remove_ended_loops(self) -> None:
+        with self._lock:
+            self._loop_states = {
+                loop_id: loop_state
+                for loop_id, loop_state in self._loop_states.items()
+                if loop_state.running
+            }
@@ -0,0 +1,234 @@
+from abc import ABC, abstractmethod
+from math import exp, log
+from random import uniform
+
+from ...logic.ranges import InclusiveRange, RangedCounter
+
+
+class TimeoutController(ABC):
+    """
+    Policy deciding the timeout of each blocking operation performed by the adaptive
+    queue readers and writers - that wake up whenever it expires, to check their
+    ContinuationProvider.
+
+    Short timeouts make the agents more responsive to stop requests, at the cost of more
+    wake-ups - and CPU usage - while the queue is empty (for readers) or full (for writers).
+
+    Controllers are stateful and not thread-safe: that is why the adaptive agents create a
+    brand-new controller - via the factory they receive - for each call.
+    """
+
+    @property
+    @abstractmethod
+    def timeout_seconds(self) -> float:
+        """
+        The timeout for the next blocking operation.
+        """
+
+    @abstractmethod
+    def on_completed(self, waited_seconds: float) -> None:
+        """
+        Called when a blocking operation succeeds - after waiting for the given time.
+        """
+
+    @abstractmethod
+    def on_timed_out(self) -> None:
+        """
+        Called when a blocking operation fails because its timeout has expired.
+        """
+
+
+class MultiplicativeTimeoutController(TimeoutController):
+    """
+    Starts from the lowest bound of the range, multiplying the timeout by timeout_factor
+    after each timeout and dividing it by the same factor after each success.
+
+    It is the default policy of the adaptive queue agents: very reactive, but prone to
+    oscillating under steady load.
+    """
+
+    def __init__(self, timeout_seconds_range: InclusiveRange, timeout_factor: float) -> None:
+        if timeout_factor < 1:
+            raise ValueError(timeout_factor)
+
+        self._timeout_factor = timeout_factor
+        self._timeout_seconds = RangedCounter(timeout_seconds_range, timeout_seconds_range.lower)
+
+    @property
+    def timeout_seconds(self) -> float:
+        return self._timeout_seconds.value
+
+    def on_completed(self, waited_seconds: float) -> None:
+        self._timeout_seconds.value /= self._timeout_factor
+
+    def on_timed_out(self) -> None:
+        self._timeout_seconds.value *= self._timeout_factor
+
+
+class EwmaTimeoutController(TimeoutController):
+    """
+    Keeps an exponentially-weighted moving average of the observed wait times - a timeout
+    counting as a wait as long as the timeout itself - and sets the timeout to such average
+    multiplied by wait_multiplier, within the given range.
+
+    The smoothing_factor - in (0, 1] - is the weight of each new observation: the lower it is,
+    the steadier the timeout.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds_range: InclusiveRange,
+        smoothing_factor: float = 0.2,
+        wait_multiplier: float = 2,
+    ) -> None:
+        if not 0 < smoothing_factor <= 1:
+            raise ValueError(smoothing_factor)
+
+        if wait_multiplier <= 1:
+            raise ValueError(wait_multiplier)
+
+        self._smoothing_factor = smoothing_factor
+        self._wait_multiplier = wait_multiplier
+        self._timeout_seconds = RangedCounter(timeout_seconds_range, timeout_seconds_range.lower)
+        self._average_wait_seconds = timeout_seconds_range.lower / wait_multiplier
+
+    @property
+    def timeout_seconds(self) -> float:
+        return self._timeout_seconds.value
+
+    def on_completed(self, waited_seconds: float) -> None:
+        self._observe(waited_seconds)
+
+    def on_timed_out(self) -> None:
+        self._observe(self._timeout_seconds.value)
+
+    def _observe(self, waited_seconds: float) -> None:
+        self._average_wait_seconds += self._smoothing_factor * (
+            waited_seconds - self._average_wait_seconds
+        )
+
+        self._timeout_seconds.value = self._average_wait_seconds * self._wait_multiplier
+
+
+class BackoffTimeoutController(TimeoutController):
+    """
+    Exponential backoff with jitter: every consecutive timeout multiplies the timeout by
+    backoff_factor, while a success resets it to the lowest bound of the range.
+
+    jitter_ratio - from 0 to 1 - is the fraction of each timeout that is randomized, so that
+    many idle agents do not wake up all at the same time.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds_range: InclusiveRange,
+        backoff_factor: float = 2,
+        jitter_ratio: float = 0.5,
+    ) -> None:
+        if backoff_factor < 1:
+            raise ValueError(backoff_factor)
+
+        if not 0 <= jitter_ratio <= 1:
+            raise ValueError(jitter_ratio)
+
+        self._timeout_seconds_range = timeout_seconds_range
+        self._backoff_factor = backoff_factor
+        self._jitter_ratio = jitter_ratio
+        self._base_timeout_seconds = RangedCounter(
+            timeout_seconds_range, timeout_seconds_range.lower
+        )
+
+    @property
+    def timeout_seconds(self) -> float:
+        base_timeout_seconds = self._base_timeout_seconds.value
+
+        return max(
+            base_timeout_seconds - uniform(0, base_timeout_seconds * self._jitter_ratio),
+            self._timeout_seconds_range.lower,
+        )
+
+    def on_completed(self, waited_seconds: float) -> None:
+        self._base_timeout_seconds.value = self._timeout_seconds_range.lower
+
+    def on_timed_out(self) -> None:
+        self._base_timeout_seconds.value *= self._backoff_factor
+
+
+class PidTimeoutController(TimeoutController):
+    """
+    PID-style controller keeping the fraction of blocking operations that time out close
+    to target_timeout_ratio.
+
+    Each operation yields an error - 1 - target_timeout_ratio for a timeout,
+    -target_timeout_ratio for a success - and the logarithm of the timeout is set to the
+    logarithm of the lowest bound plus the weighted sum of:
+
+    * the latest error - via proportional_gain
+
+    * the sum of all the errors - via integral_gain; such sum is clamped to what is needed to
+      reach the bounds of the range, to prevent windup
+
+    * the difference between the latest two errors - via derivative_gain
+
+    Because the integral term only settles when the errors average zero, the timeout converges
+    to the value at which the requested fraction of operations time out: the lower the
+    ratio, the fewer the wake-ups - but the slower the reaction to stop requests.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds_range: InclusiveRange,
+        target_timeout_ratio: float = 0.2,
+        proportional_gain: float = 0.5,
+        integral_gain: float = 0.5,
+        derivative_gain: float = 0.1,
+    ) -> None:
+        if timeout_seconds_range.lower <= 0:
+            raise ValueError(timeout_seconds_range.lower)
+
+        if not 0 < target_timeout_ratio < 1:
+            raise ValueError(target_timeout_ratio)
+
+        if integral_gain <= 0:
+            raise ValueError(integral_gain)
+
+        if proportional_gain < 0:
+            raise ValueError(proportional_gain)
+
+        if derivative_gain < 0:
+            raise ValueError(derivative_gain)
+
+        self._target_timeout_ratio = target_timeout_ratio
+        self._proportional_gain = proportional_gain
+        self._integral_gain = integral_gain
+        self._derivative_gain = derivative_gain
+
+        self._log_lower = log(timeout_seconds_range.lower)
+        self._max_integral = (log(timeout_seconds_range.upper) - self._log_lower) / integral_gain
+
+        self._timeout_seconds = RangedCounter(timeout_seconds_range, timeout_seconds_range.lower)
+        self._integral = 0.0
+        self._previous_error = 0.0
+
+    @property
+    def timeout_seconds(self) -> float:
+        return self._timeout_seconds.value
+
+    def on_completed(self, waited_seconds: float) -> None:
+        self._observe(-self._target_timeout_ratio)
+
+    def on_timed_out(self) -> None:
+        self._observe(1 - self._target_timeout_ratio)
+
+    def _observe(self, error: float) -> None:
+        self._integral = min(max(self._integral + error, 0), self._max_integral)
+
+        derivative = error - self._previous_error
+        self._previous_error = error
+
+        self._timeout_seconds.value = exp(
+            self._log_lower
+            + self._proportional_gain * error
+            + self._integral_gain * self._integral
+            + self._derivative_gain * derivative
+        )
@@ -0,0 +1,138 @@
+from functools import reduce
+from threading import Lock, local
+from typing import Callable, Generic, TypeVar
+from weakref import finalize, ref
+
+T = TypeVar("T")
+
+
+class _Cell(Generic[T]):
+    __slots__ = ("value",)
+
+    def __init__(self, value: T) -> None:
+        self.value = value
+
+
+class _CellOwner(Generic[T]):
+    """
+    Referenced only by the thread-local storage of the thread owning the cell - so that
+    it is collected as soon as such thread ends.
+    """
+
+    __slots__ = ("cell", "__weakref__")
+
+    def __init__(self, cell: _Cell[T]) -> None:
+        self.cell = cell
+
+
+def _retire_cell(accumulator_ref: "ref[StripedAccumulator[T]]", cell: _Cell[T]) -> None:
+    accumulator = accumulator_ref()
+
+    if accumulator is not None:
+        accumulator._retire_cell(cell)
+
+
+class StripedAccumulator(Generic[T]):
+    """
+    Value updated by many threads without contention - in the style of Java's LongAccumulator.
+
+    Each thread accumulates into its own cell - only ever written by that thread, so no lock
+    is needed - while get() combines all the cells via the very same accumulator function,
+    which must therefore be associative and commutative, having identity as its neutral value.
+
+    Updates are as cheap as possible, at the expense of reads: get() is not atomic with respect
+    to concurrent updates, so it is ideal for statistics - such as counters and maxima - read
+    much less often than they are updated; for exact read-modify-write semantics,
+    use Atomic instead.
+
+    When a thread ends, its cell is folded into a base value and dropped - so that thread
+    churn does not make the accumulator grow, nor get() slow down.
+    """
+
+    def __init__(self, accumulator: Callable[[T, T], T], identity: T) -> None:
+        self._accumulator = accumulator
+        self._identity = identity
+        self._base_value = identity
+        self._cells: set[_Cell[T]] = set()
+        self._cells_lock = Lock()
+        self._thread_state = local()
+
+    def accumulate(self, value: T) -> None:
+        cell = self._get_thread_cell()
+        cell.value = self._accumulator(cell.value, value)
+
+    def get(self) -> T:
+        """
+        Returns the combination of all the cells.
+        """
+        with self._cells_lock:
+            base_value = self._base_value
+            cells = list(self._cells)
+
+        return reduce(self._accumulator, (cell.value for cell in cells), base_value)
+
+    @property
+    def cell_count(self) -> int:
+        """
+        How many threads currently own a cell.
+        """
+        with self._cells_lock:
+            return len(self._cells)
+
+    def _get_thread_cell(self) -> _Cell[T]:
+        try:
+            return self._thread_state.owner.cell
+        except AttributeError:
+            cell = _Cell(self._identity)
+            owner = _CellOwner(cell)
+
+            with self._cells_lock:
+                self._cells.add(cell)
+
+            finalize(owner, _retire_cell, ref(self), cell)
+
+            self._thread_state.owner = owner
+            return cell
+
+    def _retire_cell(self, cell: _Cell[T]) -> None:
+        with self._cells_lock:
+            self._base_value = self._accumulator(self._base_value, cell.value)
+            self._cells.discard(cell)
+
+
+class StripedCounter(StripedAccumulator[int]):
+    """
+    Counter that can be incremented by many threads without contention - in the style of
+    Java's LongAdder.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(lambda left, right: left + right, 0)
+
+    def increment(self, amount: int = 1) -> None:
+        cell = self._get_thread_cell()
+        cell.value += amount
+
+    def decrement(self, amount: int = 1) -> None:
+        self.increment(-amount)
+
+    def sum(self) -> int:
+        return self.get()
+
+
+class StripedMaxAccumulator(StripedAccumulator[float]):
+    """
+    Keeps the maximum of the values accumulated by many threads - without contention.
+    """
+
+    def __init__(self, identity: float = float("-inf")) -> None:
+        super().__init__(max, identity)
+
+
+class StripedMinAccumulator(StripedAccumulator[float]):
+    """
+    Keeps the minimum of the values accumulated by many threads - without contention.
+    """
+
+    def __init__(self, identity: float = float("inf")) -> None:
+        super().__init__(min, identity)
@@ -1,6 +1,6 @@
-from pytest import mark, raises
+from pytest import approx, mark, raises
 
-from info.gianlucacosta.eos.core.functional.retries import call_with_retries
+from info.gianlucacosta.eos.core.functional.retries import RetryPolicy, call_with_retries
 
 
 class RetryTestException(Exception):
@@ -76,3 +76,58 @@ class TestRunWithRetries:
 
         result = call_with_retries(int_provider, max_attempts=3, timeout_seconds=0)
         assert result == 90
+
+
+class TestRetryPolicy:
+    @mark.parametrize(
+        "arguments",
+        [
+            dict(max_attempts=0, initial_delay_seconds=1),
+            dict(max_attempts=3, initial_delay_seconds=-1),
+            dict(max_attempts=3, initial_delay_seconds=1, backoff_factor=0.5),
+            dict(max_attempts=3, initial_delay_seconds=1, max_delay_seconds=-1),
+            dict(max_attempts=3, initial_delay_seconds=1, jitter_ratio=1.5),
+        ],
+    )
+    def test_when_wrong_arguments(self, arguments):
+        with raises(ValueError):
+            RetryPolicy(**arguments)
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3, initial_delay_seconds=0)
+
+        assert policy.should_retry(RetryTestException(), 1)
+        assert policy.should_retry(RetryTestException(), 2)
+        assert not policy.should_retry(RetryTestException(), 3)
+        assert not policy.should_retry(KeyboardInterrupt(), 1)
+
+    def test_should_retry_with_custom_predicate(self):
+        policy = RetryPolicy(
+            max_attempts=3,
+            initial_delay_seconds=0,
+            is_retryable=lambda error: isinstance(error, RetryTestException),
+        )
+
+        assert policy.should_retry(RetryTestException(), 1)
+        assert not policy.should_retry(ValueError(), 1)
+
+    def test_delays_without_jitter(self):
+        policy = RetryPolicy(
+            max_attempts=10, initial_delay_seconds=0.1, max_delay_seconds=0.3, jitter_ratio=0
+        )
+
+        delays = [policy.get_delay_seconds(attempts_done) for attempts_done in range(1, 5)]
+
+        assert delays == approx([0.1, 0.2, 0.3, 0.3])
+
+    def test_delays_with_jitter(self):
+        policy = RetryPolicy(max_attempts=10, initial_delay_seconds=1, jitter_ratio=0.5)
+
+        for _ in range(100):
+            assert 2 <= policy.get_delay_seconds(3) <= 4
+
+    def test_delay_before_any_attempt(self):
+        policy = RetryPolicy(max_attempts=3, initial_delay_seconds=1)
+
+        with raises(ValueError):
+            policy.get_delay_seconds(0)
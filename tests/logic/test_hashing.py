@@ -0,0 +1,80 @@
+from collections import Counter
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.logic.hashing import ConsistentHashRing, get_stable_hash
+
+
+class TestGetStableHash:
+    def test_same_value(self):
+        assert get_stable_hash("alpha") == get_stable_hash("alpha")
+
+    def test_different_values(self):
+        assert get_stable_hash("alpha") != get_stable_hash("beta")
+
+    def test_known_value(self):
+        assert get_stable_hash(90) == get_stable_hash("90")
+
+
+class TestConsistentHashRing:
+    def test_empty_ring(self):
+        with raises(ValueError):
+            ConsistentHashRing[int]().get_node("alpha")
+
+    def test_invalid_virtual_node_count(self):
+        with raises(ValueError):
+            ConsistentHashRing([1], virtual_node_count=0)
+
+    def test_duplicate_node(self):
+        ring = ConsistentHashRing([1, 2])
+
+        with raises(ValueError):
+            ring.add_node(1)
+
+    def test_missing_node(self):
+        ring = ConsistentHashRing([1, 2])
+
+        with raises(ValueError):
+            ring.remove_node(3)
+
+    def test_mapping_is_stable(self):
+        ring = ConsistentHashRing(range(4))
+        other_ring = ConsistentHashRing(range(4))
+
+        for key in range(100):
+            assert ring.get_node(key) == other_ring.get_node(key)
+
+    def test_load_is_balanced(self):
+        ring = ConsistentHashRing(range(4), virtual_node_count=128)
+
+        node_counts = Counter(ring.get_node(f"key-{index}") for index in range(4000))
+
+        assert set(node_counts) == {0, 1, 2, 3}
+        assert all(count > 600 for count in node_counts.values())
+
+    def test_adding_a_node_only_moves_keys_to_it(self):
+        ring = ConsistentHashRing(range(4))
+        keys = [f"key-{index}" for index in range(1000)]
+        initial_nodes = {key: ring.get_node(key) for key in keys}
+
+        ring.add_node(4)
+
+        moved_keys = [key for key in keys if ring.get_node(key) != initial_nodes[key]]
+
+        assert all(ring.get_node(key) == 4 for key in moved_keys)
+        assert 0 < len(moved_keys) < 400
+
+    def test_removing_a_node_only_moves_its_keys(self):
+        ring = ConsistentHashRing(range(4))
+        keys = [f"key-{index}" for index in range(1000)]
+        initial_nodes = {key: ring.get_node(key) for key in keys}
+
+        ring.remove_node(2)
+
+        assert ring.nodes == frozenset({0, 1, 3})
+
+        for key in keys:
+            if initial_nodes[key] != 2:
+                assert ring.get_node(key) == initial_nodes[key]
+            else:
+                assert ring.get_node(key) != 2
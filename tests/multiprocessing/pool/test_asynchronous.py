@@ -0,0 +1,139 @@
+import gc
+from asyncio import gather, get_running_loop, run, sleep
+from logging import getLogger
+from multiprocessing import Pool
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.asynchronous import AsyncProcessPoolFacade
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+from .test_facade import initialize_worker, offset_sum, special_sum, special_sum_with_error
+
+
+class TestAsyncProcessPoolFacade:
+    def test_submit(self):
+        async def scenario():
+            async with AsyncProcessPoolFacade(InThreadPool, special_sum) as facade:
+                futures = [await facade.submit(alpha, 1) for alpha in range(5)]
+
+                return await gather(*futures)
+
+        assert run(scenario()) == [alpha + 2 for alpha in range(5)]
+
+    def test_submit_with_process_pool(self):
+        async def scenario():
+            async with AsyncProcessPoolFacade(
+                lambda: Pool(2), special_sum, max_pending_async_requests=2
+            ) as facade:
+                futures = [await facade.submit(alpha, 1) for alpha in range(6)]
+
+                return await gather(*futures)
+
+        assert run(scenario()) == [alpha + 2 for alpha in range(6)]
+
+    def test_submit_with_error(self):
+        async def scenario():
+            async with AsyncProcessPoolFacade(InThreadPool, special_sum_with_error) as facade:
+                future = await facade.submit(90, 1)
+
+                with raises(ZeroDivisionError):
+                    await future
+
+        run(scenario())
+
+    def test_backpressure_does_not_block_the_loop(self):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+
+            for _ in range(5):
+                ticks += 1
+                await sleep(0.01)
+
+        async def scenario():
+            async with AsyncProcessPoolFacade(
+                create_thread_pool_factory(1), special_sum, max_pending_async_requests=1
+            ) as facade:
+                ticking = tick()
+
+                async def submit_all():
+                    return [await facade.submit(alpha, 0) for alpha in range(4)]
+
+                futures, _ = await gather(submit_all(), ticking)
+
+                return await gather(*futures)
+
+        assert run(scenario()) == [alpha + 1 for alpha in range(4)]
+        assert ticks == 5
+
+    def test_stream(self):
+        async def scenario():
+            async with AsyncProcessPoolFacade(
+                create_thread_pool_factory(3), special_sum, max_pending_async_requests=3
+            ) as facade:
+                return [result async for result in facade.stream((alpha, 1) for alpha in range(8))]
+
+        assert sorted(run(scenario())) == [alpha + 2 for alpha in range(8)]
+
+    def test_stream_with_error(self):
+        async def scenario():
+            async with AsyncProcessPoolFacade(InThreadPool, special_sum_with_error) as facade:
+                with raises(ZeroDivisionError):
+                    async for _ in facade.stream([(1, 2), (90, 2)]):
+                        pass
+
+        run(scenario())
+
+    def test_stream_with_many_errors(self):
+        exception_contexts = []
+        stream_error_counter = Atomic(0)
+
+        async def scenario():
+            get_running_loop().set_exception_handler(
+                lambda _, context: exception_contexts.append(context)
+            )
+
+            async with AsyncProcessPoolFacade(
+                InThreadPool, special_sum_with_error, max_pending_async_requests=4
+            ) as facade:
+                try:
+                    async for _ in facade.stream([(90, 1), (90, 2), (90, 3), (90, 4)]):
+                        pass
+                except ZeroDivisionError:
+                    stream_error_counter.map(lambda value: value + 1)
+
+            gc.collect()
+            await sleep(0)
+
+        # Captured log records would keep the futures alive, via their tracebacks
+        facade_logger = getLogger(AsyncProcessPoolFacade.__name__)
+        facade_logger.disabled = True
+
+        try:
+            run(scenario())
+        finally:
+            facade_logger.disabled = False
+
+        assert stream_error_counter.get() == 1
+        assert exception_contexts == []
+
+    def test_with_worker_initializer(self):
+        async def scenario():
+            async with AsyncProcessPoolFacade(
+                InThreadPool, offset_sum, worker_initializer=initialize_worker
+            ) as facade:
+                return await (await facade.submit(7, 90))
+
+        assert run(scenario()) == 1097
+
+    def test_with_negative_async_requests(self):
+        with raises(ValueError) as ex:
+            AsyncProcessPoolFacade(InThreadPool, special_sum, max_pending_async_requests=-5)
+
+        assert ex.value.args == (-5,)
@@ -0,0 +1,187 @@
+from multiprocessing import Pool
+from time import sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    ProcessPoolFactory,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.batching import (
+    BatchingProcessPoolFacade,
+    BatchItemError,
+    apply_to_batch,
+)
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+from .test_facade import special_sum, special_sum_with_error
+
+
+def fast_sum(alpha: int, beta: int) -> int:
+    return alpha + beta
+
+
+def slow_sum(alpha: int, beta: int) -> int:
+    sleep(0.1)
+    return alpha + beta
+
+
+class BatchAbortingError(BaseException):
+    pass
+
+
+def sum_aborting_batch(alpha: int, beta: int) -> int:
+    if alpha == 90:
+        raise BatchAbortingError()
+
+    return alpha + beta
+
+
+class MyBatchingProcessPoolFacade(BatchingProcessPoolFacade[int]):
+    def __init__(self, pool_factory: ProcessPoolFactory = InThreadPool, **kwargs) -> None:
+        super().__init__(pool_factory=pool_factory, **kwargs)
+        self.results = Atomic[list[int]]([])
+        self.error_counter = Atomic(0)
+        self.batch_counter = Atomic(0)
+
+    def _process_batch_outcome(self, outcome) -> None:
+        self.batch_counter.map(lambda value: value + 1)
+        super()._process_batch_outcome(outcome)
+
+    def _on_worker_result(self, worker_result: int) -> None:
+        self.results.map(lambda results: results + [worker_result])
+
+    def _on_worker_error(self, _: BaseException) -> None:
+        self.error_counter.map(lambda value: value + 1)
+
+    def send_numbers(self, alpha: int, beta: int) -> None:
+        self._send_to_worker(alpha, beta)
+
+
+class TestApplyToBatch:
+    def test_with_mixed_results(self):
+        outcome = apply_to_batch(
+            special_sum_with_error, [((1, 2), {}), ((90, 0), {}), ((3, 4), {})]
+        )
+
+        assert outcome.results[0] == 4
+        assert isinstance(outcome.results[1], BatchItemError)
+        assert isinstance(outcome.results[1].exception, ZeroDivisionError)
+        assert outcome.results[2] == 8
+        assert outcome.elapsed_seconds > 0
+
+
+class TestBatchingProcessPoolFacade:
+    def test_with_full_batches(self):
+        with MyBatchingProcessPoolFacade(worker_function=special_sum, max_batch_size=2) as facade:
+            for alpha in range(6):
+                facade.send_numbers(alpha, 1)
+
+        assert facade.results.get() == [alpha + 2 for alpha in range(6)]
+        assert facade.batch_counter.get() == 3
+
+    def test_partial_batch_is_sent_on_close(self):
+        with MyBatchingProcessPoolFacade(worker_function=special_sum, max_batch_size=4) as facade:
+            for alpha in range(5):
+                facade.send_numbers(alpha, 1)
+
+            assert facade.batch_counter.get() == 1
+
+        assert facade.results.get() == [alpha + 2 for alpha in range(5)]
+        assert facade.batch_counter.get() == 2
+
+    def test_partial_batch_is_sent_after_delay(self):
+        with MyBatchingProcessPoolFacade(
+            worker_function=fast_sum, max_batch_size=100, max_batch_delay_seconds=0.05
+        ) as facade:
+            facade.send_numbers(7, 90)
+            facade.send_numbers(8, 90)
+
+            sleep(0.3)
+
+            assert facade.results.get() == [97, 98]
+            assert facade.batch_counter.get() == 1
+
+    def test_with_exceptions(self):
+        with MyBatchingProcessPoolFacade(
+            worker_function=special_sum_with_error, max_batch_size=3
+        ) as facade:
+            facade.send_numbers(9, 4)
+            facade.send_numbers(90, 8)
+            facade.send_numbers(5, 7)
+            facade.send_numbers(90, 2)
+
+        assert facade.results.get() == [9 + 4 + 1, 5 + 7 + 1]
+        assert facade.error_counter.get() == 2
+
+    def test_with_whole_batch_failing(self):
+        facade = MyBatchingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(1),
+            worker_function=sum_aborting_batch,
+            max_batch_size=3,
+        )
+
+        facade.send_numbers(1, 2)
+        facade.send_numbers(90, 8)
+        facade.send_numbers(5, 7)
+        facade.send_numbers(3, 4)
+
+        report = facade.close_and_join()
+
+        assert facade.results.get() == [7]
+        assert facade.error_counter.get() == 3
+        assert report.completed_count == 1
+        assert report.failed_count == 1
+
+    def test_timed_sends_are_batched(self):
+        with MyBatchingProcessPoolFacade(worker_function=fast_sum, max_batch_size=3) as facade:
+            for value in range(6):
+                assert facade._try_send_to_worker((value, 1))
+
+        assert facade.results.get() == [1, 2, 3, 4, 5, 6]
+        assert facade.batch_counter.get() == 2
+
+    def test_timed_send_filling_batch_without_slot(self):
+        with MyBatchingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(1),
+            worker_function=slow_sum,
+            max_batch_size=2,
+            max_pending_async_requests=1,
+        ) as facade:
+            assert facade._try_send_to_worker((1, 2))
+            assert facade._try_send_to_worker((3, 4))
+
+            assert facade._try_send_to_worker((5, 6))
+            assert not facade._try_send_to_worker((7, 8))
+
+        assert facade.results.get() == [3, 7, 11]
+        assert facade.batch_counter.get() == 2
+
+    def test_batch_size_tuning(self):
+        with MyBatchingProcessPoolFacade(
+            worker_function=special_sum, max_batch_size=20, target_batch_seconds=0.1
+        ) as facade:
+            for alpha in range(20):
+                facade.send_numbers(alpha, 0)
+
+            assert 1 <= facade.batch_size < 20
+
+    def test_with_process_pool(self):
+        with MyBatchingProcessPoolFacade(
+            pool_factory=lambda: Pool(2),
+            worker_function=fast_sum,
+            max_batch_size=3,
+            max_pending_async_requests=2,
+        ) as facade:
+            for alpha in range(10):
+                facade.send_numbers(alpha, 1)
+
+        assert sorted(facade.results.get()) == [alpha + 1 for alpha in range(10)]
+        assert facade.batch_counter.get() == 4
+
+    def test_with_invalid_batch_size(self):
+        with raises(ValueError) as ex:
+            MyBatchingProcessPoolFacade(worker_function=fast_sum, max_batch_size=0)
+
+        assert ex.value.args == (0,)
@@ -0,0 +1,155 @@
+from time import sleep
+
+from pytest import approx, raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.caching import (
+    CachingProcessPoolFacade,
+    get_request_key,
+)
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+call_counter = Atomic(0)
+
+
+def slow_square(value: int, delay_seconds: float = 0) -> int:
+    call_counter.map(lambda count: count + 1)
+    sleep(delay_seconds)
+
+    if value < 0:
+        raise ValueError(value)
+
+    return value**2
+
+
+class MyCachingProcessPoolFacade(CachingProcessPoolFacade[int]):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(worker_function=slow_square, **kwargs)
+        self.results = Atomic[list[int]]([])
+        self.error_counter = Atomic(0)
+
+    def _on_worker_result(self, worker_result: int) -> None:
+        self.results.map(lambda results: results + [worker_result])
+
+    def _on_worker_error(self, _: BaseException) -> None:
+        self.error_counter.map(lambda value: value + 1)
+
+    def send(self, *args, **kwargs) -> None:
+        self._send_to_worker(*args, **kwargs)
+
+
+class TestGetRequestKey:
+    def test_same_arguments(self):
+        assert get_request_key((1, [2]), {"a": 3, "b": 4}) == get_request_key(
+            (1, [2]), {"b": 4, "a": 3}
+        )
+
+    def test_different_arguments(self):
+        assert get_request_key((1,), {}) != get_request_key((2,), {})
+
+
+class TestCachingProcessPoolFacade:
+    def setup_method(self):
+        call_counter.set(0)
+
+    def test_cache_hits(self):
+        with MyCachingProcessPoolFacade(pool_factory=InThreadPool) as facade:
+            facade.send(3)
+            facade.send(3)
+            facade.send(4)
+            facade.send(3)
+
+        assert facade.results.get() == [9, 9, 16, 9]
+        assert call_counter.get() == 2
+
+        stats = facade.cache_stats
+        assert stats.request_count == 4
+        assert stats.cache_hit_count == 2
+        assert stats.coalesced_count == 0
+        assert stats.cached_result_count == 2
+        assert stats.hit_ratio == approx(0.5)
+
+    def test_timed_sends_use_cache(self):
+        with MyCachingProcessPoolFacade(pool_factory=InThreadPool) as facade:
+            assert facade._try_send_to_worker((7,))
+            assert facade._try_send_to_worker((7,))
+
+        assert facade.results.get() == [49, 49]
+        assert call_counter.get() == 1
+        assert facade.cache_stats.cache_hit_count == 1
+
+    def test_rejected_timed_send(self):
+        with MyCachingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(1), max_pending_async_requests=1
+        ) as facade:
+            facade.send(8, delay_seconds=0.1)
+
+            assert not facade._try_send_to_worker((9,))
+
+        assert facade.results.get() == [64]
+        assert facade.cache_stats.request_count == 1
+
+    def test_coalescing(self):
+        with MyCachingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(4), max_cached_results=0
+        ) as facade:
+            for _ in range(3):
+                facade.send(5, delay_seconds=0.2)
+
+        assert facade.results.get() == [25, 25, 25]
+        assert call_counter.get() == 1
+        assert facade.cache_stats.coalesced_count == 2
+        assert facade.cache_stats.cached_result_count == 0
+
+    def test_lru_eviction(self):
+        with MyCachingProcessPoolFacade(pool_factory=InThreadPool, max_cached_results=2) as facade:
+            facade.send(1)
+            facade.send(2)
+            facade.send(1)
+            facade.send(3)
+            facade.send(2)
+
+        assert call_counter.get() == 4
+        assert facade.cache_stats.cache_hit_count == 1
+
+    def test_ttl(self):
+        with MyCachingProcessPoolFacade(
+            pool_factory=InThreadPool, result_ttl_seconds=0.05
+        ) as facade:
+            facade.send(6)
+            facade.send(6)
+            sleep(0.1)
+            facade.send(6)
+
+        assert call_counter.get() == 2
+
+    def test_clear_cache(self):
+        with MyCachingProcessPoolFacade(pool_factory=InThreadPool) as facade:
+            facade.send(6)
+            facade.clear_cache()
+            facade.send(6)
+
+        assert call_counter.get() == 2
+
+    def test_errors_are_shared_but_not_cached(self):
+        with MyCachingProcessPoolFacade(pool_factory=create_thread_pool_factory(4)) as facade:
+            facade.send(-1, delay_seconds=0.2)
+            facade.send(-1, delay_seconds=0.2)
+
+        assert facade.error_counter.get() == 2
+        assert call_counter.get() == 1
+        assert facade.cache_stats.cached_result_count == 0
+
+    def test_empty_stats(self):
+        with MyCachingProcessPoolFacade(pool_factory=InThreadPool) as facade:
+            assert facade.cache_stats.hit_ratio == 0
+
+    def test_invalid_arguments(self):
+        with raises(ValueError):
+            MyCachingProcessPoolFacade(pool_factory=InThreadPool, max_cached_results=-1)
+
+        with raises(ValueError):
+            MyCachingProcessPoolFacade(pool_factory=InThreadPool, result_ttl_seconds=0)
@@ -0,0 +1,110 @@
+from re import compile
+from uuid import uuid4
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool.context import (
+    WorkerContext,
+    bind_worker_context,
+    call_with_worker_context,
+    discard_worker_context,
+)
+
+
+def initialize(context: WorkerContext) -> None:
+    context.pattern = compile(r"\d+")
+    context.task_count = 0
+
+
+def count_digit_groups(context: WorkerContext, text: str) -> tuple[int, int]:
+    context.task_count += 1
+    return len(context.pattern.findall(text)), context.task_count
+
+
+class InitializationTestException(Exception):
+    pass
+
+
+class TestCallWithWorkerContext:
+    def test_context_is_initialized_once(self):
+        context_key = uuid4().hex
+
+        first_result = call_with_worker_context(
+            context_key, initialize, count_digit_groups, "7 and 90"
+        )
+        second_result = call_with_worker_context(context_key, initialize, count_digit_groups, "92")
+
+        assert first_result == (2, 1)
+        assert second_result == (1, 2)
+
+        discard_worker_context(context_key)
+
+    def test_contexts_with_different_keys_are_distinct(self):
+        first_key = uuid4().hex
+        second_key = uuid4().hex
+
+        call_with_worker_context(first_key, initialize, count_digit_groups, "7")
+        result = call_with_worker_context(second_key, initialize, count_digit_groups, "7")
+
+        assert result == (1, 1)
+
+        discard_worker_context(first_key)
+        discard_worker_context(second_key)
+
+    def test_discarded_context_is_initialized_again(self):
+        context_key = uuid4().hex
+
+        call_with_worker_context(context_key, initialize, count_digit_groups, "7")
+        discard_worker_context(context_key)
+        result = call_with_worker_context(context_key, initialize, count_digit_groups, "7")
+
+        assert result == (1, 1)
+
+        discard_worker_context(context_key)
+
+    def test_failing_initializer_is_retried(self):
+        context_key = uuid4().hex
+        attempts = 0
+
+        def flaky_initialize(context: WorkerContext) -> None:
+            nonlocal attempts
+            attempts += 1
+
+            if attempts == 1:
+                raise InitializationTestException()
+
+            initialize(context)
+
+        with raises(InitializationTestException):
+            call_with_worker_context(context_key, flaky_initialize, count_digit_groups, "7")
+
+        result = call_with_worker_context(context_key, flaky_initialize, count_digit_groups, "7")
+
+        assert result == (1, 1)
+        assert attempts == 2
+
+        discard_worker_context(context_key)
+
+
+class TestBindWorkerContext:
+    def test_without_initializer(self):
+        context_key, worker_function = bind_worker_context(None, len)
+
+        assert context_key is None
+        assert worker_function is len
+
+    def test_with_initializer(self):
+        context_key, worker_function = bind_worker_context(initialize, count_digit_groups)
+
+        assert context_key
+
+        assert worker_function("1 2") == (2, 1)
+        assert worker_function("3") == (1, 2)
+
+        discard_worker_context(context_key)
+
+    def test_keys_are_distinct(self):
+        first_key, _ = bind_worker_context(initialize, count_digit_groups)
+        second_key, _ = bind_worker_context(initialize, count_digit_groups)
+
+        assert first_key != second_key
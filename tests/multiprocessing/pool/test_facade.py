@@ -1,11 +1,26 @@
-from time import sleep
-from typing import Callable
+from multiprocessing import Pool
+from time import monotonic, sleep
+from typing import Callable, Optional
+from uuid import uuid4
 
 from pytest import raises
 
-from info.gianlucacosta.eos.core.multiprocessing.pool import InThreadPool
-from info.gianlucacosta.eos.core.multiprocessing.pool.facade import ProcessPoolFacade
+from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    ProcessPoolFactory,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.context import (
+    WorkerContext,
+    WorkerInitializer,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.facade import (
+    ProcessPoolFacade,
+    ShutdownReport,
+)
 from info.gianlucacosta.eos.core.threading.atomic import Atomic
+from info.gianlucacosta.eos.core.threading.limiters import AdaptiveConcurrencyLimiter
 
 
 def special_sum(alpha: int, beta: int) -> int:
@@ -21,17 +36,33 @@ def special_sum_with_error(alpha: int, beta: int) -> int:
     return alpha + beta + 1
 
 
+def initialize_worker(context: WorkerContext) -> None:
+    context.worker_id = uuid4().hex
+    context.offset = 1000
+
+
+def offset_sum(context: WorkerContext, alpha: int, beta: int) -> int:
+    return alpha + beta + context.offset
+
+
+def get_worker_id(context: WorkerContext, *_: int) -> str:
+    return context.worker_id
+
+
 class MyProcessPoolFacade(ProcessPoolFacade[int]):
     def __init__(
         self,
         worker_function: Callable[..., int],
         atomic: Atomic[int],
         max_pending_async_requests: int,
+        worker_initializer: Optional[WorkerInitializer] = None,
+        pool_factory: ProcessPoolFactory = InThreadPool,
     ):
         super().__init__(
-            pool_factory=InThreadPool,
+            pool_factory=pool_factory,
             worker_function=worker_function,
             max_pending_async_requests=max_pending_async_requests,
+            worker_initializer=worker_initializer,
         )
         self._atomic = atomic
         self._error_counter = Atomic(0)
@@ -84,3 +115,243 @@ class TestProcessPoolFacade:
             MyProcessPoolFacade(special_sum_with_error, atomic, max_pending_async_requests=-5)
 
         assert ex.value.args == (-5,)
+
+    def test_with_worker_initializer(self):
+        atomic = Atomic(0)
+        with MyProcessPoolFacade(
+            offset_sum,
+            atomic,
+            max_pending_async_requests=2,
+            worker_initializer=initialize_worker,
+        ) as pool_facade:
+            pool_facade.send_numbers(9, 4)
+            pool_facade.send_numbers(3, 8)
+
+        assert atomic.get() == (9 + 4) + (3 + 8) + 1000 * 2
+
+
+class WorkerIdCollectingFacade(ProcessPoolFacade[str]):
+    def __init__(self, pool_factory: ProcessPoolFactory) -> None:
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=get_worker_id,
+            max_pending_async_requests=4,
+            worker_initializer=initialize_worker,
+        )
+        self.worker_ids = Atomic[set[str]](set())
+
+    def _on_worker_result(self, worker_result: str) -> None:
+        self.worker_ids.map(lambda worker_ids: worker_ids | {worker_result})
+
+    def send(self) -> None:
+        self._send_to_worker()
+
+
+class TestWorkerContexts:
+    def test_single_context_within_in_thread_pool(self):
+        with WorkerIdCollectingFacade(InThreadPool) as facade:
+            for _ in range(10):
+                facade.send()
+
+        assert len(facade.worker_ids.get()) == 1
+
+    def test_one_context_per_process(self):
+        with WorkerIdCollectingFacade(lambda: Pool(2)) as facade:
+            for _ in range(10):
+                facade.send()
+
+        assert 1 <= len(facade.worker_ids.get()) <= 2
+
+
+class TestFacadeWithConcurrencyLimiter:
+    def test_with_adaptive_limiter(self):
+        limiter = AdaptiveConcurrencyLimiter(InclusiveRange(1, 4))
+
+        class LimitedFacade(ProcessPoolFacade[int]):
+            def __init__(self) -> None:
+                super().__init__(
+                    pool_factory=InThreadPool,
+                    worker_function=special_sum,
+                    concurrency_limiter=limiter,
+                )
+                self.results = Atomic(0)
+
+            def _on_worker_result(self, worker_result: int) -> None:
+                self.results.map(lambda value: value + worker_result)
+
+            def send_numbers(self, alpha: int, beta: int) -> None:
+                self._send_to_worker(alpha, beta)
+
+        with LimitedFacade() as facade:
+            for alpha in range(5):
+                facade.send_numbers(alpha, 0)
+
+        assert facade.results.get() == sum(range(5)) + 5
+        assert limiter.in_flight == 0
+
+
+class TestFacadeWithThreadPool:
+    def test_with_common_scenario(self):
+        atomic = Atomic(0)
+        with MyProcessPoolFacade(
+            special_sum,
+            atomic,
+            max_pending_async_requests=3,
+            pool_factory=create_thread_pool_factory(3),
+        ) as pool_facade:
+            for alpha in range(10):
+                pool_facade.send_numbers(alpha, 1)
+
+        assert atomic.get() == sum(alpha + 2 for alpha in range(10))
+
+
+def slow_sum(alpha: int, beta: int) -> int:
+    sleep(0.5)
+    return alpha + beta
+
+
+class TestShutdownWithDeadline:
+    def test_report_without_timeout(self):
+        atomic = Atomic(0)
+        pool_facade = MyProcessPoolFacade(
+            special_sum_with_error, atomic, max_pending_async_requests=2
+        )
+
+        pool_facade.send_numbers(9, 4)
+        pool_facade.send_numbers(90, 8)
+        pool_facade.send_numbers(5, 7)
+
+        report = pool_facade.close_and_join()
+
+        assert report == ShutdownReport(completed_count=2, failed_count=1, abandoned_count=0)
+        assert report.drained
+
+    def test_drained_within_deadline(self):
+        atomic = Atomic(0)
+        pool_facade = MyProcessPoolFacade(
+            special_sum, atomic, max_pending_async_requests=2, pool_factory=lambda: Pool(2)
+        )
+
+        pool_facade.send_numbers(1, 2)
+        pool_facade.send_numbers(3, 4)
+
+        report = pool_facade.close_and_join(timeout_seconds=10)
+
+        assert report == ShutdownReport(completed_count=2, failed_count=0, abandoned_count=0)
+        assert atomic.get() == 1 + 2 + 3 + 4 + 2
+
+    def test_abandoned_with_pool(self):
+        atomic = Atomic(0)
+        pool_facade = MyProcessPoolFacade(
+            slow_sum, atomic, max_pending_async_requests=4, pool_factory=lambda: Pool(1)
+        )
+
+        for alpha in range(4):
+            pool_facade.send_numbers(alpha, 1)
+
+        start_time = monotonic()
+        report = pool_facade.close_and_join(timeout_seconds=0.1)
+
+        assert monotonic() - start_time < 0.5
+        assert report == ShutdownReport(completed_count=0, failed_count=0, abandoned_count=4)
+        assert not report.drained
+        assert atomic.get() == 0
+
+    def test_abandoned_with_executor_pool(self):
+        atomic = Atomic(0)
+        pool_facade = MyProcessPoolFacade(
+            slow_sum,
+            atomic,
+            max_pending_async_requests=4,
+            pool_factory=create_thread_pool_factory(1),
+        )
+
+        for alpha in range(4):
+            pool_facade.send_numbers(alpha, 1)
+
+        report = pool_facade.close_and_join(timeout_seconds=0.1)
+
+        assert report == ShutdownReport(completed_count=1, failed_count=0, abandoned_count=3)
+        assert atomic.get() == 1
+
+    def test_with_negative_timeout(self):
+        pool_facade = MyProcessPoolFacade(special_sum, Atomic(0), max_pending_async_requests=2)
+
+        with raises(ValueError) as ex:
+            pool_facade.close_and_join(timeout_seconds=-1)
+
+        assert ex.value.args == (-1,)
+
+
+def weighted_sum(weight: int, beta: int) -> int:
+    sleep(0.2)
+    return weight + beta
+
+
+class WeightedFacade(ProcessPoolFacade[int]):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(
+            pool_factory=create_thread_pool_factory(4), worker_function=weighted_sum, **kwargs
+        )
+        self.results = Atomic(0)
+
+    def _on_worker_result(self, worker_result: int) -> None:
+        self.results.map(lambda value: value + worker_result)
+
+    def send(self, weight: int, beta: int) -> None:
+        self._send_to_worker(weight, beta)
+
+    def try_send(self, weight: int, beta: int, timeout_seconds: Optional[float] = 0) -> bool:
+        return self._try_send_to_worker((weight, beta), timeout_seconds=timeout_seconds)
+
+
+class TestTrySendAndWeightedAdmission:
+    def test_try_send_without_blocking(self):
+        with WeightedFacade(max_pending_async_requests=1) as facade:
+            assert facade.try_send(1, 2)
+            assert not facade.try_send(3, 4)
+
+        assert facade.results.get() == 3
+
+    def test_try_send_with_timeout(self):
+        with WeightedFacade(max_pending_async_requests=1) as facade:
+            assert facade.try_send(1, 2)
+            assert not facade.try_send(3, 4, timeout_seconds=0.05)
+            assert facade.try_send(5, 6, timeout_seconds=2)
+
+        assert facade.results.get() == 3 + 11
+
+    def test_try_send_with_kwargs_and_explicit_weight(self):
+        with WeightedFacade(max_pending_async_requests=4, max_pending_weight=10) as facade:
+            assert facade._try_send_to_worker((), {"weight": 1, "beta": 2}, weight=8)
+            assert not facade._try_send_to_worker((), {"weight": 1, "beta": 2}, weight=8)
+
+        assert facade.results.get() == 3
+
+    def test_weighted_admission(self):
+        with WeightedFacade(
+            max_pending_async_requests=4,
+            max_pending_weight=10,
+            request_weigher=lambda weight, _: weight,
+        ) as facade:
+            assert facade.try_send(6, 0)
+            assert not facade.try_send(6, 0)
+            assert facade.try_send(4, 0)
+
+            start_time = monotonic()
+            facade.send(3, 0)
+            assert monotonic() - start_time >= 0.1
+
+        assert facade.results.get() == 6 + 4 + 3
+        assert facade._weight_budget and facade._weight_budget.in_use == 0
+
+    def test_oversized_request(self):
+        with WeightedFacade(
+            max_pending_async_requests=4,
+            max_pending_weight=10,
+            request_weigher=lambda weight, _: weight,
+        ) as facade:
+            facade.send(50, 0)
+            assert not facade.try_send(1, 0)
+
+        assert facade.results.get() == 50
@@ -0,0 +1,121 @@
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import InThreadPool
+from info.gianlucacosta.eos.core.multiprocessing.pool.batching import BatchingProcessPoolFacade
+from info.gianlucacosta.eos.core.multiprocessing.pool.facade import ProcessPoolFacade
+from info.gianlucacosta.eos.core.multiprocessing.pool.metrics import (
+    InMemoryPoolMetrics,
+    LatencyHistogram,
+)
+
+from .test_facade import special_sum, special_sum_with_error
+
+
+class TestLatencyHistogram:
+    def test_without_values(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.mean_seconds is None
+        assert histogram.max_seconds is None
+        assert histogram.get_percentile(50) is None
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram(min_bound_seconds=1, growth_factor=2, bucket_count=4)
+
+        for seconds in [0.5] * 90 + [3] * 9 + [100]:
+            histogram.record(seconds)
+
+        assert histogram.count == 100
+        assert histogram.get_percentile(50) == 1
+        assert histogram.get_percentile(95) == 4
+        assert histogram.get_percentile(100) == 100
+        assert histogram.max_seconds == 100
+
+    def test_mean(self):
+        histogram = LatencyHistogram()
+
+        histogram.record(1)
+        histogram.record(3)
+
+        assert histogram.mean_seconds == 2
+
+    def test_with_invalid_percentile(self):
+        with raises(ValueError) as ex:
+            LatencyHistogram().get_percentile(101)
+
+        assert ex.value.args == (101,)
+
+    def test_with_invalid_growth_factor(self):
+        with raises(ValueError) as ex:
+            LatencyHistogram(growth_factor=1)
+
+        assert ex.value.args == (1,)
+
+
+class MeasuredFacade(ProcessPoolFacade[int]):
+    def _on_worker_result(self, worker_result: int) -> None:
+        pass
+
+    def send_numbers(self, alpha: int, beta: int) -> None:
+        self._send_to_worker(alpha, beta)
+
+
+class MeasuredBatchingFacade(BatchingProcessPoolFacade[int]):
+    def _on_worker_result(self, worker_result: int) -> None:
+        pass
+
+    def send_numbers(self, alpha: int, beta: int) -> None:
+        self._send_to_worker(alpha, beta)
+
+
+class TestInMemoryPoolMetrics:
+    def test_with_facade(self):
+        metrics = InMemoryPoolMetrics()
+
+        with MeasuredFacade(
+            InThreadPool,
+            special_sum_with_error,
+            max_pending_async_requests=2,
+            metrics_sink=metrics,
+        ) as facade:
+            facade.send_numbers(9, 4)
+            facade.send_numbers(90, 8)
+            facade.send_numbers(5, 7)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot.task_count == 3
+        assert snapshot.failed_task_count == 1
+        assert snapshot.worker_error_count == 1
+        assert snapshot.in_flight == 0
+        assert snapshot.max_in_flight == 1
+        assert snapshot.latency_p50_seconds is not None
+        assert snapshot.admission_wait_p99_seconds is not None
+        assert metrics.admission_wait_histogram.count == 3
+
+    def test_with_batching_facade(self):
+        metrics = InMemoryPoolMetrics()
+
+        with MeasuredBatchingFacade(
+            InThreadPool, special_sum_with_error, max_batch_size=4, metrics_sink=metrics
+        ) as facade:
+            facade.send_numbers(90, 4)
+            facade.send_numbers(90, 8)
+            facade.send_numbers(5, 7)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot.task_count == 1
+        assert snapshot.failed_task_count == 0
+        assert snapshot.worker_error_count == 2
+
+    def test_without_measurements(self):
+        snapshot = InMemoryPoolMetrics().snapshot()
+
+        assert snapshot.task_count == 0
+        assert snapshot.latency_p99_seconds is None
+
+    def test_facade_without_sink(self):
+        with MeasuredFacade(InThreadPool, special_sum) as facade:
+            facade.send_numbers(1, 2)
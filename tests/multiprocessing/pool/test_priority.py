@@ -0,0 +1,194 @@
+from threading import Thread
+from time import sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.priority import PriorityProcessPoolFacade
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+
+def label_slowly(label: str) -> str:
+    sleep(0.05)
+    return label
+
+
+def fail_on_bad_label(label: str) -> str:
+    if label == "bad":
+        raise ValueError(label)
+
+    return label
+
+
+class MyPriorityProcessPoolFacade(PriorityProcessPoolFacade[str]):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.labels = Atomic[list[str]]([])
+        self.error_counter = Atomic(0)
+
+    def _on_worker_result(self, worker_result: str) -> None:
+        self.labels.map(lambda labels: labels + [worker_result])
+
+    def _on_worker_error(self, _: BaseException) -> None:
+        self.error_counter.map(lambda value: value + 1)
+
+    def send(self, priority: int, label: str) -> None:
+        self._send_to_worker_with_priority(priority, label)
+
+
+def create_single_slot_facade(**kwargs) -> MyPriorityProcessPoolFacade:
+    return MyPriorityProcessPoolFacade(
+        pool_factory=create_thread_pool_factory(1),
+        worker_function=label_slowly,
+        max_pending_async_requests=1,
+        **kwargs,
+    )
+
+
+class TestPriorityProcessPoolFacade:
+    def test_urgent_requests_go_first(self):
+        with create_single_slot_facade() as facade:
+            facade.send(2, "first")
+            facade.send(2, "batch 1")
+            facade.send(2, "batch 2")
+            facade.send(0, "interactive")
+            facade.send(1, "normal")
+
+            assert facade.queued_count == 4
+
+        assert facade.labels.get() == ["first", "interactive", "normal", "batch 1", "batch 2"]
+        assert facade.queued_count == 0
+
+    def test_starving_requests_are_served(self):
+        with create_single_slot_facade(max_wait_seconds=0) as facade:
+            facade.send(2, "first")
+            facade.send(2, "batch")
+            facade.send(0, "interactive")
+
+        assert facade.labels.get() == ["first", "batch", "interactive"]
+
+    def test_default_priority(self):
+        with create_single_slot_facade(default_priority=2) as facade:
+            facade.send(2, "first")
+            facade._send_to_worker("default")
+            facade.send(1, "normal")
+
+        assert facade.labels.get() == ["first", "normal", "default"]
+
+    def test_bounded_queue(self):
+        with create_single_slot_facade(max_queued_requests=1) as facade:
+            for index in range(4):
+                facade.send(0, str(index))
+
+                assert facade.queued_count <= 1
+
+        assert facade.labels.get() == [str(index) for index in range(4)]
+
+    def test_timed_sends_are_queued_by_priority(self):
+        with create_single_slot_facade(default_priority=2, max_queued_requests=2) as facade:
+            facade.send(2, "first")
+
+            assert facade._try_send_to_worker(("default",))
+            assert facade._try_send_to_worker_with_priority(0, ("interactive",))
+            assert not facade._try_send_to_worker(("rejected",))
+
+        assert facade.labels.get() == ["first", "interactive", "default"]
+
+    def test_with_in_thread_pool_and_errors(self):
+        with MyPriorityProcessPoolFacade(
+            pool_factory=InThreadPool, worker_function=fail_on_bad_label
+        ) as facade:
+            facade.send(1, "alpha")
+            facade.send(0, "bad")
+            facade.send(2, "beta")
+
+        assert facade.labels.get() == ["alpha", "beta"]
+        assert facade.error_counter.get() == 1
+
+    def test_with_multi_worker_thread_pool_and_concurrent_producers(self):
+        producer_count = 4
+        labels_per_producer = 500
+
+        facade = MyPriorityProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(4),
+            worker_function=fail_on_bad_label,
+            max_pending_async_requests=2,
+            max_queued_requests=8,
+        )
+
+        def produce(producer_index: int) -> None:
+            for label_index in range(labels_per_producer):
+                facade.send(label_index % 3, f"{producer_index}-{label_index}")
+
+        def run() -> None:
+            with facade:
+                producers = [
+                    Thread(target=produce, args=(producer_index,))
+                    for producer_index in range(producer_count)
+                ]
+
+                for producer in producers:
+                    producer.start()
+
+                for producer in producers:
+                    producer.join()
+
+        runner = Thread(target=run, daemon=True)
+        runner.start()
+        runner.join(60)
+
+        assert not runner.is_alive()
+        assert len(facade.labels.get()) == producer_count * labels_per_producer
+        assert facade.queued_count == 0
+
+    def test_dispatch_errors_are_discarded(self):
+        class RejectingFacade(MyPriorityProcessPoolFacade):
+            def _submit_to_pool(self, function, args, kwargs, callback, error_callback) -> None:
+                if args == ("rejected",):
+                    raise ValueError("Pool not running")
+
+                super()._submit_to_pool(function, args, kwargs, callback, error_callback)
+
+        with RejectingFacade(
+            pool_factory=create_thread_pool_factory(2),
+            worker_function=label_slowly,
+            max_pending_async_requests=1,
+        ) as facade:
+            facade.send(0, "first")
+            facade.send(0, "rejected")
+            facade.send(0, "last")
+
+        assert facade.labels.get() == ["first", "last"]
+        assert facade.queued_count == 0
+
+    def test_with_invalid_priority(self):
+        with MyPriorityProcessPoolFacade(
+            pool_factory=InThreadPool, worker_function=label_slowly
+        ) as facade:
+            with raises(ValueError) as ex:
+                facade.send(3, "alpha")
+
+        assert ex.value.args == (3,)
+
+    def test_with_invalid_default_priority(self):
+        with raises(ValueError) as ex:
+            MyPriorityProcessPoolFacade(
+                pool_factory=InThreadPool, worker_function=label_slowly, default_priority=5
+            )
+
+        assert ex.value.args == (5,)
+
+    def test_queued_requests_abandoned_at_deadline(self):
+        facade = create_single_slot_facade()
+
+        for index in range(5):
+            facade.send(1, str(index))
+
+        report = facade.close_and_join(timeout_seconds=0.01)
+
+        assert report.abandoned_count >= 3
+        assert facade.queued_count == 0
+        assert report.completed_count + report.abandoned_count == 5
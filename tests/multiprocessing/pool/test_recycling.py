@@ -0,0 +1,178 @@
+from os import getpid
+from threading import Thread
+from time import sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_process_pool_factory,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.metrics import InMemoryPoolMetrics
+from info.gianlucacosta.eos.core.multiprocessing.pool.recycling import (
+    RecyclingProcessPoolFacade,
+    call_with_rss_measurement,
+    get_resident_set_bytes,
+)
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+
+def get_pid_or_fail(value: int) -> int:
+    if value < 0:
+        raise ValueError(value)
+
+    return getpid()
+
+
+def sleep_then_get_pid(seconds: int) -> int:
+    sleep(seconds)
+    return getpid()
+
+
+class MyRecyclingProcessPoolFacade(RecyclingProcessPoolFacade[int]):
+    def __init__(self, worker_function=get_pid_or_fail, **kwargs) -> None:
+        super().__init__(worker_function=worker_function, **kwargs)
+        self.pids = Atomic[list[int]]([])
+        self.error_counter = Atomic(0)
+
+    def _on_worker_result(self, worker_result: int) -> None:
+        self.pids.map(lambda pids: pids + [worker_result])
+
+    def _on_worker_error(self, _: BaseException) -> None:
+        self.error_counter.map(lambda value: value + 1)
+
+    def send(self, value: int) -> None:
+        self._send_to_worker(value)
+
+
+class TestGetResidentSetBytes:
+    def test_positive_value(self):
+        rss_bytes = get_resident_set_bytes()
+
+        assert rss_bytes is None or rss_bytes > 0
+
+    def test_measurement(self):
+        result, _ = call_with_rss_measurement(lambda alpha, beta: alpha + beta, 90, beta=2)
+
+        assert result == 92
+
+
+class TestRecyclingProcessPoolFacade:
+    def test_recycling_after_tasks(self):
+        metrics = InMemoryPoolMetrics()
+
+        with MyRecyclingProcessPoolFacade(
+            pool_factory=create_process_pool_factory(1),
+            max_tasks_per_pool=3,
+            max_pending_async_requests=1,
+            metrics_sink=metrics,
+        ) as facade:
+            for value in range(8):
+                facade.send(value if value != 4 else -1)
+
+        pids = facade.pids.get()
+
+        assert len(pids) == 7
+        assert facade.error_counter.get() == 1
+        assert len(set(pids)) == 3
+        assert facade.recycle_count == 2
+        assert metrics.snapshot().recycle_count == 2
+
+    def test_recycling_after_rss_threshold(self):
+        if get_resident_set_bytes() is None:
+            return
+
+        with MyRecyclingProcessPoolFacade(
+            pool_factory=InThreadPool, max_worker_rss_bytes=1
+        ) as facade:
+            facade.send(1)
+            facade.send(2)
+
+        assert facade.pids.get() == [getpid(), getpid()]
+        assert facade.recycle_count == 2
+
+    def test_task_running_in_retired_pool_is_awaited(self):
+        facade = MyRecyclingProcessPoolFacade(
+            worker_function=sleep_then_get_pid,
+            pool_factory=create_process_pool_factory(2),
+            max_tasks_per_pool=1,
+            max_pending_async_requests=2,
+        )
+
+        facade.send(1)
+        facade.send(0)
+        sleep(0.5)
+
+        report = facade.close_and_join()
+
+        assert facade.recycle_count == 1
+        assert len(facade.pids.get()) == 2
+        assert report.completed_count == 2
+        assert report.abandoned_count == 0
+
+    def test_task_running_in_retired_pool_is_abandoned_at_deadline(self):
+        facade = MyRecyclingProcessPoolFacade(
+            worker_function=sleep_then_get_pid,
+            pool_factory=create_process_pool_factory(2),
+            max_tasks_per_pool=1,
+            max_pending_async_requests=2,
+        )
+
+        facade.send(5)
+        facade.send(0)
+        sleep(0.5)
+
+        report = facade.close_and_join(timeout_seconds=0.2)
+
+        assert facade.recycle_count == 1
+        assert len(facade.pids.get()) == 1
+        assert report.completed_count == 1
+        assert report.abandoned_count == 1
+
+    def test_timed_sends_recycle_pool(self):
+        with MyRecyclingProcessPoolFacade(
+            pool_factory=InThreadPool, max_tasks_per_pool=1
+        ) as facade:
+            assert facade._try_send_to_worker((1,))
+            assert facade._try_send_to_worker((2,))
+
+        assert facade.pids.get() == [getpid(), getpid()]
+        assert facade.recycle_count == 2
+
+    def test_thread_pool_stress_while_recycling(self):
+        task_count = 20000
+
+        facade = MyRecyclingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(4),
+            max_tasks_per_pool=500,
+            max_pending_async_requests=64,
+        )
+
+        def send_all() -> None:
+            with facade:
+                for value in range(task_count):
+                    facade.send(value)
+
+        sender = Thread(target=send_all, daemon=True)
+        sender.start()
+        sender.join(60)
+
+        assert not sender.is_alive()
+        assert len(facade.pids.get()) == task_count
+        assert facade.error_counter.get() == 0
+        assert facade.recycle_count > 0
+
+    def test_no_recycling_by_default(self):
+        with MyRecyclingProcessPoolFacade(pool_factory=InThreadPool) as facade:
+            for value in range(5):
+                facade.send(value)
+
+        assert facade.recycle_count == 0
+
+    def test_invalid_arguments(self):
+        with raises(ValueError):
+            MyRecyclingProcessPoolFacade(pool_factory=InThreadPool, max_tasks_per_pool=0)
+
+        with raises(ValueError):
+            MyRecyclingProcessPoolFacade(pool_factory=InThreadPool, max_worker_rss_bytes=0)
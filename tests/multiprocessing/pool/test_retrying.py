@@ -0,0 +1,171 @@
+from time import sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.functional.retries import RetryPolicy
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.retrying import RetryingProcessPoolFacade
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+attempt_counters: dict[str, Atomic[int]] = {}
+
+
+class TransientError(Exception):
+    pass
+
+
+def fail_initially(label: str, failure_count: int) -> str:
+    attempts = attempt_counters[label].map_then_get(lambda value: value + 1)
+
+    if attempts <= failure_count:
+        raise TransientError(label)
+
+    return label
+
+
+def succeed_slowly(label: str) -> str:
+    sleep(0.1)
+    return label
+
+
+def fail_permanently(label: str) -> str:
+    attempt_counters[label].map(lambda value: value + 1)
+    raise ValueError(label)
+
+
+class MyRetryingProcessPoolFacade(RetryingProcessPoolFacade[str]):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.results = Atomic[list[str]]([])
+        self.errors = Atomic[list[BaseException]]([])
+
+    def _on_worker_result(self, worker_result: str) -> None:
+        self.results.map(lambda results: results + [worker_result])
+
+    def _on_worker_error(self, exception: BaseException) -> None:
+        self.errors.map(lambda errors: errors + [exception])
+
+    def send(self, *args) -> None:
+        attempt_counters[args[0]] = Atomic(0)
+        self._send_to_worker(*args)
+
+
+def create_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(**{"max_attempts": 3, "initial_delay_seconds": 0.01, **kwargs})
+
+
+class TestRetryingProcessPoolFacade:
+    def test_transient_failures(self):
+        with MyRetryingProcessPoolFacade(
+            pool_factory=InThreadPool,
+            worker_function=fail_initially,
+            retry_policy=create_policy(),
+        ) as facade:
+            facade.send("alpha", 2)
+            facade.send("beta", 0)
+
+        assert sorted(facade.results.get()) == ["alpha", "beta"]
+        assert facade.errors.get() == []
+        assert attempt_counters["alpha"].get() == 3
+        assert facade.retry_count == 2
+        assert facade.pending_retry_count == 0
+
+    def test_timed_send_is_retried(self):
+        attempt_counters["delta"] = Atomic(0)
+
+        with MyRetryingProcessPoolFacade(
+            pool_factory=InThreadPool,
+            worker_function=fail_initially,
+            retry_policy=create_policy(),
+        ) as facade:
+            assert facade._try_send_to_worker(("delta", 2))
+
+        assert facade.results.get() == ["delta"]
+        assert attempt_counters["delta"].get() == 3
+        assert facade.retry_count == 2
+
+    def test_rejected_timed_send_is_settled(self):
+        with MyRetryingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(1),
+            worker_function=succeed_slowly,
+            retry_policy=create_policy(),
+            max_pending_async_requests=1,
+        ) as facade:
+            assert facade._try_send_to_worker(("epsilon",))
+            assert not facade._try_send_to_worker(("zeta",))
+
+            report = facade.close_and_join(timeout_seconds=5)
+
+        assert facade.results.get() == ["epsilon"]
+        assert report.completed_count == 1
+        assert report.abandoned_count == 0
+
+    def test_permanent_failure(self):
+        with MyRetryingProcessPoolFacade(
+            pool_factory=create_thread_pool_factory(2),
+            worker_function=fail_permanently,
+            retry_policy=create_policy(),
+        ) as facade:
+            facade.send("gamma")
+
+        assert facade.results.get() == []
+        assert [error.args for error in facade.errors.get()] == [("gamma",)]
+        assert attempt_counters["gamma"].get() == 3
+        assert facade.retry_count == 2
+
+    def test_non_retryable_error(self):
+        with MyRetryingProcessPoolFacade(
+            pool_factory=InThreadPool,
+            worker_function=fail_permanently,
+            retry_policy=create_policy(
+                is_retryable=lambda error: isinstance(error, TransientError)
+            ),
+        ) as facade:
+            facade.send("delta")
+
+        assert len(facade.errors.get()) == 1
+        assert attempt_counters["delta"].get() == 1
+        assert facade.retry_count == 0
+
+    def test_facade_retry_limit(self):
+        with MyRetryingProcessPoolFacade(
+            pool_factory=InThreadPool,
+            worker_function=fail_initially,
+            retry_policy=create_policy(initial_delay_seconds=0.2),
+            max_pending_retries=1,
+        ) as facade:
+            facade.send("epsilon", 1)
+            facade.send("zeta", 1)
+
+        assert facade.results.get() == ["epsilon"]
+        assert [error.args for error in facade.errors.get()] == [("zeta",)]
+        assert facade.retry_count == 1
+
+    def test_invalid_max_pending_retries(self):
+        with raises(ValueError) as ex:
+            MyRetryingProcessPoolFacade(
+                pool_factory=InThreadPool,
+                worker_function=fail_permanently,
+                retry_policy=create_policy(),
+                max_pending_retries=-1,
+            )
+
+        assert ex.value.args == (-1,)
+
+    def test_scheduled_retries_abandoned_at_deadline(self):
+        facade = MyRetryingProcessPoolFacade(
+            pool_factory=InThreadPool,
+            worker_function=fail_permanently,
+            retry_policy=create_policy(initial_delay_seconds=5),
+        )
+
+        facade.send("eta")
+
+        report = facade.close_and_join(timeout_seconds=0.05)
+
+        assert report.failed_count == 1
+        assert report.abandoned_count == 1
+        assert attempt_counters["eta"].get() == 1
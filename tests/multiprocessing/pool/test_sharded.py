@@ -0,0 +1,156 @@
+from multiprocessing import Pool
+from os import getpid
+from threading import Event
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.context import WorkerContext
+from info.gianlucacosta.eos.core.multiprocessing.pool.metrics import InMemoryPoolMetrics
+from info.gianlucacosta.eos.core.multiprocessing.pool.sharded import ShardedProcessPoolFacade
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+
+def initialize_cache(context: WorkerContext) -> None:
+    context.cache = set()
+
+
+def lookup(context: WorkerContext, key: str) -> tuple[str, int, bool]:
+    cache_hit = key in context.cache
+    context.cache.add(key)
+
+    if key == "broken":
+        raise ValueError(key)
+
+    return key, getpid(), cache_hit
+
+
+lookup_gate = Event()
+
+
+def lookup_after_gate(context: WorkerContext, key: str) -> tuple[str, int, bool]:
+    lookup_gate.wait()
+    return lookup(context, key)
+
+
+class MyShardedProcessPoolFacade(ShardedProcessPoolFacade[tuple[str, int, bool]]):
+    def __init__(self, worker_function=lookup, **kwargs) -> None:
+        super().__init__(
+            worker_function=worker_function, worker_initializer=initialize_cache, **kwargs
+        )
+        self.results = Atomic[list[tuple[str, int, bool]]]([])
+        self.error_counter = Atomic(0)
+
+    def _on_worker_result(self, worker_result: tuple[str, int, bool]) -> None:
+        self.results.map(lambda results: results + [worker_result])
+
+    def _on_worker_error(self, _: BaseException) -> None:
+        self.error_counter.map(lambda value: value + 1)
+
+    def send(self, key: str) -> None:
+        self._send_to_shard(key, key)
+
+
+class TestShardedProcessPoolFacade:
+    def test_same_key_same_worker(self):
+        keys = [f"key-{index}" for index in range(12)]
+
+        with MyShardedProcessPoolFacade(pool_factory=lambda: Pool(1), shard_count=3) as facade:
+            for _ in range(3):
+                for key in keys:
+                    facade.send(key)
+
+        results = facade.results.get()
+        assert len(results) == 36
+
+        pids_by_key: dict[str, set[int]] = {}
+        for key, pid, _ in results:
+            pids_by_key.setdefault(key, set()).add(pid)
+
+        assert all(len(pids) == 1 for pids in pids_by_key.values())
+        assert len({pid for _, pid, _ in results}) > 1
+
+        assert sum(1 for _, _, cache_hit in results if cache_hit) == 24
+
+    def test_shard_index(self):
+        with MyShardedProcessPoolFacade(pool_factory=InThreadPool, shard_count=4) as facade:
+            assert facade.shard_count == 4
+            assert facade.get_shard_index("alpha") == facade.get_shard_index("alpha")
+            assert {facade.get_shard_index(f"key-{index}") for index in range(100)} == {
+                0,
+                1,
+                2,
+                3,
+            }
+            assert facade.in_flight_by_shard == [0, 0, 0, 0]
+
+    def test_errors(self):
+        with MyShardedProcessPoolFacade(pool_factory=InThreadPool, shard_count=2) as facade:
+            facade.send("alpha")
+            facade.send("broken")
+
+        assert [key for key, _, _ in facade.results.get()] == ["alpha"]
+        assert facade.error_counter.get() == 1
+
+    def test_invalid_shard_count(self):
+        with raises(ValueError) as ex:
+            MyShardedProcessPoolFacade(pool_factory=InThreadPool, shard_count=0)
+
+        assert ex.value.args == (0,)
+
+    def test_invalid_max_pending_requests(self):
+        with raises(ValueError) as ex:
+            MyShardedProcessPoolFacade(
+                pool_factory=InThreadPool, max_pending_async_requests_per_shard=0
+            )
+
+        assert ex.value.args == (0,)
+
+    def test_shutdown_report(self):
+        facade = MyShardedProcessPoolFacade(pool_factory=InThreadPool, shard_count=2)
+
+        for key in ["alpha", "beta", "broken"]:
+            facade.send(key)
+
+        report = facade.close_and_join(timeout_seconds=1)
+
+        assert report.completed_count == 2
+        assert report.failed_count == 1
+        assert report.abandoned_count == 0
+
+    def test_metrics_in_flight_across_shards(self):
+        lookup_gate.clear()
+        metrics = InMemoryPoolMetrics()
+
+        with MyShardedProcessPoolFacade(
+            worker_function=lookup_after_gate,
+            pool_factory=create_thread_pool_factory(2),
+            shard_count=4,
+            max_pending_async_requests_per_shard=2,
+            metrics_sink=metrics,
+        ) as facade:
+            keys_by_shard: dict[int, list[str]] = {}
+            candidate_index = 0
+
+            while sum(len(keys) for keys in keys_by_shard.values()) < 8:
+                key = f"key-{candidate_index}"
+                shard_keys = keys_by_shard.setdefault(facade.get_shard_index(key), [])
+
+                if len(shard_keys) < 2:
+                    shard_keys.append(key)
+                    facade.send(key)
+
+                candidate_index += 1
+
+            gated_in_flight = metrics.snapshot().in_flight
+            lookup_gate.set()
+
+        assert gated_in_flight == 8
+
+        snapshot = metrics.snapshot()
+        assert snapshot.in_flight == 0
+        assert snapshot.max_in_flight == 8
+        assert len(facade.results.get()) == 8
@@ -0,0 +1,244 @@
+import os
+import subprocess
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from threading import Event, Timer
+from typing import Any
+
+from pytest import mark, raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    ExecutorPool,
+    InThreadPool,
+    ProcessPoolFactory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.shared import (
+    SharedMemoryProcessPoolFacade,
+)
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+MIN_SHARED_BYTES = 64
+
+RESOURCE_TRACKER_SCRIPT = """
+from multiprocessing import get_context
+
+from info.gianlucacosta.eos.core.multiprocessing.pool.shared import (
+    SharedMemoryProcessPoolFacade,
+)
+
+
+def reverse(buffer):
+    return bytes(buffer)[::-1]
+
+
+class ReversingFacade(SharedMemoryProcessPoolFacade):
+    def _on_worker_result(self, worker_result):
+        assert len(worker_result) == 1000
+
+
+with ReversingFacade(
+    pool_factory=lambda: get_context("fork").Pool(2),
+    worker_function=reverse,
+    min_shared_bytes=64,
+) as facade:
+    for index in range(6):
+        facade._send_to_worker(bytes([index]) * 1000)
+"""
+
+
+def checksum(buffer: Any, offset: int) -> int:
+    assert isinstance(buffer, memoryview)
+    return sum(buffer) + offset
+
+
+def reverse(buffer: Any) -> bytes:
+    return bytes(buffer)[::-1]
+
+
+def double_values(values: Any) -> "array[int]":
+    return array(values.format, (value * 2 for value in values))
+
+
+def fail_on_buffer(_: Any) -> int:
+    raise ValueError("Failing!")
+
+
+task_gate = Event()
+
+
+def wait_for_gate(buffer: Any) -> int:
+    task_gate.wait()
+    return len(buffer)
+
+
+class MySharedMemoryProcessPoolFacade(SharedMemoryProcessPoolFacade[Any]):
+    def __init__(
+        self,
+        worker_function,
+        pool_factory: ProcessPoolFactory = InThreadPool,
+        min_shared_bytes: int = MIN_SHARED_BYTES,
+    ) -> None:
+        super().__init__(
+            pool_factory=pool_factory,
+            worker_function=worker_function,
+            min_shared_bytes=min_shared_bytes,
+            max_pending_async_requests=2,
+        )
+        self.results = Atomic[list[Any]]([])
+        self.error_counter = Atomic(0)
+
+    def _on_worker_result(self, worker_result: Any) -> None:
+        self.results.map(lambda results: results + [worker_result])
+
+    def _on_worker_error(self, _: BaseException) -> None:
+        self.error_counter.map(lambda value: value + 1)
+
+    def send(self, *args: Any) -> None:
+        self._send_to_worker(*args)
+
+    @property
+    def idle_segment_count(self) -> int:
+        return self._arena.idle_count
+
+
+class TestSharedMemoryProcessPoolFacade:
+    def test_large_argument_is_shared(self):
+        payload = bytes(range(200))
+
+        with MySharedMemoryProcessPoolFacade(checksum) as facade:
+            facade.send(payload, 7)
+
+            assert facade.idle_segment_count == 1
+
+        assert facade.results.get() == [sum(payload) + 7]
+
+    def test_small_argument_is_not_shared(self):
+        with MySharedMemoryProcessPoolFacade(reverse) as facade:
+            facade.send(b"Alpha")
+
+            assert facade.idle_segment_count == 0
+
+        assert facade.results.get() == [b"ahplA"]
+
+    def test_large_result_is_shared(self):
+        payload = bytes(range(100))
+
+        with MySharedMemoryProcessPoolFacade(reverse) as facade:
+            facade.send(payload)
+
+        assert facade.results.get() == [payload[::-1]]
+
+    def test_array_round_trip(self):
+        values = array("i", range(50))
+
+        with MySharedMemoryProcessPoolFacade(double_values) as facade:
+            facade.send(values)
+
+        assert facade.results.get() == [array("i", (value * 2 for value in range(50)))]
+
+    def test_explicitly_allocated_buffer(self):
+        with MySharedMemoryProcessPoolFacade(checksum) as facade:
+            shared_buffer = facade.allocate_shared_buffer(10)
+            shared_buffer.view[:] = bytes([1] * 10)
+
+            facade.send(shared_buffer, 0)
+
+        assert facade.results.get() == [10]
+
+    def test_segment_is_recycled_after_error(self):
+        with MySharedMemoryProcessPoolFacade(fail_on_buffer) as facade:
+            facade.send(bytes(200))
+
+            assert facade.idle_segment_count == 1
+
+        assert facade.error_counter.get() == 1
+
+    def test_with_process_pool(self):
+        payloads = [bytes([index]) * 1000 for index in range(6)]
+
+        with MySharedMemoryProcessPoolFacade(reverse, pool_factory=lambda: Pool(2)) as facade:
+            for payload in payloads:
+                facade.send(payload)
+
+        assert sorted(facade.results.get()) == sorted(payloads)
+
+    def test_with_invalid_min_shared_bytes(self):
+        with raises(ValueError) as ex:
+            MySharedMemoryProcessPoolFacade(reverse, min_shared_bytes=0)
+
+        assert ex.value.args == (0,)
+
+    def test_timed_send_shares_argument(self):
+        with MySharedMemoryProcessPoolFacade(checksum) as facade:
+            assert facade._try_send_to_worker((bytes([1]) * 100, 5))
+
+            assert facade.idle_segment_count == 1
+
+        assert facade.results.get() == [105]
+
+    def test_rejected_timed_send(self):
+        task_gate.clear()
+
+        facade = MySharedMemoryProcessPoolFacade(
+            wait_for_gate,
+            pool_factory=lambda: ExecutorPool(ThreadPoolExecutor(2)),
+        )
+
+        facade.send(bytes(200))
+        facade.send(bytes(200))
+
+        assert not facade._try_send_to_worker((bytes(300),))
+        assert facade.idle_segment_count == 1
+
+        caller_buffer = facade.allocate_shared_buffer(300)
+        assert not facade._try_send_to_worker((caller_buffer,))
+        caller_buffer.view[0] = 90
+
+        task_gate.set()
+        facade.send(caller_buffer)
+        facade.close_and_join()
+
+        assert sorted(facade.results.get()) == [200, 200, 300]
+
+    def test_segments_of_abandoned_tasks_are_unlinked(self):
+        task_gate.clear()
+        gate_opener = Timer(0.3, task_gate.set)
+        gate_opener.start()
+
+        facade = MySharedMemoryProcessPoolFacade(
+            wait_for_gate,
+            pool_factory=lambda: ExecutorPool(ThreadPoolExecutor(1)),
+        )
+
+        facade.send(bytes(200))
+
+        abandoned_buffer = facade.allocate_shared_buffer(300)
+        abandoned_segment_name = abandoned_buffer.handle.segment_name
+        facade.send(abandoned_buffer)
+
+        report = facade.close_and_join(timeout_seconds=0.05)
+        gate_opener.join()
+
+        assert report.completed_count == 1
+        assert report.abandoned_count == 1
+        assert facade.results.get() == [200]
+        assert facade.idle_segment_count == 0
+
+        with raises(FileNotFoundError):
+            SharedMemory(name=abandoned_segment_name)
+
+    @mark.skipif(os.name != "posix", reason="Requires fork and the resource tracker")
+    def test_resource_tracker_reports_no_leaks(self):
+        completed_process = subprocess.run(
+            [sys.executable, "-c", RESOURCE_TRACKER_SCRIPT],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert completed_process.returncode == 0, completed_process.stderr
+        assert "resource_tracker" not in completed_process.stderr
@@ -0,0 +1,139 @@
+from itertools import count
+from multiprocessing import Pool
+from time import sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    InThreadPool,
+    create_thread_pool_factory,
+)
+from info.gianlucacosta.eos.core.multiprocessing.pool.metrics import InMemoryPoolMetrics
+from info.gianlucacosta.eos.core.multiprocessing.pool.streaming import (
+    StreamingProcessPoolFacade,
+)
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+
+from .test_facade import special_sum_with_error
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def square_slowly_when_even(value: int) -> int:
+    if value % 2 == 0:
+        sleep(0.05)
+
+    return value * value
+
+
+class StreamingTestException(Exception):
+    pass
+
+
+def fail_fast_unless_slow(value: int) -> int:
+    if value < 0:
+        raise StreamingTestException()
+
+    sleep(0.1)
+    return value
+
+
+class TestStreamingProcessPoolFacade:
+    def test_ordered_results(self):
+        with StreamingProcessPoolFacade(InThreadPool, square) as facade:
+            results = list(facade.submit_many((value,) for value in range(20)))
+
+        assert results == [value * value for value in range(20)]
+
+    def test_ordered_results_with_process_pool(self):
+        with StreamingProcessPoolFacade(
+            lambda: Pool(3), square_slowly_when_even, max_pending_async_requests=3
+        ) as facade:
+            results = list(
+                facade.submit_many(((value,) for value in range(12)), max_buffered_results=4)
+            )
+
+        assert results == [value * value for value in range(12)]
+
+    def test_unordered_results_with_process_pool(self):
+        with StreamingProcessPoolFacade(
+            lambda: Pool(3), square_slowly_when_even, max_pending_async_requests=3
+        ) as facade:
+            results = list(facade.submit_many(((value,) for value in range(12)), ordered=False))
+
+        assert sorted(results) == [value * value for value in range(12)]
+
+    def test_empty_input(self):
+        with StreamingProcessPoolFacade(InThreadPool, square) as facade:
+            assert list(facade.submit_many([])) == []
+
+    def test_input_is_consumed_lazily(self):
+        with StreamingProcessPoolFacade(InThreadPool, square) as facade:
+            results = facade.submit_many(((value,) for value in count()), max_buffered_results=3)
+
+            for expected_value in range(10):
+                assert next(results) == expected_value * expected_value
+
+            results.close()
+
+    def test_worker_exception(self):
+        with StreamingProcessPoolFacade(InThreadPool, special_sum_with_error) as facade:
+            results = facade.submit_many([(9, 4), (90, 8), (5, 7)])
+
+            assert next(results) == 9 + 4 + 1
+
+            with raises(ZeroDivisionError):
+                next(results)
+
+    def test_worker_exception_goes_through_the_error_path(self):
+        class CountingFacade(StreamingProcessPoolFacade[int]):
+            def __init__(self, **kwargs) -> None:
+                super().__init__(**kwargs)
+                self.error_counter = Atomic(0)
+
+            def _on_worker_error(self, _: BaseException) -> None:
+                self.error_counter.map(lambda value: value + 1)
+
+        metrics = InMemoryPoolMetrics()
+
+        with CountingFacade(
+            pool_factory=InThreadPool, worker_function=special_sum_with_error, metrics_sink=metrics
+        ) as facade:
+            with raises(ZeroDivisionError):
+                list(facade.submit_many([(90, 8)]))
+
+        assert facade.error_counter.get() == 1
+        assert metrics.snapshot().worker_error_count == 1
+
+    def test_ordered_worker_exception_follows_previous_results(self):
+        with StreamingProcessPoolFacade(
+            create_thread_pool_factory(2),
+            fail_fast_unless_slow,
+            max_pending_async_requests=2,
+        ) as facade:
+            results = facade.submit_many([(3,), (-1,)])
+
+            assert next(results) == 3
+
+            with raises(StreamingTestException):
+                next(results)
+
+    def test_input_exception(self):
+        def failing_input():
+            yield (3,)
+            raise StreamingTestException()
+
+        with StreamingProcessPoolFacade(InThreadPool, square) as facade:
+            results = facade.submit_many(failing_input())
+
+            with raises(StreamingTestException):
+                list(results)
+
+    def test_with_invalid_buffer_size(self):
+        with StreamingProcessPoolFacade(InThreadPool, square) as facade:
+            with raises(ValueError) as ex:
+                facade.submit_many([], max_buffered_results=0)
+
+        assert ex.value.args == (0,)
@@ -0,0 +1,88 @@
+from array import array
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.multiprocessing.arena import (
+    SharedMemoryArena,
+    attach_shared_buffer,
+    close_segment_quietly,
+    write_to_segment,
+)
+
+
+class TestSharedMemoryArena:
+    def test_acquire_rounds_size_up(self):
+        with SharedMemoryArena() as arena:
+            segment = arena.acquire(3000)
+
+            assert segment.size >= 4096
+
+            arena.release(segment)
+
+    def test_released_segment_is_reused(self):
+        with SharedMemoryArena() as arena:
+            segment = arena.acquire(1000)
+            segment_name = segment.name
+            arena.release(segment)
+
+            assert arena.idle_count == 1
+
+            reused_segment = arena.acquire(900)
+
+            assert reused_segment.name == segment_name
+            assert arena.idle_count == 0
+
+            arena.release(reused_segment)
+
+    def test_idle_segments_are_bounded(self):
+        with SharedMemoryArena(max_idle_segments=1) as arena:
+            segments = [arena.acquire(100), arena.acquire(100)]
+
+            for segment in segments:
+                arena.release(segment)
+
+            assert arena.idle_count == 1
+
+    def test_acquire_after_close(self):
+        arena = SharedMemoryArena()
+        arena.close()
+
+        with raises(ValueError):
+            arena.acquire(10)
+
+    def test_acquire_with_invalid_size(self):
+        with SharedMemoryArena() as arena:
+            with raises(ValueError) as ex:
+                arena.acquire(0)
+
+        assert ex.value.args == (0,)
+
+
+class TestSharedBuffers:
+    def test_bytes_round_trip(self):
+        with SharedMemoryArena() as arena:
+            segment = arena.acquire(5)
+            handle = write_to_segment(segment, b"Alpha")
+
+            attached_segment, view = attach_shared_buffer(handle)
+
+            assert bytes(view) == b"Alpha"
+
+            view.release()
+            close_segment_quietly(attached_segment)
+            arena.release(segment)
+
+    def test_array_round_trip(self):
+        source = array("d", [9.5, 90.25, 7.0])
+
+        with SharedMemoryArena() as arena:
+            segment = arena.acquire(source.itemsize * len(source))
+            handle = write_to_segment(segment, source)
+
+            attached_segment, view = attach_shared_buffer(handle)
+
+            assert view.tolist() == [9.5, 90.25, 7.0]
+
+            view.release()
+            close_segment_quietly(attached_segment)
+            arena.release(segment)
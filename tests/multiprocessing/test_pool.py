@@ -1,8 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from operator import add
+from threading import Event, Lock, Thread, current_thread, main_thread
+from time import sleep
 
 from pytest import raises
 
-from info.gianlucacosta.eos.core.multiprocessing.pool import InThreadPool
+from info.gianlucacosta.eos.core.multiprocessing.pool import (
+    ExecutorPool,
+    InThreadPool,
+    create_process_executor_pool_factory,
+    create_thread_pool_factory,
+)
 
 
 def my_diff(x: int, y: int):
@@ -74,3 +82,180 @@ class TestInProcessPool:
 
     def test_join(self):
         InThreadPool().join()
+
+
+class TestExecutorPool:
+    def test_apply(self):
+        with create_thread_pool_factory(2)() as pool:
+            result = pool.apply(my_diff, [98], {"y": 6})
+
+        assert result == 92
+
+    def test_apply_with_error(self):
+        with create_thread_pool_factory(2)() as pool:
+            with raises(PoolTestException):
+                pool.apply(failing)
+
+    def test_apply_async_runs_on_other_thread(self):
+        def get_thread_name() -> str:
+            return current_thread().name
+
+        thread_names: list[str] = []
+
+        pool = create_thread_pool_factory(2)()
+        pool.apply_async(get_thread_name, callback=thread_names.append)
+        pool.close()
+        pool.join()
+
+        assert len(thread_names) == 1
+        assert thread_names[0] != main_thread().name
+
+    def test_apply_async_with_error_callback(self):
+        exceptions: list[BaseException] = []
+
+        pool = create_thread_pool_factory(2)()
+        pool.apply_async(failing, callback=lambda _: None, error_callback=exceptions.append)
+        pool.close()
+        pool.join()
+
+        assert len(exceptions) == 1
+        assert isinstance(exceptions[0], PoolTestException)
+
+    def test_callbacks_are_never_concurrent(self):
+        active_callbacks = 0
+        max_active_callbacks = 0
+
+        def callback(_: int) -> None:
+            nonlocal active_callbacks, max_active_callbacks
+
+            active_callbacks += 1
+            max_active_callbacks = max(max_active_callbacks, active_callbacks)
+            sleep(0.01)
+            active_callbacks -= 1
+
+        pool = create_thread_pool_factory(4)()
+
+        for value in range(8):
+            pool.apply_async(my_diff, [value, 1], callback=callback)
+
+        pool.close()
+        pool.join()
+
+        assert max_active_callbacks == 1
+
+    def test_callback_can_submit_tasks(self):
+        results: list[int] = []
+        done_event = Event()
+
+        pool = create_thread_pool_factory(2)()
+
+        def resubmit(value: int) -> None:
+            results.append(value)
+
+            if value > 0:
+                pool.apply_async(my_diff, [value, 1], callback=resubmit)
+            else:
+                done_event.set()
+
+        pool.apply_async(my_diff, [5, 1], callback=resubmit)
+
+        assert done_event.wait(5)
+
+        pool.close()
+        pool.join()
+
+        assert results == [4, 3, 2, 1, 0]
+
+    def test_callbacks_never_run_on_the_submitting_thread(self):
+        callback_thread_names: list[str] = []
+
+        pool = create_thread_pool_factory(1)()
+        future = pool.apply_async(my_diff, [3, 1])
+        future.result()
+
+        pool.apply_async(
+            my_diff,
+            [3, 1],
+            callback=lambda _: callback_thread_names.append(current_thread().name),
+        )
+        pool.close()
+        pool.join()
+
+        assert callback_thread_names
+        assert callback_thread_names[0] != main_thread().name
+
+    def test_callback_errors_do_not_stop_delivery(self):
+        results: list[int] = []
+
+        def failing_callback(_: int) -> None:
+            raise PoolTestException()
+
+        pool = create_thread_pool_factory(1)()
+        pool.apply_async(my_diff, [3, 1], callback=failing_callback)
+        pool.apply_async(my_diff, [7, 1], callback=results.append)
+        pool.close()
+        pool.join()
+
+        assert results == [6]
+
+    def test_high_rate_submissions_with_a_shared_lock(self):
+        task_count = 20000
+        submitter_lock = Lock()
+        delivered_count = 0
+
+        def callback(_: int) -> None:
+            nonlocal delivered_count
+
+            with submitter_lock:
+                delivered_count += 1
+
+        pool = create_thread_pool_factory(4)()
+
+        def submit_all() -> None:
+            for value in range(task_count):
+                with submitter_lock:
+                    pool.apply_async(my_diff, [value, 1], callback=callback)
+
+            pool.close()
+            pool.join()
+
+        submitter = Thread(target=submit_all, daemon=True)
+        submitter.start()
+        submitter.join(60)
+
+        assert not submitter.is_alive()
+        assert delivered_count == task_count
+
+    def test_closed_pool_rejects_tasks(self):
+        pool = create_thread_pool_factory(1)()
+        pool.close()
+
+        with raises(ValueError):
+            pool.apply(my_diff, [1, 2])
+
+        pool.join()
+
+    def test_join_without_close(self):
+        pool = create_thread_pool_factory(1)()
+
+        with raises(ValueError):
+            pool.join()
+
+        pool.terminate()
+
+    def test_terminate_cancels_pending_tasks(self):
+        release_event = Event()
+        results: list[int] = []
+
+        pool = ExecutorPool(ThreadPoolExecutor(max_workers=1))
+        pool.apply_async(release_event.wait, [5])
+        pool.apply_async(my_diff, [9, 2], callback=results.append)
+
+        pool.terminate()
+        release_event.set()
+
+        assert results == []
+
+    def test_process_executor(self):
+        with create_process_executor_pool_factory(max_workers=2, max_tasks_per_child=1)() as pool:
+            assert pool.apply(my_diff, [98], {"y": 6}) == 92
@@ -1,17 +1,31 @@
 from functools import wraps
+from multiprocessing import Event as ProcessEvent
+from multiprocessing import JoinableQueue, Process
+from multiprocessing import Queue as ProcessQueue
 from queue import Queue
 from threading import Thread
-from time import sleep
+from time import monotonic, sleep
 from typing import Iterable
 
 from pytest import raises
 
 from info.gianlucacosta.eos.core.functional import AnyCallable
 from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.threading.cancelable import CancelationToken
 from info.gianlucacosta.eos.core.threading.queues.adaptive import (
+    create_adaptive_queue_batch_reader,
     create_adaptive_queue_reader,
     create_adaptive_queue_writer,
 )
+from info.gianlucacosta.eos.core.threading.queues.batching import (
+    batch_items,
+    create_unbatching_consumer,
+)
+from info.gianlucacosta.eos.core.threading.queues.timeouts import (
+    BackoffTimeoutController,
+    EwmaTimeoutController,
+    PidTimeoutController,
+)
 
 from . import FAST_AGENT_CONFIGURATION, SLOW_AGENT_CONFIGURATION, AgentConfigurationForTesting
 
@@ -206,3 +220,274 @@ def test_interrupted_writer_without_reader():
     writing_thread.start()
 
     writing_thread.join()
+
+
+def test_batch_reader_available_items_are_batched():
+    queue = Queue[int]()
+
+    for item in range(7):
+        queue.put(item)
+
+    batches: list[list[int]] = []
+
+    read_batches_from_queue = create_adaptive_queue_batch_reader(
+        batch_consumer=batches.append,
+        timeout_seconds_range=FAST_AGENT_CONFIGURATION.timeout_seconds_range,
+        timeout_factor=FAST_AGENT_CONFIGURATION.timeout_factor,
+        max_batch_size=3,
+    )
+
+    read_batches_from_queue(queue, lambda: False)
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert queue.unfinished_tasks == 0
+
+
+def test_batch_reader_linger_waits_for_further_items():
+    queue = Queue[int]()
+    batches: list[list[int]] = []
+
+    def write_slowly() -> None:
+        for item in range(4):
+            queue.put(item)
+            sleep(0.02)
+
+    read_batches_from_queue = create_adaptive_queue_batch_reader(
+        batch_consumer=batches.append,
+        timeout_seconds_range=SLOW_AGENT_CONFIGURATION.timeout_seconds_range,
+        timeout_factor=SLOW_AGENT_CONFIGURATION.timeout_factor,
+        max_batch_size=10,
+        max_linger_seconds=1,
+    )
+
+    writing_thread = Thread(target=write_slowly)
+    writing_thread.start()
+
+    read_batches_from_queue(queue, lambda: sum(len(batch) for batch in batches) < 4)
+
+    writing_thread.join()
+
+    assert batches == [[0, 1, 2, 3]]
+
+
+def test_batch_reader_task_done_even_if_consumer_fails():
+    queue = Queue[int]()
+
+    for item in range(2):
+        queue.put(item)
+
+    def fail(_: list[int]) -> None:
+        raise ValueError()
+
+    read_batches_from_queue = create_adaptive_queue_batch_reader(
+        batch_consumer=fail,
+        timeout_seconds_range=FAST_AGENT_CONFIGURATION.timeout_seconds_range,
+        timeout_factor=FAST_AGENT_CONFIGURATION.timeout_factor,
+        max_batch_size=5,
+    )
+
+    with raises(ValueError):
+        read_batches_from_queue(queue, lambda: False)
+
+    assert queue.unfinished_tasks == 0
+
+
+def test_batch_reader_with_invalid_arguments():
+    with raises(ValueError) as ex:
+        create_adaptive_queue_batch_reader(
+            lambda _: None, InclusiveRange(7, 90), timeout_factor=0.9, max_batch_size=2
+        )
+    assert ex.value.args == (0.9,)
+
+    with raises(ValueError) as ex:
+        create_adaptive_queue_batch_reader(
+            lambda _: None, InclusiveRange(7, 90), timeout_factor=2, max_batch_size=0
+        )
+    assert ex.value.args == (0,)
+
+    with raises(ValueError) as ex:
+        create_adaptive_queue_batch_reader(
+            lambda _: None,
+            InclusiveRange(7, 90),
+            timeout_factor=2,
+            max_batch_size=2,
+            max_linger_seconds=-1,
+        )
+    assert ex.value.args == (-1,)
+
+
+def test_reader_with_cancelation_token_stops_immediately():
+    queue = Queue[int]()
+    result: list[int] = []
+    token = CancelationToken()
+
+    read_items_from_queue = create_adaptive_queue_reader(
+        item_consumer=result.append,
+        timeout_seconds_range=InclusiveRange(30, 60),
+        timeout_factor=2,
+    )
+
+    reading_thread = Thread(target=lambda: read_items_from_queue(queue, token))
+    reading_thread.start()
+
+    queue.put(1)
+    queue.put(2)
+    queue.join()
+
+    start_time = monotonic()
+    token.cancel()
+    reading_thread.join()
+
+    assert monotonic() - start_time < 5
+    assert result == [1, 2]
+
+
+def test_writer_with_cancelation_token_stops_immediately():
+    queue = Queue[int](maxsize=1)
+    token = CancelationToken()
+
+    write_items_to_queue = create_adaptive_queue_writer(
+        timeout_seconds_range=InclusiveRange(30, 60),
+        timeout_factor=2,
+    )
+
+    writing_thread = Thread(target=lambda: write_items_to_queue(queue, token, range(10)))
+    writing_thread.start()
+
+    sleep(0.05)
+
+    start_time = monotonic()
+    token.cancel()
+    writing_thread.join()
+
+    assert monotonic() - start_time < 5
+    assert queue.get_nowait() == 0
+
+
+def test_reader_and_writer_with_timeout_controllers():
+    queue = Queue[int](maxsize=2)
+    result: list[int] = []
+    source = list(range(50))
+
+    write_items_to_queue = create_adaptive_queue_writer(
+        timeout_controller_factory=lambda: PidTimeoutController(InclusiveRange(0.001, 0.05))
+    )
+
+    read_items_from_queue = create_adaptive_queue_reader(
+        item_consumer=result.append,
+        timeout_controller_factory=lambda: EwmaTimeoutController(InclusiveRange(0.001, 0.05)),
+    )
+
+    writing_thread = Thread(target=lambda: write_items_to_queue(queue, lambda: True, source))
+    reading_thread = Thread(
+        target=lambda: read_items_from_queue(queue, lambda: len(result) < len(source))
+    )
+
+    writing_thread.start()
+    reading_thread.start()
+
+    writing_thread.join()
+    reading_thread.join()
+
+    assert result == source
+
+
+def test_create_reader_with_both_timeout_factor_and_controller():
+    def create_controller():
+        return BackoffTimeoutController(InclusiveRange(7, 90))
+
+    with raises(ValueError) as ex:
+        create_adaptive_queue_reader(
+            lambda _: None,
+            InclusiveRange(7, 90),
+            timeout_factor=2,
+            timeout_controller_factory=create_controller,
+        )
+
+    assert ex.value.args == (create_controller,)
+
+
+def test_create_writer_without_timeout_policy():
+    with raises(ValueError):
+        create_adaptive_queue_writer()
+
+
+def double_items_in_process(source_queue, result_queue, stop_event) -> None:
+    def double_item(item: int) -> None:
+        result_queue.put(item * 2)
+
+    read_items_from_queue = create_adaptive_queue_reader(
+        item_consumer=create_unbatching_consumer(double_item),
+        timeout_seconds_range=InclusiveRange(0.001, 0.05),
+        timeout_factor=2,
+    )
+
+    read_items_from_queue(source_queue, lambda: not stop_event.is_set())
+
+
+def test_batches_across_processes_with_joinable_queue():
+    source_queue = JoinableQueue(maxsize=2)
+    result_queue = ProcessQueue()
+    stop_event = ProcessEvent()
+
+    reading_process = Process(
+        target=double_items_in_process, args=(source_queue, result_queue, stop_event)
+    )
+    reading_process.start()
+
+    write_items_to_queue = create_adaptive_queue_writer(InclusiveRange(0.001, 0.05), 2)
+    write_items_to_queue(source_queue, lambda: True, batch_items(range(100), 8))
+
+    source_queue.join()
+    stop_event.set()
+
+    result = [result_queue.get(timeout=5) for _ in range(100)]
+    reading_process.join()
+
+    assert result == [item * 2 for item in range(100)]
+
+
+def test_reader_and_writer_with_process_queue_without_task_done():
+    queue = ProcessQueue(maxsize=3)
+    result: list[int] = []
+    source = list(range(30))
+
+    write_items_to_queue = create_adaptive_queue_writer(InclusiveRange(0.001, 0.05), 2)
+    read_batches_from_queue = create_adaptive_queue_batch_reader(
+        result.extend, InclusiveRange(0.001, 0.05), 2, max_batch_size=4
+    )
+
+    writing_thread = Thread(target=lambda: write_items_to_queue(queue, lambda: True, source))
+    reading_thread = Thread(
+        target=lambda: read_batches_from_queue(queue, lambda: len(result) < len(source))
+    )
+
+    writing_thread.start()
+    reading_thread.start()
+
+    writing_thread.join()
+    reading_thread.join()
+
+    assert result == source
+
+
+def test_reader_with_cancelation_token_on_process_queue():
+    queue = ProcessQueue()
+    result: list[int] = []
+    token = CancelationToken()
+
+    read_items_from_queue = create_adaptive_queue_reader(
+        item_consumer=result.append,
+        timeout_seconds_range=InclusiveRange(0.001, 0.05),
+        timeout_factor=2,
+    )
+
+    reading_thread = Thread(target=lambda: read_items_from_queue(queue, token))
+    reading_thread.start()
+
+    queue.put(1)
+    sleep(0.1)
+    token.cancel()
+    reading_thread.join()
+
+    assert result == [1]
@@ -0,0 +1,35 @@
+from pytest import raises
+
+from info.gianlucacosta.eos.core.threading.queues.batching import (
+    batch_items,
+    create_unbatching_consumer,
+)
+
+
+class TestBatchItems:
+    def test_with_incomplete_last_batch(self):
+        assert list(batch_items(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_with_complete_batches(self):
+        assert list(batch_items(range(4), 2)) == [[0, 1], [2, 3]]
+
+    def test_without_items(self):
+        assert list(batch_items([], 5)) == []
+
+    def test_invalid_batch_size(self):
+        with raises(ValueError) as ex:
+            list(batch_items(range(3), 0))
+
+        assert ex.value.args == (0,)
+
+
+class TestCreateUnbatchingConsumer:
+    def test_items_are_consumed_in_order(self):
+        result: list[int] = []
+
+        consume_batch = create_unbatching_consumer(result.append)
+
+        consume_batch([1, 2])
+        consume_batch([3])
+
+        assert result == [1, 2, 3]
@@ -0,0 +1,98 @@
+from queue import Empty, Full, Queue
+from threading import Thread
+from time import monotonic, sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.threading.cancelable import CancelationToken
+from info.gianlucacosta.eos.core.threading.queues.cancelable import get_cancelable, put_cancelable
+
+
+def cancel_later(token: CancelationToken, delay_seconds: float = 0.05) -> None:
+    def run():
+        sleep(delay_seconds)
+        token.cancel()
+
+    Thread(target=run).start()
+
+
+def test_get_available_item():
+    queue = Queue[int]()
+    queue.put(90)
+
+    assert get_cancelable(queue, CancelationToken()) == 90
+
+
+def test_get_with_timeout():
+    with raises(Empty):
+        get_cancelable(Queue[int](), CancelationToken(), timeout_seconds=0.01)
+
+
+def test_get_interrupted_by_cancelation():
+    queue = Queue[int]()
+    token = CancelationToken()
+    cancel_later(token)
+
+    start_time = monotonic()
+
+    with raises(Empty):
+        get_cancelable(queue, token, timeout_seconds=30)
+
+    assert monotonic() - start_time < 5
+
+
+def test_get_woken_by_put():
+    queue = Queue[int]()
+    Thread(target=lambda: (sleep(0.05), queue.put(7))).start()
+
+    assert get_cancelable(queue, CancelationToken()) == 7
+
+
+def test_get_still_drains_after_cancelation():
+    queue = Queue[int]()
+    queue.put(1)
+    token = CancelationToken()
+    token.cancel()
+
+    assert get_cancelable(queue, token) == 1
+
+
+def test_put_and_task_accounting():
+    queue = Queue[int]()
+
+    put_cancelable(queue, 5, CancelationToken())
+
+    assert queue.get_nowait() == 5
+    queue.task_done()
+    queue.join()
+
+
+def test_put_with_timeout():
+    queue = Queue[int](maxsize=1)
+    queue.put(1)
+
+    with raises(Full):
+        put_cancelable(queue, 2, CancelationToken(), timeout_seconds=0.01)
+
+
+def test_put_interrupted_by_cancelation():
+    queue = Queue[int](maxsize=1)
+    queue.put(1)
+    token = CancelationToken()
+    cancel_later(token)
+
+    start_time = monotonic()
+
+    with raises(Full):
+        put_cancelable(queue, 2, token)
+
+    assert monotonic() - start_time < 5
+    assert queue.qsize() == 1
+
+
+def test_put_after_cancelation():
+    token = CancelationToken()
+    token.cancel()
+
+    with raises(Full):
+        put_cancelable(Queue[int](), 1, token)
@@ -0,0 +1,149 @@
+from queue import Queue
+from threading import Event
+from time import monotonic, sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.threading.atomic import Atomic
+from info.gianlucacosta.eos.core.threading.queues.group import AutoscalingConsumerGroup
+
+
+def wait_until(condition, timeout_seconds: float = 5) -> bool:
+    deadline = monotonic() + timeout_seconds
+
+    while monotonic() < deadline:
+        if condition():
+            return True
+        sleep(0.01)
+
+    return condition()
+
+
+class TestAutoscalingConsumerGroup:
+    def test_all_items_are_consumed(self):
+        queue = Queue[int]()
+        total = Atomic(0)
+
+        with AutoscalingConsumerGroup(
+            queue, lambda item: total.map(lambda value: value + item), max_threads=4
+        ) as group:
+            for item in range(1, 101):
+                queue.put(item)
+
+            queue.join()
+
+        assert total.get() == 5050
+        assert group.processed_count == 100
+        assert group.thread_count == 0
+
+    def test_min_threads_are_started(self):
+        queue = Queue[int]()
+
+        with AutoscalingConsumerGroup(
+            queue, lambda item: None, min_threads=3, max_threads=5
+        ) as group:
+            assert group.thread_count == 3
+
+    def test_scaling_up_when_the_queue_grows(self):
+        queue = Queue[int]()
+        release_event = Event()
+
+        with AutoscalingConsumerGroup(
+            queue,
+            lambda item: release_event.wait(),
+            max_threads=4,
+            check_interval_seconds=0.01,
+        ) as group:
+            for item in range(10):
+                queue.put(item)
+
+            assert wait_until(lambda: group.thread_count == 4)
+
+            release_event.set()
+            queue.join()
+
+    def test_scaling_up_when_items_wait_too_long(self):
+        queue = Queue[int]()
+
+        with AutoscalingConsumerGroup(
+            queue,
+            lambda item: sleep(0.05),
+            max_threads=3,
+            max_queue_size_per_thread=1_000,
+            max_item_wait_seconds=0.01,
+            check_interval_seconds=0.01,
+        ) as group:
+            for item in range(40):
+                queue.put(item)
+
+            assert wait_until(lambda: group.thread_count == 3)
+
+            queue.join()
+
+    def test_idle_threads_are_retired(self):
+        queue = Queue[int]()
+        release_event = Event()
+
+        with AutoscalingConsumerGroup(
+            queue,
+            lambda item: release_event.wait(),
+            min_threads=1,
+            max_threads=4,
+            idle_cooldown_seconds=0.05,
+            check_interval_seconds=0.01,
+        ) as group:
+            for item in range(10):
+                queue.put(item)
+
+            assert wait_until(lambda: group.thread_count == 4)
+
+            release_event.set()
+            queue.join()
+
+            assert wait_until(lambda: group.thread_count == 1)
+
+    def test_consumer_exceptions_are_gathered(self):
+        queue = Queue[int]()
+        consumed_items = Atomic(0)
+
+        def consume(item: int) -> None:
+            consumed_items.map(lambda value: value + 1)
+
+            if item % 2:
+                raise ValueError(item)
+
+        with AutoscalingConsumerGroup(queue, consume, max_kept_exceptions=3) as group:
+            for item in range(10):
+                queue.put(item)
+
+            queue.join()
+
+        assert consumed_items.get() == 10
+        assert group.exception_count == 5
+        assert len(group.exceptions) == 3
+        assert all(isinstance(exception, ValueError) for exception in group.exceptions)
+
+    def test_stopping_drains_the_queue(self):
+        queue = Queue[int]()
+        consumed_items = Atomic(0)
+
+        group = AutoscalingConsumerGroup(
+            queue, lambda item: consumed_items.map(lambda value: value + 1)
+        )
+
+        for item in range(50):
+            queue.put(item)
+
+        group.start()
+        group.stop()
+
+        assert consumed_items.get() == 50
+
+    def test_starting_twice_is_not_allowed(self):
+        with AutoscalingConsumerGroup(Queue[int](), lambda item: None) as group:
+            with raises(RuntimeError):
+                group.start()
+
+    def test_invalid_thread_range(self):
+        with raises(ValueError):
+            AutoscalingConsumerGroup(Queue[int](), lambda item: None, min_threads=3, max_threads=2)
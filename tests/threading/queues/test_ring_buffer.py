@@ -0,0 +1,130 @@
+from queue import Empty, Full
+from threading import Thread
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.threading.cancelable import CancelationToken
+from info.gianlucacosta.eos.core.threading.queues.adaptive import (
+    create_adaptive_queue_reader,
+    create_adaptive_queue_writer,
+)
+from info.gianlucacosta.eos.core.threading.queues.cancelable import get_cancelable
+from info.gianlucacosta.eos.core.threading.queues.ring_buffer import RingBufferQueue
+
+
+class TestRingBufferQueue:
+    def test_put_and_get_wrapping_around(self):
+        queue = RingBufferQueue[int](3)
+
+        for item in range(10):
+            queue.put(item)
+            queue.put(item * 100)
+
+            assert queue.get() == item
+            assert queue.get() == item * 100
+
+        assert queue.empty()
+
+    def test_full_queue(self):
+        queue = RingBufferQueue[int](2)
+        queue.put(1)
+        queue.put(2)
+
+        assert queue.full()
+
+        with raises(Full):
+            queue.put(3, timeout=0.01)
+
+    def test_empty_queue(self):
+        queue = RingBufferQueue[int](2)
+
+        with raises(Empty):
+            queue.get(timeout=0.01)
+
+    def test_put_many_and_get_many_wrapping_around(self):
+        queue = RingBufferQueue[int](5)
+
+        queue.put_many([1, 2, 3])
+        assert queue.get_many(2) == [1, 2]
+
+        queue.put_many([4, 5, 6, 7])
+        assert queue.qsize() == 5
+
+        assert queue.get_many(90) == [3, 4, 5, 6, 7]
+        assert queue.empty()
+
+    def test_put_many_waits_for_room(self):
+        queue = RingBufferQueue[int](4)
+        result: list[int] = []
+
+        def read_all() -> None:
+            while len(result) < 100:
+                items = queue.get_many(3)
+                result.extend(items)
+
+                for _ in items:
+                    queue.task_done()
+
+        reading_thread = Thread(target=read_all)
+        reading_thread.start()
+
+        queue.put_many(range(100))
+
+        reading_thread.join()
+        queue.join()
+
+        assert result == list(range(100))
+
+    def test_put_many_timing_out(self):
+        queue = RingBufferQueue[int](2)
+
+        with raises(Full):
+            queue.put_many([1, 2, 3], timeout=0.01)
+
+        assert queue.get_many(5) == [1, 2]
+
+    def test_get_many_without_items(self):
+        queue = RingBufferQueue[int](2)
+
+        with raises(Empty):
+            queue.get_many(5, block=False)
+
+        with raises(Empty):
+            queue.get_many(5, timeout=0.01)
+
+    def test_invalid_max_size(self):
+        with raises(ValueError) as ex:
+            RingBufferQueue[int](0)
+
+        assert ex.value.args == (0,)
+
+    def test_with_adaptive_reader_and_writer(self):
+        queue = RingBufferQueue[int](8)
+        result: list[int] = []
+        source = list(range(500))
+
+        write_items_to_queue = create_adaptive_queue_writer(InclusiveRange(0.001, 0.01), 2)
+        read_items_from_queue = create_adaptive_queue_reader(
+            result.append, InclusiveRange(0.001, 0.01), 2
+        )
+
+        writing_thread = Thread(target=lambda: write_items_to_queue(queue, lambda: True, source))
+        reading_thread = Thread(
+            target=lambda: read_items_from_queue(queue, lambda: len(result) < len(source))
+        )
+
+        writing_thread.start()
+        reading_thread.start()
+
+        writing_thread.join()
+        reading_thread.join()
+
+        assert result == source
+        assert queue.unfinished_tasks == 0
+
+    def test_with_cancelable_get(self):
+        queue = RingBufferQueue[int](2)
+        queue.put(7)
+
+        assert get_cancelable(queue, CancelationToken()) == 7
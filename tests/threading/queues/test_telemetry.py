@@ -0,0 +1,148 @@
+from queue import Queue
+from threading import Thread
+
+from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.threading.queues.adaptive import (
+    create_adaptive_queue_batch_reader,
+    create_adaptive_queue_reader,
+    create_adaptive_queue_writer,
+)
+from info.gianlucacosta.eos.core.threading.queues.telemetry import QueueTelemetryRegistry
+
+TIMEOUT_SECONDS_RANGE = InclusiveRange(0.001, 0.01)
+
+
+class TestQueueTelemetryRegistry:
+    def test_reader_and_writer_telemetry(self):
+        registry = QueueTelemetryRegistry()
+        queue = Queue[int](maxsize=1)
+        result: list[int] = []
+
+        write_items_to_queue = create_adaptive_queue_writer(
+            TIMEOUT_SECONDS_RANGE, timeout_factor=2, telemetry_registry=registry
+        )
+        read_items_from_queue = create_adaptive_queue_reader(
+            result.append,
+            TIMEOUT_SECONDS_RANGE,
+            timeout_factor=2,
+            telemetry_registry=registry,
+            agent_name="my reader",
+        )
+
+        write_items_to_queue(queue, lambda: True, [90])
+        read_items_from_queue(queue, lambda: not result)
+
+        writer_telemetry, reader_telemetry = registry.get_telemetry()
+
+        assert writer_telemetry.agent_name == "writer"
+        assert writer_telemetry.items_moved == 1
+        assert writer_telemetry.full_count == 0
+        assert not writer_telemetry.running
+
+        assert reader_telemetry.agent_name == "my reader"
+        assert reader_telemetry.queue_id == id(queue)
+        assert reader_telemetry.items_moved == 1
+        assert reader_telemetry.empty_count == 1
+        assert reader_telemetry.blocked_seconds > 0
+        assert reader_telemetry.timeout_seconds == 0.002
+
+    def test_full_events_are_counted(self):
+        registry = QueueTelemetryRegistry()
+        queue = Queue[int](maxsize=1)
+        queue.put(7)
+
+        write_items_to_queue = create_adaptive_queue_writer(
+            TIMEOUT_SECONDS_RANGE, timeout_factor=2, telemetry_registry=registry
+        )
+
+        attempts: list[bool] = []
+
+        def continuation_provider() -> bool:
+            attempts.append(True)
+            return len(attempts) < 4
+
+        write_items_to_queue(queue, continuation_provider, [90])
+
+        (writer_telemetry,) = registry.get_telemetry()
+
+        assert writer_telemetry.full_count == 3
+        assert writer_telemetry.items_moved == 0
+
+    def test_each_call_has_its_own_state(self):
+        registry = QueueTelemetryRegistry()
+        empty_queue = Queue[int]()
+        busy_queue = Queue[int]()
+
+        for item in range(10):
+            busy_queue.put(item)
+
+        read_items_from_queue = create_adaptive_queue_reader(
+            lambda _: None,
+            InclusiveRange(0.001, 1),
+            timeout_factor=2,
+            telemetry_registry=registry,
+        )
+
+        empty_checks: list[bool] = []
+
+        def keep_checking_empty_queue() -> bool:
+            empty_checks.append(True)
+            return len(empty_checks) < 5
+
+        empty_thread = Thread(
+            target=lambda: read_items_from_queue(empty_queue, keep_checking_empty_queue)
+        )
+        busy_thread = Thread(target=lambda: read_items_from_queue(busy_queue, lambda: False))
+
+        empty_thread.start()
+        empty_thread.join()
+
+        busy_thread.start()
+        busy_thread.join()
+
+        telemetry_by_queue = {
+            telemetry.queue_id: telemetry for telemetry in registry.get_telemetry()
+        }
+
+        assert telemetry_by_queue[id(empty_queue)].items_moved == 0
+        assert telemetry_by_queue[id(busy_queue)].items_moved == 10
+        assert telemetry_by_queue[id(empty_queue)].timeout_seconds == 0.032
+        assert telemetry_by_queue[id(busy_queue)].timeout_seconds == 0.002
+        assert telemetry_by_queue[id(empty_queue)].thread_name != (
+            telemetry_by_queue[id(busy_queue)].thread_name
+        )
+
+    def test_batch_reader_counts_items(self):
+        registry = QueueTelemetryRegistry()
+        queue = Queue[int]()
+
+        for item in range(5):
+            queue.put(item)
+
+        read_batches_from_queue = create_adaptive_queue_batch_reader(
+            lambda _: None,
+            TIMEOUT_SECONDS_RANGE,
+            timeout_factor=2,
+            max_batch_size=2,
+            telemetry_registry=registry,
+        )
+
+        read_batches_from_queue(queue, lambda: False)
+
+        (reader_telemetry,) = registry.get_telemetry()
+
+        assert reader_telemetry.agent_name == "batch reader"
+        assert reader_telemetry.items_moved == 5
+
+    def test_removing_ended_loops(self):
+        registry = QueueTelemetryRegistry()
+
+        read_items_from_queue = create_adaptive_queue_reader(
+            lambda _: None, TIMEOUT_SECONDS_RANGE, timeout_factor=2, telemetry_registry=registry
+        )
+
+        read_items_from_queue(Queue[int](), lambda: False)
+        assert len(registry.get_telemetry()) == 1
+
+        registry.remove_ended_loops()
+        assert registry.get_telemetry() == []
@@ -0,0 +1,163 @@
+from pytest import approx, raises
+
+from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.threading.queues.timeouts import (
+    BackoffTimeoutController,
+    EwmaTimeoutController,
+    MultiplicativeTimeoutController,
+    PidTimeoutController,
+)
+
+
+class TestMultiplicativeTimeoutController:
+    def test_initial_timeout(self):
+        controller = MultiplicativeTimeoutController(InclusiveRange(0.1, 10), 2)
+
+        assert controller.timeout_seconds == 0.1
+
+    def test_timeouts_and_completions(self):
+        controller = MultiplicativeTimeoutController(InclusiveRange(0.1, 10), 2)
+
+        controller.on_timed_out()
+        controller.on_timed_out()
+        assert controller.timeout_seconds == approx(0.4)
+
+        controller.on_completed(0.01)
+        assert controller.timeout_seconds == approx(0.2)
+
+    def test_range_is_respected(self):
+        controller = MultiplicativeTimeoutController(InclusiveRange(0.1, 1), 10)
+
+        controller.on_timed_out()
+        controller.on_timed_out()
+
+        assert controller.timeout_seconds == 1
+
+    def test_invalid_factor(self):
+        with raises(ValueError) as ex:
+            MultiplicativeTimeoutController(InclusiveRange(0.1, 1), 0.5)
+        assert ex.value.args == (0.5,)
+
+
+class TestEwmaTimeoutController:
+    def test_converging_to_the_observed_wait(self):
+        controller = EwmaTimeoutController(
+            InclusiveRange(0.01, 10), smoothing_factor=0.5, wait_multiplier=2
+        )
+
+        for _ in range(30):
+            controller.on_completed(0.5)
+
+        assert controller.timeout_seconds == approx(1)
+
+    def test_growing_on_timeouts(self):
+        controller = EwmaTimeoutController(InclusiveRange(0.01, 10))
+
+        previous_timeout_seconds = controller.timeout_seconds
+
+        for _ in range(5):
+            controller.on_timed_out()
+            assert controller.timeout_seconds > previous_timeout_seconds
+            previous_timeout_seconds = controller.timeout_seconds
+
+    def test_range_is_respected(self):
+        controller = EwmaTimeoutController(InclusiveRange(0.1, 1), smoothing_factor=1)
+
+        controller.on_completed(0)
+        assert controller.timeout_seconds == 0.1
+
+        controller.on_completed(90)
+        assert controller.timeout_seconds == 1
+
+    def test_invalid_smoothing_factor(self):
+        with raises(ValueError) as ex:
+            EwmaTimeoutController(InclusiveRange(0.1, 1), smoothing_factor=0)
+        assert ex.value.args == (0,)
+
+
+class TestBackoffTimeoutController:
+    def test_without_jitter(self):
+        controller = BackoffTimeoutController(
+            InclusiveRange(0.1, 10), backoff_factor=3, jitter_ratio=0
+        )
+
+        controller.on_timed_out()
+        controller.on_timed_out()
+        assert controller.timeout_seconds == approx(0.9)
+
+        controller.on_completed(0.2)
+        assert controller.timeout_seconds == 0.1
+
+    def test_with_jitter(self):
+        controller = BackoffTimeoutController(
+            InclusiveRange(0.1, 10), backoff_factor=2, jitter_ratio=0.5
+        )
+
+        for _ in range(3):
+            controller.on_timed_out()
+
+        for _ in range(100):
+            assert 0.4 <= controller.timeout_seconds <= 0.8
+
+    def test_invalid_jitter_ratio(self):
+        with raises(ValueError) as ex:
+            BackoffTimeoutController(InclusiveRange(0.1, 1), jitter_ratio=2)
+        assert ex.value.args == (2,)
+
+
+class TestPidTimeoutController:
+    def test_growing_on_timeouts(self):
+        controller = PidTimeoutController(InclusiveRange(0.01, 10))
+
+        for _ in range(10):
+            controller.on_timed_out()
+
+        assert controller.timeout_seconds > 0.1
+
+    def test_shrinking_on_completions(self):
+        controller = PidTimeoutController(InclusiveRange(0.01, 10))
+
+        for _ in range(10):
+            controller.on_timed_out()
+
+        grown_timeout_seconds = controller.timeout_seconds
+
+        for _ in range(10):
+            controller.on_completed(0)
+
+        assert controller.timeout_seconds < grown_timeout_seconds
+
+    def test_range_is_respected(self):
+        controller = PidTimeoutController(InclusiveRange(0.01, 1))
+
+        for _ in range(1_000):
+            controller.on_timed_out()
+        assert controller.timeout_seconds == 1
+
+        for _ in range(1_000):
+            controller.on_completed(0)
+        assert controller.timeout_seconds == approx(0.01)
+
+    def test_steady_state_at_target_ratio(self):
+        controller = PidTimeoutController(
+            InclusiveRange(0.01, 10), target_timeout_ratio=0.25, derivative_gain=0
+        )
+
+        for _ in range(100):
+            controller.on_timed_out()
+            for _ in range(3):
+                controller.on_completed(0)
+
+        timeout_seconds = controller.timeout_seconds
+
+        for _ in range(4):
+            controller.on_timed_out()
+            for _ in range(3):
+                controller.on_completed(0)
+
+        assert controller.timeout_seconds == approx(timeout_seconds)
+
+    def test_invalid_target_ratio(self):
+        with raises(ValueError) as ex:
+            PidTimeoutController(InclusiveRange(0.01, 1), target_timeout_ratio=1)
+        assert ex.value.args == (1,)
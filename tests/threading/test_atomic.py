@@ -1,8 +1,15 @@
 from functools import wraps
 from threading import Thread
 
+from pytest import raises
+
 from info.gianlucacosta.eos.core.functional import Consumer, Producer
-from info.gianlucacosta.eos.core.threading.atomic import Atomic
+from info.gianlucacosta.eos.core.threading.atomic import (
+    Atomic,
+    AtomicDict,
+    AtomicList,
+    AtomicReference,
+)
 
 
 class TestAtomicWithOneThread:
@@ -74,3 +81,127 @@ def test_map_then_get():
             atomic.map_then_get(lambda value: value + 1)
 
     return body
+
+
+class TestAtomicReference:
+    def test_get_and_set(self):
+        reference = AtomicReference((1, 2))
+        reference.set((3,))
+
+        assert reference.get() == (3,)
+
+    def test_compare_and_set_when_expected(self):
+        initial_value = (1, 2)
+        reference = AtomicReference(initial_value)
+
+        assert reference.compare_and_set(initial_value, (3,))
+        assert reference.get() == (3,)
+
+    def test_compare_and_set_compares_identity(self):
+        reference = AtomicReference([1, 2])
+
+        assert not reference.compare_and_set([1, 2], [3])
+        assert reference.get() == [1, 2]
+
+    def test_update(self):
+        reference = AtomicReference(frozenset({1}))
+
+        assert reference.update(lambda values: values | {2}) == frozenset({1, 2})
+
+    def test_update_from_many_threads(self):
+        reference = AtomicReference(0)
+
+        def increment_many_times():
+            for _ in range(1000):
+                reference.update(lambda value: value + 1)
+
+        threads = [Thread(target=increment_many_times) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert reference.get() == 8000
+
+
+class TestAtomicDict:
+    def test_reads(self):
+        atomic_dict = AtomicDict({"alpha": 1, "beta": 2})
+
+        assert atomic_dict["alpha"] == 1
+        assert atomic_dict.get("gamma") is None
+        assert atomic_dict.get("gamma", 90) == 90
+        assert "beta" in atomic_dict
+        assert len(atomic_dict) == 2
+        assert list(atomic_dict) == ["alpha", "beta"]
+
+    def test_writes(self):
+        atomic_dict = AtomicDict[str, int]()
+
+        atomic_dict["alpha"] = 1
+        atomic_dict.update({"beta": 2, "gamma": 3})
+        del atomic_dict["alpha"]
+
+        assert dict(atomic_dict.snapshot()) == {"beta": 2, "gamma": 3}
+
+        atomic_dict.clear()
+        assert len(atomic_dict) == 0
+
+    def test_snapshot_is_stable(self):
+        atomic_dict = AtomicDict({"alpha": 1})
+        snapshot = atomic_dict.snapshot()
+
+        atomic_dict["beta"] = 2
+
+        assert dict(snapshot) == {"alpha": 1}
+
+    def test_snapshot_is_read_only(self):
+        snapshot = AtomicDict({"alpha": 1}).snapshot()
+
+        with raises(TypeError):
+            snapshot["alpha"] = 2
+
+    def test_iterating_while_writing(self):
+        atomic_dict = AtomicDict({index: index for index in range(10)})
+
+        for key in atomic_dict:
+            atomic_dict[key + 100] = key
+
+        assert len(atomic_dict) == 20
+
+
+class TestAtomicList:
+    def test_reads(self):
+        atomic_list = AtomicList([1, 2, 3])
+
+        assert atomic_list[0] == 1
+        assert atomic_list[1:] == (2, 3)
+        assert 3 in atomic_list
+        assert len(atomic_list) == 3
+
+    def test_writes(self):
+        atomic_list = AtomicList[int]()
+
+        atomic_list.append(1)
+        atomic_list.extend([2, 3, 2])
+        atomic_list.remove(2)
+        atomic_list[0] = 90
+
+        assert atomic_list.snapshot() == (90, 3, 2)
+
+        atomic_list.clear()
+        assert atomic_list.snapshot() == ()
+
+    def test_removing_missing_item(self):
+        with raises(ValueError):
+            AtomicList([1]).remove(2)
+
+    def test_iterating_while_writing(self):
+        atomic_list = AtomicList([1, 2, 3])
+
+        for item in atomic_list:
+            atomic_list.append(item * 10)
+
+        assert atomic_list.snapshot() == (1, 2, 3, 10, 20, 30)
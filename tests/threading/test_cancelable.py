@@ -1,8 +1,11 @@
+from threading import Condition, Thread
+from time import sleep
 from typing import Callable, Optional
 
 from info.gianlucacosta.eos.core.threading.cancelable import (
     CancelableThread,
     CancelableThreadHandle,
+    CancelationToken,
 )
 
 
@@ -75,3 +78,53 @@ def test_canceling_via_handle():
 
     assert counter == 50
     assert not thread.never_canceled
+
+
+def test_cancelation_token_as_continuation_provider():
+    token = CancelationToken()
+
+    assert token()
+    assert not token.canceled
+
+    token.cancel()
+
+    assert not token()
+    assert token.canceled
+
+
+def test_cancelation_token_wait():
+    token = CancelationToken()
+
+    assert not token.wait(0.01)
+
+    Thread(target=lambda: (sleep(0.05), token.cancel())).start()
+
+    assert token.wait(5)
+
+
+def test_cancelation_token_wakes_watched_condition():
+    token = CancelationToken()
+    condition = Condition()
+
+    def cancel_later():
+        sleep(0.05)
+        token.cancel()
+
+    Thread(target=cancel_later).start()
+
+    with token.watching(condition):
+        with condition:
+            assert condition.wait_for(lambda: token.canceled, timeout=5)
+
+
+def test_request_cancel_cancels_the_token():
+    thread = CancelableTestThread(lambda _: True)
+
+    assert not thread.cancelation_token.canceled
+
+    thread.start()
+    CancelableThreadHandle(thread).request_cancel()
+    thread.join()
+
+    assert thread.cancelation_token.canceled
+    assert not thread.never_canceled
@@ -0,0 +1,188 @@
+from threading import Thread
+from time import sleep
+
+from pytest import raises
+
+from info.gianlucacosta.eos.core.logic.ranges import InclusiveRange
+from info.gianlucacosta.eos.core.threading.limiters import (
+    AdaptiveConcurrencyLimiter,
+    FixedConcurrencyLimiter,
+    WeightBudget,
+)
+
+
+class TestFixedConcurrencyLimiter:
+    def test_acquire_within_limit(self):
+        limiter = FixedConcurrencyLimiter(2)
+
+        assert limiter.acquire()
+        assert limiter.acquire()
+        assert limiter.in_flight == 2
+
+    def test_acquire_beyond_limit_with_timeout(self):
+        limiter = FixedConcurrencyLimiter(1)
+        limiter.acquire()
+
+        assert not limiter.acquire(timeout_seconds=0.01)
+        assert not limiter.acquire(timeout_seconds=0)
+        assert limiter.in_flight == 1
+
+    def test_release_unblocks_waiting_thread(self):
+        limiter = FixedConcurrencyLimiter(1)
+        limiter.acquire()
+
+        def release_later():
+            sleep(0.05)
+            limiter.release(0.05)
+
+        releasing_thread = Thread(target=release_later)
+        releasing_thread.start()
+
+        assert limiter.acquire(timeout_seconds=2)
+
+        releasing_thread.join()
+
+    def test_with_invalid_limit(self):
+        with raises(ValueError) as ex:
+            FixedConcurrencyLimiter(0)
+
+        assert ex.value.args == (0,)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_initial_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(InclusiveRange(2, 10))
+
+        assert limiter.limit == 2
+
+    def test_limit_grows_while_latency_is_stable(self):
+        limiter = AdaptiveConcurrencyLimiter(InclusiveRange(1, 8))
+
+        for _ in range(100):
+            while limiter.acquire(timeout_seconds=0):
+                pass
+
+            for _ in range(limiter.in_flight):
+                limiter.release(0.01)
+
+        assert limiter.limit == 8
+
+    def test_limit_shrinks_when_latency_grows(self):
+        limiter = AdaptiveConcurrencyLimiter(InclusiveRange(1, 20), initial_limit=20)
+
+        limiter.acquire()
+        limiter.release(0.01)
+
+        for _ in range(200):
+            limiter.acquire()
+            limiter.release(0.1)
+
+        assert limiter.limit < 20
+
+    def test_limit_shrinks_upon_failures(self):
+        limiter = AdaptiveConcurrencyLimiter(InclusiveRange(1, 20), initial_limit=20)
+
+        for _ in range(200):
+            limiter.acquire()
+            limiter.release(0.01, succeeded=False)
+
+        assert limiter.limit == 1
+
+    def test_baseline_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(InclusiveRange(1, 4), baseline_window_size=2)
+
+        assert limiter.baseline_latency is None
+
+        for latency in [0.5, 0.2, 0.4, 0.3]:
+            limiter.acquire()
+            limiter.release(latency)
+
+        assert limiter.baseline_latency == 0.3
+
+    def test_with_invalid_lower_limit(self):
+        with raises(ValueError) as ex:
+            AdaptiveConcurrencyLimiter(InclusiveRange(0, 4))
+
+        assert ex.value.args == (0,)
+
+    def test_with_invalid_decrease_factor(self):
+        with raises(ValueError) as ex:
+            AdaptiveConcurrencyLimiter(InclusiveRange(1, 4), decrease_factor=1.5)
+
+        assert ex.value.args == (1.5,)
+
+
+class TestWeightBudget:
+    def test_acquire_within_capacity(self):
+        budget = WeightBudget(10)
+
+        assert budget.acquire(4)
+        assert budget.acquire(6)
+        assert budget.in_use == 10
+
+    def test_acquire_beyond_capacity_with_timeout(self):
+        budget = WeightBudget(10)
+        budget.acquire(6)
+
+        assert not budget.acquire(5, timeout_seconds=0.01)
+        assert not budget.acquire(5, timeout_seconds=0)
+        assert budget.in_use == 6
+
+    def test_oversized_weight_when_empty(self):
+        budget = WeightBudget(10)
+
+        assert budget.acquire(25, timeout_seconds=0)
+        assert not budget.acquire(1, timeout_seconds=0)
+
+        budget.release(25)
+        assert budget.in_use == 0
+
+    def test_release_unblocks_waiting_thread(self):
+        budget = WeightBudget(10)
+        budget.acquire(8)
+
+        def release_later():
+            sleep(0.05)
+            budget.release(8)
+
+        releasing_thread = Thread(target=release_later)
+        releasing_thread.start()
+
+        assert budget.acquire(8, timeout_seconds=2)
+
+        releasing_thread.join()
+
+    def test_light_request_cannot_overtake_waiting_heavy_one(self):
+        budget = WeightBudget(10)
+        budget.acquire(8)
+
+        heavy_acquired = []
+        heavy_thread = Thread(
+            target=lambda: heavy_acquired.append(budget.acquire(25, timeout_seconds=2))
+        )
+        heavy_thread.start()
+        sleep(0.05)
+
+        assert not budget.acquire(1, timeout_seconds=0.05)
+
+        budget.release(8)
+        heavy_thread.join()
+
+        assert heavy_acquired == [True]
+        assert budget.in_use == 25
+        assert not budget.acquire(1, timeout_seconds=0)
+
+        budget.release(25)
+        assert budget.acquire(1, timeout_seconds=0)
+
+    def test_with_invalid_capacity(self):
+        with raises(ValueError) as ex:
+            WeightBudget(0)
+
+        assert ex.value.args == (0,)
+
+    def test_with_negative_weight(self):
+        with raises(ValueError) as ex:
+            WeightBudget(10).acquire(-1)
+
+        assert ex.value.args == (-1,)
@@ -0,0 +1,104 @@
+from threading import Thread
+
+from info.gianlucacosta.eos.core.threading.striped import (
+    StripedAccumulator,
+    StripedCounter,
+    StripedMaxAccumulator,
+    StripedMinAccumulator,
+)
+
+
+def run_in_threads(thread_count: int, target) -> None:
+    threads = [Thread(target=target, args=(index,)) for index in range(thread_count)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+
+class TestStripedCounter:
+    def test_initial_value(self):
+        assert StripedCounter().sum() == 0
+
+    def test_with_one_thread(self):
+        counter = StripedCounter()
+
+        counter.increment()
+        counter.increment(90)
+        counter.decrement(3)
+
+        assert counter.sum() == 88
+
+    def test_with_many_threads(self):
+        counter = StripedCounter()
+
+        def increment_many_times(_: int) -> None:
+            for _ in range(10_000):
+                counter.increment()
+
+        run_in_threads(8, increment_many_times)
+
+        assert counter.sum() == 80_000
+
+    def test_cells_of_ended_threads_are_kept(self):
+        counter = StripedCounter()
+
+        run_in_threads(3, lambda index: counter.increment(index))
+        counter.increment(10)
+
+        assert counter.sum() == 0 + 1 + 2 + 10
+
+    def test_cells_of_ended_threads_are_folded(self):
+        counter = StripedCounter()
+        counter.increment(10)
+
+        for _ in range(20):
+            run_in_threads(25, lambda index: counter.increment(index))
+
+        assert counter.sum() == 10 + 20 * sum(range(25))
+        assert counter.cell_count == 1
+
+
+class TestStripedMaxAccumulator:
+    def test_initial_value(self):
+        assert StripedMaxAccumulator().get() == float("-inf")
+
+    def test_with_many_threads(self):
+        accumulator = StripedMaxAccumulator()
+
+        def accumulate(index: int) -> None:
+            for value in range(index * 100, index * 100 + 50):
+                accumulator.accumulate(value)
+
+        run_in_threads(5, accumulate)
+
+        assert accumulator.get() == 449
+
+
+class TestStripedMinAccumulator:
+    def test_with_many_threads(self):
+        accumulator = StripedMinAccumulator()
+
+        run_in_threads(5, lambda index: accumulator.accumulate(10 - index))
+
+        assert accumulator.get() == 6
+
+    def test_with_custom_identity(self):
+        accumulator = StripedMinAccumulator(identity=0)
+
+        accumulator.accumulate(5)
+
+        assert accumulator.get() == 0
+
+
+class TestStripedAccumulator:
+    def test_with_custom_function(self):
+        accumulator = StripedAccumulator[frozenset[str]](
+            lambda left, right: left | right, frozenset()
+        )
+
+        run_in_threads(3, lambda index: accumulator.accumulate(frozenset({str(index)})))
+
+        assert accumulator.get() == frozenset({"0", "1", "2"})